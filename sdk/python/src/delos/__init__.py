@@ -1,7 +1,23 @@
 """Delos SDK - Python client for Delos LLM Infrastructure Platform."""
 
-from delos.client import DelosClient
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+from delos import _protobuf  # noqa: F401  (must run before protobuf is imported)
 from delos.config import DelosConfig
 
+if TYPE_CHECKING:
+    from delos.client import AsyncDelosClient, DelosClient
+
 __version__ = "0.1.0"
-__all__ = ["DelosClient", "DelosConfig"]
+__all__ = ["AsyncDelosClient", "DelosClient", "DelosConfig"]
+
+
+def __getattr__(name: str) -> Any:
+    """Import the client lazily so ``import delos`` stays cheap."""
+    if name in ("AsyncDelosClient", "DelosClient"):
+        from delos import client
+
+        return getattr(client, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -0,0 +1,197 @@
+"""Process-wide cache of gRPC channels shared between clients."""
+
+from __future__ import annotations
+
+import asyncio
+import threading
+import weakref
+from typing import TYPE_CHECKING, Any
+
+import grpc
+import grpc.experimental
+
+if TYPE_CHECKING:
+    from delos.config import ServiceEndpoint
+
+ChannelOptions = tuple[tuple[str, Any], ...]
+
+_ChannelKey = tuple["ServiceEndpoint", ChannelOptions]
+
+# Options applied to every channel. Keepalive pings stop NATs and load
+# balancers from silently dropping idle connections; the servers permit pings
+# every 20s without active calls. Message limits match the servers' 16MB;
+# HTTP/2 BDP probing, which sizes flow-control windows, is on by default.
+DEFAULT_CHANNEL_OPTIONS: ChannelOptions = (
+    ("grpc.keepalive_time_ms", 30_000),
+    ("grpc.keepalive_timeout_ms", 10_000),
+    ("grpc.keepalive_permit_without_calls", 1),
+    ("grpc.http2.max_pings_without_data", 0),
+    ("grpc.max_send_message_length", 16 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 16 * 1024 * 1024),
+)
+
+DEFAULT_COMPRESSION = grpc.Compression.Gzip
+
+# Options for sync channels only. Unary-stream calls (runtime CompleteStream)
+# read each response on the iterating thread instead of having it handed over
+# by the channel's polling thread. Their iterators then only support
+# iteration, cancel() and the non-blocking Future methods.
+_SYNC_CHANNEL_OPTIONS: ChannelOptions = (
+    (grpc.experimental.ChannelOptions.SingleThreadedUnaryStream, 1),
+)
+
+
+def _merge_options(defaults: ChannelOptions, endpoint: ServiceEndpoint) -> ChannelOptions:
+    """Apply an endpoint's channel options on top of the defaults."""
+    if not endpoint.channel_options:
+        return defaults
+    merged = dict(defaults)
+    merged.update(endpoint.channel_options)
+    return tuple(merged.items())
+
+
+def _create_channel(endpoint: ServiceEndpoint, options: ChannelOptions) -> grpc.Channel:
+    """Create a new gRPC channel for the endpoint."""
+    defaults = DEFAULT_CHANNEL_OPTIONS + _SYNC_CHANNEL_OPTIONS
+    options = _merge_options(defaults, endpoint) + options
+    if endpoint.use_tls:
+        credentials = grpc.ssl_channel_credentials()
+        return grpc.secure_channel(
+            endpoint.address, credentials, options=options, compression=DEFAULT_COMPRESSION
+        )
+    return grpc.insecure_channel(endpoint.address, options=options, compression=DEFAULT_COMPRESSION)
+
+
+def _create_aio_channel(endpoint: ServiceEndpoint, options: ChannelOptions) -> grpc.aio.Channel:
+    """Create a new asyncio gRPC channel for the endpoint."""
+    options = _merge_options(DEFAULT_CHANNEL_OPTIONS, endpoint) + options
+    if endpoint.use_tls:
+        credentials = grpc.ssl_channel_credentials()
+        return grpc.aio.secure_channel(
+            endpoint.address, credentials, options=options, compression=DEFAULT_COMPRESSION
+        )
+    return grpc.aio.insecure_channel(
+        endpoint.address, options=options, compression=DEFAULT_COMPRESSION
+    )
+
+
+class ChannelCache:
+    """Reference-counted cache of gRPC channels.
+
+    Channels are keyed by ``(endpoint, options)`` so that every client
+    talking to the same endpoint shares a single HTTP/2 connection. A channel
+    is closed once the last client holding it releases it.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._lock = threading.Lock()
+        self._entries: dict[_ChannelKey, tuple[grpc.Channel, int]] = {}
+
+    def acquire(self, endpoint: ServiceEndpoint, options: ChannelOptions = ()) -> grpc.Channel:
+        """Get the shared channel for an endpoint, creating it if needed."""
+        key = (endpoint, options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                channel = _create_channel(endpoint, options)
+                refs = 0
+            else:
+                channel, refs = entry
+            self._entries[key] = (channel, refs + 1)
+            return channel
+
+    def release(self, endpoint: ServiceEndpoint, options: ChannelOptions = ()) -> None:
+        """Release a channel obtained from :meth:`acquire`."""
+        key = (endpoint, options)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return
+            channel, refs = entry
+            if refs > 1:
+                self._entries[key] = (channel, refs - 1)
+                return
+            del self._entries[key]
+        channel.close()
+
+    def clear(self) -> None:
+        """Close and forget every cached channel."""
+        with self._lock:
+            entries = list(self._entries.values())
+            self._entries.clear()
+        for channel, _ in entries:
+            channel.close()
+
+
+class AsyncChannelCache:
+    """Reference-counted cache of ``grpc.aio`` channels.
+
+    An aio channel is bound to the event loop it was created on, so channels
+    are cached per running loop. A loop's entry is dropped when its last
+    channel is released, or when the loop is collected.
+    """
+
+    def __init__(self) -> None:
+        """Initialize an empty cache."""
+        self._lock = threading.Lock()
+        self._loops: weakref.WeakKeyDictionary[
+            asyncio.AbstractEventLoop, dict[_ChannelKey, tuple[grpc.aio.Channel, int]]
+        ] = weakref.WeakKeyDictionary()
+
+    def acquire(self, endpoint: ServiceEndpoint, options: ChannelOptions = ()) -> grpc.aio.Channel:
+        """Get the shared channel for an endpoint on the running loop."""
+        loop = asyncio.get_running_loop()
+        key = (endpoint, options)
+        with self._lock:
+            entries = self._loops.setdefault(loop, {})
+            entry = entries.get(key)
+            if entry is None:
+                channel = _create_aio_channel(endpoint, options)
+                refs = 0
+            else:
+                channel, refs = entry
+            entries[key] = (channel, refs + 1)
+            return channel
+
+    async def release(self, endpoint: ServiceEndpoint, options: ChannelOptions = ()) -> None:
+        """Release a channel obtained from :meth:`acquire`."""
+        loop = asyncio.get_running_loop()
+        key = (endpoint, options)
+        with self._lock:
+            entries = self._loops.get(loop)
+            entry = entries.get(key) if entries is not None else None
+            if entry is None:
+                return
+            channel, refs = entry
+            if refs > 1:
+                entries[key] = (channel, refs - 1)
+                return
+            del entries[key]
+            if not entries:
+                del self._loops[loop]
+        await channel.close()
+
+
+_cache = ChannelCache()
+_aio_cache = AsyncChannelCache()
+
+
+def get_channel(endpoint: ServiceEndpoint, options: ChannelOptions = ()) -> grpc.Channel:
+    """Get a shared channel for the endpoint from the process-wide cache."""
+    return _cache.acquire(endpoint, options)
+
+
+def release_channel(endpoint: ServiceEndpoint, options: ChannelOptions = ()) -> None:
+    """Release a channel obtained from :func:`get_channel`."""
+    _cache.release(endpoint, options)
+
+
+def get_aio_channel(endpoint: ServiceEndpoint, options: ChannelOptions = ()) -> grpc.aio.Channel:
+    """Get a shared aio channel for the endpoint on the running event loop."""
+    return _aio_cache.acquire(endpoint, options)
+
+
+async def release_aio_channel(endpoint: ServiceEndpoint, options: ChannelOptions = ()) -> None:
+    """Release a channel obtained from :func:`get_aio_channel`."""
+    await _aio_cache.release(endpoint, options)
@@ -0,0 +1,30 @@
+"""JSON codecs for SDK models.
+
+Decoding goes through a cached pydantic-core validator specialised to the
+target type, which parses JSON bytes straight into models without building
+an intermediate ``dict`` first.
+
+Example:
+    >>> spans = decode_json(list[Span], raw_bytes)
+    >>> raw_bytes = encode_json(spans)
+"""
+
+from __future__ import annotations
+
+from typing import Any, TypeVar
+
+import pydantic_core
+
+from delos.models._base import type_adapter
+
+T = TypeVar("T")
+
+
+def decode_json(tp: type[T], data: bytes | str) -> T:
+    """Decode JSON into an instance of ``tp`` (a model or e.g. ``list[Model]``)."""
+    return type_adapter(tp).validate_json(data)
+
+
+def encode_json(value: Any) -> bytes:
+    """Encode a model, or a container of models, as JSON bytes."""
+    return pydantic_core.to_json(value)
@@ -0,0 +1,6 @@
+"""Generated protobuf and gRPC code for the Delos services.
+
+The modules are written here by ``make proto`` (one ``<service>/v1``
+package per service) and shipped inside the wheel, so they import as
+``delos._gen.<service>.v1`` without any ``sys.path`` changes.
+"""
@@ -0,0 +1,89 @@
+"""Minimal client for the standard gRPC health checking protocol.
+
+Delos servers register ``grpc.health.v1.Health``. The request and response
+messages are tiny, so they are encoded by hand rather than depending on the
+``grpcio-health-checking`` package.
+"""
+
+from __future__ import annotations
+
+import grpc
+
+CHECK_METHOD = "/grpc.health.v1.Health/Check"
+
+# HealthCheckResponse.ServingStatus.SERVING
+SERVING = 1
+
+
+def _encode_varint(value: int) -> bytes:
+    """Encode a non-negative integer as a protobuf varint."""
+    out = bytearray()
+    while value > 0x7F:
+        out.append((value & 0x7F) | 0x80)
+        value >>= 7
+    out.append(value)
+    return bytes(out)
+
+
+def _decode_varint(data: bytes, pos: int) -> tuple[int, int]:
+    """Decode a protobuf varint, returning the value and the next position."""
+    result = 0
+    shift = 0
+    while True:
+        byte = data[pos]
+        pos += 1
+        result |= (byte & 0x7F) << shift
+        if not byte & 0x80:
+            return result, pos
+        shift += 7
+
+
+def serialize_request(service: str) -> bytes:
+    """Encode a HealthCheckRequest for the given service name."""
+    if not service:
+        return b""
+    encoded = service.encode()
+    return b"\x0a" + _encode_varint(len(encoded)) + encoded
+
+
+def deserialize_status(data: bytes) -> int:
+    """Decode the serving status from a HealthCheckResponse."""
+    status = 0
+    pos = 0
+    while pos < len(data):
+        tag, pos = _decode_varint(data, pos)
+        wire_type = tag & 0x7
+        if wire_type == 0:
+            value, pos = _decode_varint(data, pos)
+            if tag >> 3 == 1:
+                status = value
+        elif wire_type == 2:
+            length, pos = _decode_varint(data, pos)
+            pos += length
+        elif wire_type == 1:
+            pos += 8
+        elif wire_type == 5:
+            pos += 4
+        else:
+            raise ValueError(f"unsupported wire type {wire_type} in health response")
+    return status
+
+
+def check_future(channel: grpc.Channel, timeout: float, service: str = "") -> grpc.Future:
+    """Start a health check on a channel and return its future status."""
+    method = channel.unary_unary(
+        CHECK_METHOD,
+        request_serializer=serialize_request,
+        response_deserializer=deserialize_status,
+    )
+    return method.future(service, timeout=timeout)
+
+
+async def check_async(channel: grpc.aio.Channel, timeout: float, service: str = "") -> bool:
+    """Check whether the server behind an aio channel is serving."""
+    method = channel.unary_unary(
+        CHECK_METHOD,
+        request_serializer=serialize_request,
+        response_deserializer=deserialize_status,
+    )
+    return await method(service, timeout=timeout) == SERVING
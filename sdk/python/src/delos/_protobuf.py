@@ -0,0 +1,32 @@
+"""Protobuf runtime selection.
+
+Imported by the package ``__init__`` so that it runs before ``google.protobuf``
+or any generated ``*_pb2`` module is loaded; the backend cannot be changed
+once protobuf has been imported.
+"""
+
+from __future__ import annotations
+
+import os
+import warnings
+
+_ENV_VAR = "PROTOCOL_BUFFERS_PYTHON_IMPLEMENTATION"
+
+_requested = os.environ.get(_ENV_VAR)
+
+# Message conversion in the service clients is dominated by protobuf field
+# access, which the upb backend performs in C. Request it unless the user has
+# chosen a backend; protobuf warns and falls back to pure Python if the
+# installed wheel does not ship it.
+os.environ.setdefault(_ENV_VAR, "upb")
+
+from google.protobuf.internal import api_implementation  # noqa: E402
+
+if api_implementation.Type() == "python" and _requested != "python":
+    warnings.warn(
+        "protobuf is using its pure-Python backend, which makes Delos SDK "
+        "responses many times slower to convert. Install a protobuf wheel that "
+        "ships the upb extension (protobuf>=4.25 on a supported platform).",
+        RuntimeWarning,
+        stacklevel=2,
+    )
@@ -2,13 +2,30 @@
 
 from __future__ import annotations
 
-from delos.config import DelosConfig
-from delos.services.datasets import DatasetsClient
-from delos.services.deploy import DeployClient
-from delos.services.eval import EvalClient
-from delos.services.observe import ObserveClient
-from delos.services.prompt import PromptClient
-from delos.services.runtime import RuntimeClient
+import asyncio
+from functools import cached_property
+from typing import TYPE_CHECKING
+
+import grpc
+
+from delos._channel_cache import (
+    get_aio_channel,
+    get_channel,
+    release_aio_channel,
+    release_channel,
+)
+from delos._health import SERVING, check_async, check_future
+from delos.config import DelosConfig, ServiceEndpoint
+
+if TYPE_CHECKING:
+    from delos.services.datasets import DatasetsClient
+    from delos.services.deploy import DeployClient
+    from delos.services.eval import AsyncEvalClient, EvalClient
+    from delos.services.observe import AsyncObserveClient, ObserveClient
+    from delos.services.prompt import AsyncPromptClient, PromptClient
+    from delos.services.runtime import AsyncRuntimeClient, RuntimeClient
+
+ServiceEndpoints = tuple[tuple[str, ServiceEndpoint], ...]
 
 
 class DelosClient:
@@ -52,6 +69,7 @@ class DelosClient:
         self._datasets: DatasetsClient | None = None
         self._eval: EvalClient | None = None
         self._deploy: DeployClient | None = None
+        self._health_channels: list[grpc.Channel] | None = None
 
     @property
     def config(self) -> DelosConfig:
@@ -62,9 +80,12 @@ class DelosClient:
     def observe(self) -> ObserveClient:
         """Get the observe service client."""
         if self._observe is None:
+            from delos.services.observe import ObserveClient
+
             self._observe = ObserveClient(
                 self._config.observe,
                 timeout=self._config.timeout,
+                pool_size=self._config.channel_pool_size,
             )
         return self._observe
 
@@ -72,9 +93,13 @@ class DelosClient:
     def runtime(self) -> RuntimeClient:
         """Get the runtime service client."""
         if self._runtime is None:
+            from delos.services.runtime import RuntimeClient
+
             self._runtime = RuntimeClient(
                 self._config.runtime,
                 timeout=self._config.timeout,
+                pool_size=self._config.channel_pool_size,
+                catalog_ttl=self._config.catalog_ttl,
             )
         return self._runtime
 
@@ -82,9 +107,12 @@ class DelosClient:
     def prompts(self) -> PromptClient:
         """Get the prompt service client."""
         if self._prompts is None:
+            from delos.services.prompt import PromptClient
+
             self._prompts = PromptClient(
                 self._config.prompt,
                 timeout=self._config.timeout,
+                pool_size=self._config.channel_pool_size,
             )
         return self._prompts
 
@@ -92,9 +120,12 @@ class DelosClient:
     def datasets(self) -> DatasetsClient:
         """Get the datasets service client."""
         if self._datasets is None:
+            from delos.services.datasets import DatasetsClient
+
             self._datasets = DatasetsClient(
                 self._config.datasets,
                 timeout=self._config.timeout,
+                pool_size=self._config.channel_pool_size,
             )
         return self._datasets
 
@@ -102,9 +133,12 @@ class DelosClient:
     def eval(self) -> EvalClient:
         """Get the eval service client."""
         if self._eval is None:
+            from delos.services.eval import EvalClient
+
             self._eval = EvalClient(
                 self._config.eval,
                 timeout=self._config.timeout,
+                pool_size=self._config.channel_pool_size,
             )
         return self._eval
 
@@ -112,9 +146,12 @@ class DelosClient:
     def deploy(self) -> DeployClient:
         """Get the deploy service client."""
         if self._deploy is None:
+            from delos.services.deploy import DeployClient
+
             self._deploy = DeployClient(
                 self._config.deploy,
                 timeout=self._config.timeout,
+                pool_size=self._config.channel_pool_size,
             )
         return self._deploy
 
@@ -138,8 +175,12 @@ class DelosClient:
         if self._deploy is not None:
             self._deploy.close()
             self._deploy = None
+        if self._health_channels is not None:
+            for _, endpoint in self._service_endpoints:
+                release_channel(endpoint)
+            self._health_channels = None
 
-    def __enter__(self) -> "DelosClient":
+    def __enter__(self) -> DelosClient:
         """Context manager entry."""
         return self
 
@@ -147,38 +188,191 @@ class DelosClient:
         """Context manager exit."""
         self.close()
 
+    @cached_property
+    def _service_endpoints(self) -> ServiceEndpoints:
+        """(service name, endpoint) pairs, built once per client."""
+        return _endpoints_for(self._config)
+
     def health_check(self) -> dict[str, bool]:
         """Check health of all services.
 
+        Sends a ``grpc.health.v1.Health/Check`` RPC to every service
+        concurrently over cached channels, so the call takes at most
+        ``config.connect_timeout`` seconds. Use :meth:`async_health_check`
+        from code that is already running an event loop.
+
         Returns:
             Dictionary mapping service name to health status.
         """
-        results = {}
-
-        services = [
-            ("observe", self._config.observe),
-            ("runtime", self._config.runtime),
-            ("prompt", self._config.prompt),
-            ("datasets", self._config.datasets),
-            ("eval", self._config.eval),
-            ("deploy", self._config.deploy),
-        ]
-
-        for name, endpoint in services:
-            try:
-                # Try to connect and check health
-                # This is a simple connectivity check
-                import grpc
-
-                channel = grpc.insecure_channel(endpoint.address)
-                try:
-                    grpc.channel_ready_future(channel).result(timeout=2)
-                    results[name] = True
-                except grpc.FutureTimeoutError:
-                    results[name] = False
-                finally:
-                    channel.close()
-            except Exception:
-                results[name] = False
-
-        return results
+        services = self._service_endpoints
+        if self._health_channels is None:
+            self._health_channels = [get_channel(endpoint) for _, endpoint in services]
+
+        timeout = self._config.connect_timeout
+        futures = [check_future(channel, timeout) for channel in self._health_channels]
+        return {name: _is_serving(future) for (name, _), future in zip(services, futures)}
+
+    async def async_health_check(self) -> dict[str, bool]:
+        """Check health of all services concurrently.
+
+        Returns:
+            Dictionary mapping service name to health status.
+        """
+        return await _check_health_async(self._service_endpoints, self._config.connect_timeout)
+
+
+class AsyncDelosClient:
+    """Asyncio client for the Delos platform.
+
+    Uses ``grpc.aio`` so that many RPCs can be in flight on a single event
+    loop. Create and use it from within a running loop.
+
+    Example:
+        >>> from delos import AsyncDelosClient
+        >>>
+        >>> async def main() -> None:
+        ...     async with AsyncDelosClient() as client:
+        ...         status = await client.health_check()
+        ...         runs, total = await client.eval.list_runs(limit=10)
+    """
+
+    def __init__(self, config: DelosConfig | None = None) -> None:
+        """Initialize the async Delos client.
+
+        Args:
+            config: Configuration for connecting to services.
+                    If not provided, uses default configuration.
+        """
+        self._config = config or DelosConfig()
+        self._observe: AsyncObserveClient | None = None
+        self._runtime: AsyncRuntimeClient | None = None
+        self._prompts: AsyncPromptClient | None = None
+        self._eval: AsyncEvalClient | None = None
+
+    @property
+    def config(self) -> DelosConfig:
+        """Get the client configuration."""
+        return self._config
+
+    @property
+    def observe(self) -> AsyncObserveClient:
+        """Get the async observe service client."""
+        if self._observe is None:
+            from delos.services.observe import AsyncObserveClient
+
+            self._observe = AsyncObserveClient(
+                self._config.observe,
+                timeout=self._config.timeout,
+                pool_size=self._config.channel_pool_size,
+            )
+        return self._observe
+
+    @property
+    def runtime(self) -> AsyncRuntimeClient:
+        """Get the async runtime service client."""
+        if self._runtime is None:
+            from delos.services.runtime import AsyncRuntimeClient
+
+            self._runtime = AsyncRuntimeClient(
+                self._config.runtime,
+                timeout=self._config.timeout,
+                pool_size=self._config.channel_pool_size,
+                catalog_ttl=self._config.catalog_ttl,
+            )
+        return self._runtime
+
+    @property
+    def prompts(self) -> AsyncPromptClient:
+        """Get the async prompt service client."""
+        if self._prompts is None:
+            from delos.services.prompt import AsyncPromptClient
+
+            self._prompts = AsyncPromptClient(
+                self._config.prompt,
+                timeout=self._config.timeout,
+                pool_size=self._config.channel_pool_size,
+            )
+        return self._prompts
+
+    @property
+    def eval(self) -> AsyncEvalClient:
+        """Get the async eval service client."""
+        if self._eval is None:
+            from delos.services.eval import AsyncEvalClient
+
+            self._eval = AsyncEvalClient(
+                self._config.eval,
+                timeout=self._config.timeout,
+                pool_size=self._config.channel_pool_size,
+            )
+        return self._eval
+
+    async def close(self) -> None:
+        """Close all service connections."""
+        if self._observe is not None:
+            await self._observe.close()
+            self._observe = None
+        if self._runtime is not None:
+            await self._runtime.close()
+            self._runtime = None
+        if self._prompts is not None:
+            await self._prompts.close()
+            self._prompts = None
+        if self._eval is not None:
+            await self._eval.close()
+            self._eval = None
+
+    async def __aenter__(self) -> AsyncDelosClient:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit."""
+        await self.close()
+
+    @cached_property
+    def _service_endpoints(self) -> ServiceEndpoints:
+        """(service name, endpoint) pairs, built once per client."""
+        return _endpoints_for(self._config)
+
+    async def health_check(self) -> dict[str, bool]:
+        """Check health of all services concurrently.
+
+        Returns:
+            Dictionary mapping service name to health status.
+        """
+        return await _check_health_async(self._service_endpoints, self._config.connect_timeout)
+
+
+def _endpoints_for(config: DelosConfig) -> ServiceEndpoints:
+    """Return (service name, endpoint) pairs for every service."""
+    return (
+        ("observe", config.observe),
+        ("runtime", config.runtime),
+        ("prompt", config.prompt),
+        ("datasets", config.datasets),
+        ("eval", config.eval),
+        ("deploy", config.deploy),
+    )
+
+
+def _is_serving(future: grpc.Future) -> bool:
+    """Resolve a health check future to whether the service is serving."""
+    try:
+        return future.result() == SERVING
+    except grpc.RpcError:
+        return False
+
+
+async def _check_health_async(services: ServiceEndpoints, timeout: float) -> dict[str, bool]:
+    """Health check every service concurrently on the running loop."""
+    channels = [get_aio_channel(endpoint) for _, endpoint in services]
+    try:
+        results = await asyncio.gather(
+            *(check_async(channel, timeout) for channel in channels),
+            return_exceptions=True,
+        )
+    finally:
+        for _, endpoint in services:
+            await release_aio_channel(endpoint)
+    return {name: result is True for (name, _), result in zip(services, results)}
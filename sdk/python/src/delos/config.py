@@ -4,9 +4,10 @@ from __future__ import annotations
 
 import os
 from dataclasses import dataclass, field
+from typing import Any
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class ServiceEndpoint:
     """Configuration for a single service endpoint."""
 
@@ -14,13 +15,78 @@ class ServiceEndpoint:
     port: int = 9000
     use_tls: bool = False
 
-    @property
-    def address(self) -> str:
-        """Return the full address string."""
-        return f"{self.host}:{self.port}"
-
-
-@dataclass
+    # Channels to pool for this service, overriding DelosConfig.channel_pool_size.
+    # Not part of equality, so clients with different pool sizes still share
+    # the endpoint's primary channel.
+    channel_pool_size: int | None = field(default=None, compare=False)
+
+    # Extra gRPC channel arguments, e.g. (("grpc.max_receive_message_length", n),),
+    # overriding the SDK defaults of the same name. Part of equality, so
+    # endpoints tuned differently get separate channels.
+    channel_options: tuple[tuple[str, Any], ...] = ()
+
+    # Full "host:port" address string, derived from host and port.
+    address: str = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self) -> None:
+        """Precompute the address string."""
+        object.__setattr__(self, "address", f"{self.host}:{self.port}")
+
+
+# (config field, host, port and channel pool size variables, default port) per service.
+_SERVICE_ENV = (
+    (
+        "observe",
+        "DELOS_OBSERVE_HOST",
+        "DELOS_OBSERVE_PORT",
+        "DELOS_OBSERVE_CHANNEL_POOL_SIZE",
+        9000,
+    ),
+    (
+        "runtime",
+        "DELOS_RUNTIME_HOST",
+        "DELOS_RUNTIME_PORT",
+        "DELOS_RUNTIME_CHANNEL_POOL_SIZE",
+        9001,
+    ),
+    (
+        "prompt",
+        "DELOS_PROMPT_HOST",
+        "DELOS_PROMPT_PORT",
+        "DELOS_PROMPT_CHANNEL_POOL_SIZE",
+        9002,
+    ),
+    (
+        "datasets",
+        "DELOS_DATASETS_HOST",
+        "DELOS_DATASETS_PORT",
+        "DELOS_DATASETS_CHANNEL_POOL_SIZE",
+        9003,
+    ),
+    (
+        "eval",
+        "DELOS_EVAL_HOST",
+        "DELOS_EVAL_PORT",
+        "DELOS_EVAL_CHANNEL_POOL_SIZE",
+        9004,
+    ),
+    (
+        "deploy",
+        "DELOS_DEPLOY_HOST",
+        "DELOS_DEPLOY_PORT",
+        "DELOS_DEPLOY_CHANNEL_POOL_SIZE",
+        9005,
+    ),
+)
+
+
+def _env_int(name: str) -> int | None:
+    """Read an optional integer environment variable."""
+    value = os.environ.get(name)
+    return int(value) if value else None
+
+
+@dataclass(slots=True)
 class DelosConfig:
     """Configuration for the Delos SDK.
 
@@ -47,6 +113,12 @@ class DelosConfig:
     timeout: float = 30.0
     connect_timeout: float = 10.0
 
+    # Number of channels per service; raise for high-concurrency workloads
+    channel_pool_size: int = 1
+
+    # Seconds to reuse runtime model and provider listings; 0 disables caching
+    catalog_ttl: float = 300.0
+
     @classmethod
     def from_env(cls) -> DelosConfig:
         """Create configuration from environment variables.
@@ -61,26 +133,31 @@ class DelosConfig:
             DELOS_DEPLOY_HOST, DELOS_DEPLOY_PORT: Deploy service
             DELOS_API_KEY: API key for authentication
             DELOS_TIMEOUT: Request timeout in seconds
+            DELOS_CONNECT_TIMEOUT: Connection timeout in seconds
+            DELOS_CHANNEL_POOL_SIZE: Number of channels per service
+            DELOS_<SERVICE>_CHANNEL_POOL_SIZE: Number of channels for one service
+            DELOS_CATALOG_TTL: Seconds to cache runtime model and provider listings
             DELOS_USE_TLS: Whether to use TLS (true/false)
         """
-        default_host = os.getenv("DELOS_HOST", "localhost")
-        use_tls = os.getenv("DELOS_USE_TLS", "false").lower() == "true"
-
-        def get_endpoint(name: str, default_port: int) -> ServiceEndpoint:
-            return ServiceEndpoint(
-                host=os.getenv(f"DELOS_{name.upper()}_HOST", default_host),
-                port=int(os.getenv(f"DELOS_{name.upper()}_PORT", str(default_port))),
+        env = os.environ.get
+        default_host = env("DELOS_HOST", "localhost")
+        use_tls = env("DELOS_USE_TLS", "false").lower() == "true"
+
+        endpoints = {
+            name: ServiceEndpoint(
+                host=env(host_var, default_host),
+                port=int(env(port_var, default_port)),
                 use_tls=use_tls,
+                channel_pool_size=_env_int(pool_var),
             )
+            for name, host_var, port_var, pool_var, default_port in _SERVICE_ENV
+        }
 
         return cls(
-            observe=get_endpoint("observe", 9000),
-            runtime=get_endpoint("runtime", 9001),
-            prompt=get_endpoint("prompt", 9002),
-            datasets=get_endpoint("datasets", 9003),
-            eval=get_endpoint("eval", 9004),
-            deploy=get_endpoint("deploy", 9005),
-            api_key=os.getenv("DELOS_API_KEY"),
-            timeout=float(os.getenv("DELOS_TIMEOUT", "30.0")),
-            connect_timeout=float(os.getenv("DELOS_CONNECT_TIMEOUT", "10.0")),
+            **endpoints,
+            api_key=env("DELOS_API_KEY"),
+            timeout=float(env("DELOS_TIMEOUT", "30.0")),
+            connect_timeout=float(env("DELOS_CONNECT_TIMEOUT", "10.0")),
+            channel_pool_size=int(env("DELOS_CHANNEL_POOL_SIZE", "1")),
+            catalog_ttl=float(env("DELOS_CATALOG_TTL", "300.0")),
         )
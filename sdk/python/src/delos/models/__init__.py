@@ -1,6 +1,6 @@
 """Pydantic models for the Delos SDK."""
 
-from delos.models.common import Metadata, PaginatedResponse
+from delos.models.common import EMPTY_MAP, Metadata, PaginatedResponse, SmallMap
 from delos.models.datasets import (
     Dataset,
     DatasetSchema,
@@ -34,7 +34,7 @@ from delos.models.eval import (
     ExampleComparison,
     RunComparison,
 )
-from delos.models.observe import Span, SpanKind, SpanStatus, Trace
+from delos.models.observe import Span, SpanKind, SpanStatus, Trace, TraceColumns
 from delos.models.prompt import Prompt, PromptMessage, PromptVariable, PromptVersion
 from delos.models.runtime import (
     CompletionParams,
@@ -48,13 +48,16 @@ from delos.models.runtime import (
 
 __all__ = [
     # Common
+    "EMPTY_MAP",
     "Metadata",
     "PaginatedResponse",
+    "SmallMap",
     # Observe
     "Span",
     "SpanKind",
     "SpanStatus",
     "Trace",
+    "TraceColumns",
     # Runtime
     "CompletionParams",
     "CompletionResponse",
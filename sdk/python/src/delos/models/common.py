@@ -2,20 +2,122 @@
 
 from __future__ import annotations
 
-from typing import Generic, TypeVar
+import asyncio
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping
+from typing import Any, Generic, TypeVar
 
-from pydantic import BaseModel
+from pydantic import GetCoreSchemaHandler, GetJsonSchemaHandler
+from pydantic.json_schema import JsonSchemaValue
+from pydantic_core import core_schema
+
+from delos.models._base import DelosModel
 
 T = TypeVar("T")
 
 
-class Metadata(BaseModel):
+class SmallMap(Mapping[str, str]):
+    """Immutable string-to-string mapping stored as a tuple of pairs.
+
+    Metadata and attribute maps usually hold a handful of entries, where a
+    flat tuple takes a fraction of the memory of a dict and a linear scan is
+    as fast as hashing. Models accept plain dicts for these fields; use
+    :meth:`as_dict` when a mutable copy is needed.
+    """
+
+    __slots__ = ("_items",)
+
+    def __init__(self, items: Mapping[str, str] | Iterable[tuple[str, str]] = ()) -> None:
+        """Create a map from a mapping or an iterable of key/value pairs."""
+        if isinstance(items, Mapping):
+            items = items.items()
+        self._items: tuple[tuple[str, str], ...] = tuple(items)
+
+    def __getitem__(self, key: str) -> str:
+        """Return the value for a key."""
+        for k, v in self._items:
+            if k == key:
+                return v
+        raise KeyError(key)
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Return the value for a key, or the default if it is missing."""
+        for k, v in self._items:
+            if k == key:
+                return v
+        return default
+
+    def __contains__(self, key: object) -> bool:
+        """Check whether a key is present."""
+        return any(k == key for k, _ in self._items)
+
+    def __iter__(self) -> Iterator[str]:
+        """Iterate over the keys."""
+        return (k for k, _ in self._items)
+
+    def __len__(self) -> int:
+        """Return the number of entries."""
+        return len(self._items)
+
+    def __repr__(self) -> str:
+        """Return a dict-like representation."""
+        return f"SmallMap({dict(self._items)!r})"
+
+    def __copy__(self) -> SmallMap:
+        """Return self; the map is immutable."""
+        return self
+
+    def __deepcopy__(self, memo: dict[int, Any]) -> SmallMap:
+        """Return self; the map is immutable."""
+        return self
+
+    def as_dict(self) -> dict[str, str]:
+        """Return a mutable dict copy of the map."""
+        return dict(self._items)
+
+    @classmethod
+    def _validate(cls, value: Any) -> SmallMap:
+        """Coerce a mapping of strings into a SmallMap."""
+        if isinstance(value, SmallMap):
+            return value
+        if not isinstance(value, Mapping):
+            raise ValueError("expected a mapping of strings")
+        if not value:
+            return EMPTY_MAP
+        items = tuple(value.items())
+        for k, v in items:
+            if not isinstance(k, str) or not isinstance(v, str):
+                raise ValueError("keys and values must be strings")
+        return cls(items)
+
+    @classmethod
+    def __get_pydantic_core_schema__(
+        cls, source: Any, handler: GetCoreSchemaHandler
+    ) -> core_schema.CoreSchema:
+        """Validate from any string mapping and serialize as a dict."""
+        return core_schema.no_info_plain_validator_function(
+            cls._validate,
+            serialization=core_schema.plain_serializer_function_ser_schema(cls.as_dict),
+        )
+
+    @classmethod
+    def __get_pydantic_json_schema__(
+        cls, schema: core_schema.CoreSchema, handler: GetJsonSchemaHandler
+    ) -> JsonSchemaValue:
+        """Describe the map as a JSON object of strings."""
+        return handler(core_schema.dict_schema(core_schema.str_schema(), core_schema.str_schema()))
+
+
+# Shared instance for the (very common) empty map.
+EMPTY_MAP = SmallMap()
+
+
+class Metadata(DelosModel):
     """Generic metadata dictionary."""
 
-    data: dict[str, str] = {}
+    data: SmallMap = EMPTY_MAP
 
 
-class PaginatedResponse(BaseModel, Generic[T]):
+class PaginatedResponse(DelosModel, Generic[T]):
     """Generic paginated response."""
 
     items: list[T]
@@ -27,3 +129,47 @@ class PaginatedResponse(BaseModel, Generic[T]):
     def has_more(self) -> bool:
         """Check if there are more items available."""
         return self.offset + len(self.items) < self.total_count
+
+    def iter_all(self, fetch_next: Callable[[int], PaginatedResponse[T]]) -> Iterator[T]:
+        """Iterate over the items of this page and every following page.
+
+        Pages are fetched one at a time as the previous one is consumed, so
+        only a single page is held in memory.
+
+        Args:
+            fetch_next: Fetches the page starting at the given offset.
+        """
+        page = self
+        while True:
+            yield from page.items
+            if not page.items or not page.has_more:
+                return
+            page = fetch_next(page.offset + len(page.items))
+
+    async def aiter_all(
+        self, fetch_next: Callable[[int], Awaitable[PaginatedResponse[T]]]
+    ) -> AsyncIterator[T]:
+        """Asynchronously iterate over the items of this and following pages.
+
+        The next page is requested while the current one is being consumed,
+        hiding fetch latency behind the caller's processing.
+
+        Args:
+            fetch_next: Coroutine function fetching the page at the given offset.
+        """
+        page = self
+        while True:
+            pending = None
+            if page.items and page.has_more:
+                pending = asyncio.ensure_future(fetch_next(page.offset + len(page.items)))
+            try:
+                for item in page.items:
+                    yield item
+            except BaseException:
+                # The consumer stopped early; drop the prefetch.
+                if pending is not None:
+                    pending.cancel()
+                raise
+            if pending is None:
+                return
+            page = await pending
@@ -6,7 +6,10 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel
+from pydantic import ConfigDict, Field
+
+from delos.models._base import DelosModel
+from delos.models.common import EMPTY_MAP, SmallMap
 
 
 class ExampleSource(str, Enum):
@@ -19,7 +22,7 @@ class ExampleSource(str, Enum):
     IMPORTED = "imported"
 
 
-class SchemaField(BaseModel):
+class SchemaField(DelosModel):
     """A field in the dataset schema."""
 
     name: str
@@ -28,14 +31,14 @@ class SchemaField(BaseModel):
     required: bool = True
 
 
-class DatasetSchema(BaseModel):
+class DatasetSchema(DelosModel):
     """Schema defining the structure of examples."""
 
     input_fields: list[SchemaField] = []
     expected_output_fields: list[SchemaField] = []
 
 
-class ExampleInput(BaseModel):
+class ExampleInput(DelosModel):
     """Input for creating an example."""
 
     input: dict[str, Any] = {}
@@ -44,42 +47,33 @@ class ExampleInput(BaseModel):
     source: ExampleSource = ExampleSource.MANUAL
 
 
-class Example(BaseModel):
+class Example(DelosModel):
     """A single example in a dataset."""
 
     id: str
     dataset_id: str
     input: dict[str, Any] = {}
     expected_output: dict[str, Any] = {}
-    metadata: dict[str, str] = {}
+    metadata: SmallMap = EMPTY_MAP
     source: ExampleSource = ExampleSource.UNSPECIFIED
     created_at: datetime | None = None
 
 
-class Dataset(BaseModel):
+class Dataset(DelosModel):
     """A dataset containing examples for evaluation."""
 
     id: str
     name: str
     description: str = ""
     prompt_id: str = ""
-    schema_: DatasetSchema | None = None
+    schema_: DatasetSchema | None = Field(default=None, alias="schema")
     example_count: int = 0
     last_updated: datetime | None = None
-    tags: list[str] = []
-    metadata: dict[str, str] = {}
+    tags: tuple[str, ...] = ()
+    metadata: SmallMap = EMPTY_MAP
     version: int = 1
     created_by: str = ""
     created_at: datetime | None = None
 
-    class Config:
-        """Pydantic config."""
-
-        # Allow schema_ to map from 'schema' in JSON
-        populate_by_name = True
-
-    def __init__(self, **data: Any) -> None:
-        """Handle 'schema' field name mapping."""
-        if "schema" in data and "schema_" not in data:
-            data["schema_"] = data.pop("schema")
-        super().__init__(**data)
+    # Accept both 'schema' (wire name) and 'schema_' (attribute name)
+    model_config = ConfigDict(populate_by_name=True)
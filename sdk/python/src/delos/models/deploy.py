@@ -5,7 +5,8 @@ from __future__ import annotations
 from datetime import datetime
 from enum import Enum
 
-from pydantic import BaseModel
+from delos.models._base import DelosModel
+from delos.models.common import EMPTY_MAP, SmallMap
 
 
 class DeploymentStatus(str, Enum):
@@ -22,6 +23,25 @@ class DeploymentStatus(str, Enum):
     FAILED = "failed"
 
 
+_ACTIVE_STATUSES = frozenset(
+    {
+        DeploymentStatus.PENDING_APPROVAL,
+        DeploymentStatus.PENDING_GATES,
+        DeploymentStatus.IN_PROGRESS,
+    }
+)
+
+_COMPLETE_STATUSES = frozenset(
+    {
+        DeploymentStatus.COMPLETED,
+        DeploymentStatus.ROLLED_BACK,
+        DeploymentStatus.CANCELLED,
+        DeploymentStatus.FAILED,
+        DeploymentStatus.GATES_FAILED,
+    }
+)
+
+
 class DeploymentType(str, Enum):
     """Type of deployment strategy."""
 
@@ -32,7 +52,7 @@ class DeploymentType(str, Enum):
     BLUE_GREEN = "blue_green"
 
 
-class DeploymentStrategy(BaseModel):
+class DeploymentStrategy(DelosModel):
     """Strategy for deploying a new version."""
 
     type: DeploymentType = DeploymentType.IMMEDIATE
@@ -43,7 +63,7 @@ class DeploymentStrategy(BaseModel):
     rollback_threshold: float = 0.0
 
 
-class RolloutProgress(BaseModel):
+class RolloutProgress(DelosModel):
     """Progress of a gradual rollout."""
 
     current_percentage: int = 0
@@ -52,7 +72,7 @@ class RolloutProgress(BaseModel):
     next_increment_at: datetime | None = None
 
 
-class GateCondition(BaseModel):
+class GateCondition(DelosModel):
     """A condition in a quality gate."""
 
     type: str  # eval_score, latency, cost, custom
@@ -62,7 +82,7 @@ class GateCondition(BaseModel):
     dataset_id: str = ""
 
 
-class ConditionResult(BaseModel):
+class ConditionResult(DelosModel):
     """Result of evaluating a condition."""
 
     type: str
@@ -71,29 +91,29 @@ class ConditionResult(BaseModel):
     passed: bool
 
 
-class QualityGateResult(BaseModel):
+class QualityGateResult(DelosModel):
     """Result of evaluating a quality gate."""
 
     gate_id: str
     gate_name: str
     passed: bool
     message: str = ""
-    condition_results: list[ConditionResult] = []
+    condition_results: tuple[ConditionResult, ...] = ()
 
 
-class QualityGate(BaseModel):
+class QualityGate(DelosModel):
     """A quality gate configuration."""
 
     id: str
     name: str
     prompt_id: str
-    conditions: list[GateCondition] = []
+    conditions: tuple[GateCondition, ...] = ()
     required: bool = True
     created_at: datetime | None = None
     created_by: str = ""
 
 
-class DeploymentMetrics(BaseModel):
+class DeploymentMetrics(DelosModel):
     """Real-time metrics for a deployment."""
 
     avg_latency_ms: float = 0.0
@@ -102,7 +122,7 @@ class DeploymentMetrics(BaseModel):
     request_count: int = 0
 
 
-class Deployment(BaseModel):
+class Deployment(DelosModel):
     """A deployment of a prompt version."""
 
     id: str
@@ -113,7 +133,7 @@ class Deployment(BaseModel):
     strategy: DeploymentStrategy | None = None
     status: DeploymentStatus = DeploymentStatus.UNSPECIFIED
     status_message: str = ""
-    gate_results: list[QualityGateResult] = []
+    gate_results: tuple[QualityGateResult, ...] = ()
     gates_passed: bool = False
     rollout: RolloutProgress | None = None
     created_at: datetime | None = None
@@ -121,24 +141,14 @@ class Deployment(BaseModel):
     completed_at: datetime | None = None
     created_by: str = ""
     approved_by: str = ""
-    metadata: dict[str, str] = {}
+    metadata: SmallMap = EMPTY_MAP
 
     @property
     def is_active(self) -> bool:
         """Check if deployment is currently active."""
-        return self.status in (
-            DeploymentStatus.PENDING_APPROVAL,
-            DeploymentStatus.PENDING_GATES,
-            DeploymentStatus.IN_PROGRESS,
-        )
+        return self.status in _ACTIVE_STATUSES
 
     @property
     def is_complete(self) -> bool:
         """Check if deployment has completed (successfully or not)."""
-        return self.status in (
-            DeploymentStatus.COMPLETED,
-            DeploymentStatus.ROLLED_BACK,
-            DeploymentStatus.CANCELLED,
-            DeploymentStatus.FAILED,
-            DeploymentStatus.GATES_FAILED,
-        )
+        return self.status in _COMPLETE_STATUSES
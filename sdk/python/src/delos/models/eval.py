@@ -6,7 +6,8 @@ from datetime import datetime
 from enum import Enum
 from typing import Any
 
-from pydantic import BaseModel
+from delos.models._base import DelosModel
+from delos.models.common import EMPTY_MAP, SmallMap
 
 
 class EvalRunStatus(str, Enum):
@@ -20,7 +21,7 @@ class EvalRunStatus(str, Enum):
     CANCELLED = "cancelled"
 
 
-class EvaluatorConfig(BaseModel):
+class EvaluatorConfig(DelosModel):
     """Configuration for a single evaluator."""
 
     type: str  # exact_match, semantic_similarity, llm_judge, etc.
@@ -29,7 +30,7 @@ class EvaluatorConfig(BaseModel):
     weight: float = 1.0
 
 
-class EvalConfig(BaseModel):
+class EvalConfig(DelosModel):
     """Configuration for an evaluation run."""
 
     evaluators: list[EvaluatorConfig] = []
@@ -40,7 +41,7 @@ class EvalConfig(BaseModel):
     shuffle: bool = False
 
 
-class EvaluatorResult(BaseModel):
+class EvaluatorResult(DelosModel):
     """Result from a single evaluator."""
 
     evaluator_type: str
@@ -50,7 +51,7 @@ class EvaluatorResult(BaseModel):
     details: dict[str, str] = {}
 
 
-class EvalResult(BaseModel):
+class EvalResult(DelosModel):
     """Result for a single example."""
 
     id: str
@@ -68,7 +69,7 @@ class EvalResult(BaseModel):
     error: str = ""
 
 
-class EvalSummary(BaseModel):
+class EvalSummary(DelosModel):
     """Summary statistics for an evaluation run."""
 
     overall_score: float = 0.0
@@ -80,8 +81,48 @@ class EvalSummary(BaseModel):
     total_tokens: int = 0
     avg_latency_ms: float = 0.0
 
-
-class EvalRun(BaseModel):
+    @classmethod
+    def from_results(cls, results: list[EvalResult]) -> EvalSummary:
+        """Aggregate per-example results into a summary in a single pass."""
+        count = len(results)
+        if count == 0:
+            return cls()
+
+        score_total = 0.0
+        latency_total = 0.0
+        cost_total = 0.0
+        tokens = 0
+        passed = 0
+        evaluator_totals: dict[str, list[float]] = {}
+        for result in results:
+            score_total += result.overall_score
+            latency_total += result.latency_ms
+            cost_total += result.cost_usd
+            tokens += result.tokens_used
+            passed += result.passed
+            for name, evaluator_result in result.evaluator_results.items():
+                totals = evaluator_totals.get(name)
+                if totals is None:
+                    evaluator_totals[name] = [evaluator_result.score, 1.0]
+                else:
+                    totals[0] += evaluator_result.score
+                    totals[1] += 1.0
+
+        return cls(
+            overall_score=score_total / count,
+            scores_by_evaluator={
+                name: total / seen for name, (total, seen) in evaluator_totals.items()
+            },
+            passed_count=passed,
+            failed_count=count - passed,
+            pass_rate=passed / count,
+            total_cost_usd=cost_total,
+            total_tokens=tokens,
+            avg_latency_ms=latency_total / count,
+        )
+
+
+class EvalRun(DelosModel):
     """An evaluation run."""
 
     id: str
@@ -100,7 +141,7 @@ class EvalRun(BaseModel):
     started_at: datetime | None = None
     completed_at: datetime | None = None
     created_by: str = ""
-    metadata: dict[str, str] = {}
+    metadata: SmallMap = EMPTY_MAP
 
     @property
     def progress(self) -> float:
@@ -110,7 +151,7 @@ class EvalRun(BaseModel):
         return (self.completed_examples / self.total_examples) * 100
 
 
-class EvaluatorParam(BaseModel):
+class EvaluatorParam(DelosModel):
     """Parameter definition for an evaluator."""
 
     name: str
@@ -120,7 +161,7 @@ class EvaluatorParam(BaseModel):
     default_value: str = ""
 
 
-class Evaluator(BaseModel):
+class Evaluator(DelosModel):
     """An available evaluator type."""
 
     type: str
@@ -129,7 +170,7 @@ class Evaluator(BaseModel):
     params: list[EvaluatorParam] = []
 
 
-class RunComparison(BaseModel):
+class RunComparison(DelosModel):
     """Summary for comparing runs."""
 
     run_id: str
@@ -140,7 +181,7 @@ class RunComparison(BaseModel):
     total_cost_usd: float = 0.0
 
 
-class ExampleComparison(BaseModel):
+class ExampleComparison(DelosModel):
     """Comparison of a single example across runs."""
 
     example_id: str
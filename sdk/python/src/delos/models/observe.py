@@ -2,10 +2,15 @@
 
 from __future__ import annotations
 
-from datetime import datetime
+from array import array
+from collections.abc import Sequence
+from datetime import UTC, datetime, timedelta
 from enum import Enum
 
-from pydantic import BaseModel
+from pydantic import PrivateAttr
+
+from delos.models._base import DelosModel
+from delos.models.common import EMPTY_MAP, SmallMap
 
 
 class SpanKind(str, Enum):
@@ -27,7 +32,7 @@ class SpanStatus(str, Enum):
     ERROR = "error"
 
 
-class Span(BaseModel):
+class Span(DelosModel):
     """A single span in a trace."""
 
     trace_id: str
@@ -39,7 +44,7 @@ class Span(BaseModel):
     end_time: datetime | None = None
     status: SpanStatus = SpanStatus.UNSET
     status_message: str | None = None
-    attributes: dict[str, str] = {}
+    attributes: SmallMap = EMPTY_MAP
     service_name: str = ""
 
     @property
@@ -50,7 +55,81 @@ class Span(BaseModel):
         return (self.end_time - self.start_time).total_seconds() * 1000
 
 
-class Trace(BaseModel):
+_EPOCH = datetime(1970, 1, 1, tzinfo=UTC)
+_NAIVE_EPOCH = datetime(1970, 1, 1)
+# Marks spans without an end time in TraceColumns.end_ns.
+_NO_END = -(2**63)
+
+
+def _epoch_ns(dt: datetime) -> int:
+    """Convert a datetime to integer nanoseconds since the Unix epoch."""
+    delta: timedelta = dt - (_NAIVE_EPOCH if dt.tzinfo is None else _EPOCH)
+    return (delta.days * 86_400 + delta.seconds) * 1_000_000_000 + delta.microseconds * 1_000
+
+
+class TraceColumns:
+    """Column-oriented view of the spans in a trace.
+
+    Span ids are kept in parallel sequences and timestamps in packed
+    ``array("q")`` buffers of nanoseconds since the epoch, so lookups and
+    aggregations over large traces run as C-level scans instead of per-span
+    attribute access. Spans without an end time are stored as a sentinel.
+    The original :class:`Span` objects remain available by index.
+    """
+
+    __slots__ = ("span_ids", "parent_span_ids", "start_ns", "end_ns", "_spans")
+
+    def __init__(self, spans: Sequence[Span]) -> None:
+        """Build the columns from a sequence of spans."""
+        self._spans = spans
+        self.span_ids = [s.span_id for s in spans]
+        self.parent_span_ids = [s.parent_span_id for s in spans]
+        self.start_ns = array("q", [_epoch_ns(s.start_time) for s in spans])
+        self.end_ns = array(
+            "q", [_NO_END if s.end_time is None else _epoch_ns(s.end_time) for s in spans]
+        )
+
+    def __len__(self) -> int:
+        """Return the number of spans."""
+        return len(self._spans)
+
+    def __getitem__(self, index: int) -> Span:
+        """Return the span at the given position."""
+        return self._spans[index]
+
+    @property
+    def root_index(self) -> int | None:
+        """Position of the root span, or None if there is none."""
+        try:
+            return self.parent_span_ids.index(None)
+        except ValueError:
+            return None
+
+    @property
+    def root_span(self) -> Span | None:
+        """Get the root span of the trace."""
+        index = self.root_index
+        return None if index is None else self._spans[index]
+
+    @property
+    def duration_ms(self) -> float | None:
+        """Time from the earliest span start to the latest span end in milliseconds."""
+        if not self.start_ns:
+            return None
+        end = max(self.end_ns)
+        if end == _NO_END:
+            return None
+        return (end - min(self.start_ns)) / 1_000_000
+
+    def durations_ms(self) -> list[float | None]:
+        """Duration of every span in milliseconds, None for unfinished spans."""
+        return [
+            None if end == _NO_END else (end - start) / 1_000_000
+            for start, end in zip(self.start_ns, self.end_ns)
+        ]
+
+
+class Trace(DelosModel):
     """A complete trace with all its spans."""
 
     trace_id: str
@@ -59,6 +138,11 @@ class Trace(BaseModel):
     start_time: datetime | None = None
     end_time: datetime | None = None
 
+    # span_id -> position in spans, built on first lookup. Every hit is checked
+    # against the list and a miss or mismatch rebuilds it, so replacing,
+    # reordering or appending spans never yields a stale span.
+    _span_positions: dict[str, int] | None = PrivateAttr(default=None)
+
     @property
     def duration_ms(self) -> float | None:
         """Calculate total trace duration in milliseconds."""
@@ -68,8 +152,35 @@ class Trace(BaseModel):
 
     @property
     def root_span(self) -> Span | None:
-        """Get the root span of the trace."""
+        """Get the root span of the trace.
+
+        The first span without a parent. Unlike :meth:`get_span` this is not
+        indexed: a cached position stays valid only while every span before it
+        still has a parent, and checking that is the same scan. The root
+        normally comes first, so the scan usually stops after one span.
+        """
         for span in self.spans:
             if span.parent_span_id is None:
                 return span
         return None
+
+    def get_span(self, span_id: str) -> Span | None:
+        """Get a span by its ID."""
+        spans = self.spans
+        positions = self._span_positions
+        if positions is not None:
+            position = positions.get(span_id)
+            if position is not None and position < len(spans):
+                span = spans[position]
+                if span.span_id == span_id:
+                    return span
+        positions = {}
+        for i, span in enumerate(spans):
+            positions.setdefault(span.span_id, i)
+        self._span_positions = positions
+        position = positions.get(span_id)
+        return None if position is None else spans[position]
+
+    def columns(self) -> TraceColumns:
+        """Build a column-oriented view of the spans for bulk analysis."""
+        return TraceColumns(self.spans)
@@ -2,12 +2,19 @@
 
 from __future__ import annotations
 
+import re
 from datetime import datetime
 
-from pydantic import BaseModel
+from pydantic import PrivateAttr
 
+from delos.models._base import DelosModel
+from delos.models.common import EMPTY_MAP, SmallMap
 
-class PromptVariable(BaseModel):
+# Matches {{name}} placeholders in prompt templates.
+_VARIABLE_PATTERN = re.compile(r"\{\{([^{}]+)\}\}")
+
+
+class PromptVariable(DelosModel):
     """A variable used in a prompt template."""
 
     name: str
@@ -16,14 +23,14 @@ class PromptVariable(BaseModel):
     required: bool = True
 
 
-class PromptMessage(BaseModel):
+class PromptMessage(DelosModel):
     """A message in a prompt template."""
 
     role: str  # system, user, assistant
     content: str
 
 
-class PromptVersion(BaseModel):
+class PromptVersion(DelosModel):
     """A specific version of a prompt."""
 
     version: int
@@ -39,7 +46,7 @@ class PromptVersion(BaseModel):
     commit_message: str = ""
 
 
-class Prompt(BaseModel):
+class Prompt(DelosModel):
     """A prompt with its current and historical versions."""
 
     id: str
@@ -49,18 +56,33 @@ class Prompt(BaseModel):
     current_version: int = 1
     versions: list[PromptVersion] = []
     tags: list[str] = []
-    metadata: dict[str, str] = {}
+    metadata: SmallMap = EMPTY_MAP
     created_at: datetime | None = None
     updated_at: datetime | None = None
     created_by: str = ""
 
+    # Version number -> position in versions, built on first lookup. Every hit
+    # is checked against the list and a miss or mismatch rebuilds it, so
+    # replacing, reordering or appending versions never yields a stale one.
+    _version_positions: dict[int, int] | None = PrivateAttr(default=None)
+
     def get_version(self, version: int | None = None) -> PromptVersion | None:
         """Get a specific version of the prompt."""
-        target = version or self.current_version
-        for v in self.versions:
-            if v.version == target:
-                return v
-        return None
+        number = version or self.current_version
+        versions = self.versions
+        positions = self._version_positions
+        if positions is not None:
+            position = positions.get(number)
+            if position is not None and position < len(versions):
+                found = versions[position]
+                if found.version == number:
+                    return found
+        positions = {}
+        for i, v in enumerate(versions):
+            positions.setdefault(v.version, i)
+        self._version_positions = positions
+        position = positions.get(number)
+        return None if position is None else versions[position]
 
     @property
     def latest(self) -> PromptVersion | None:
@@ -73,8 +95,7 @@ class Prompt(BaseModel):
         if v is None:
             raise ValueError(f"Version {version or self.current_version} not found")
 
-        template = v.template
-        if variables:
-            for name, value in variables.items():
-                template = template.replace(f"{{{{{name}}}}}", value)
-        return template
+        if not variables:
+            return v.template
+        # Substitute every placeholder in a single pass; unknown ones are kept.
+        return _VARIABLE_PATTERN.sub(lambda m: variables.get(m.group(1), m.group(0)), v.template)
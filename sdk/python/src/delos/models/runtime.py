@@ -4,7 +4,10 @@ from __future__ import annotations
 
 from enum import Enum
 
-from pydantic import BaseModel, Field
+from pydantic import Field
+
+from delos.models._base import DelosModel
+from delos.models.common import EMPTY_MAP, SmallMap
 
 
 class RoutingStrategy(str, Enum):
@@ -16,14 +19,14 @@ class RoutingStrategy(str, Enum):
     QUALITY = "quality"
 
 
-class Message(BaseModel):
+class Message(DelosModel):
     """A message in a conversation."""
 
     role: str  # system, user, assistant
     content: str
 
 
-class CompletionParams(BaseModel):
+class CompletionParams(DelosModel):
     """Parameters for a completion request."""
 
     model: str = ""
@@ -35,10 +38,10 @@ class CompletionParams(BaseModel):
     stop_sequences: list[str] = []
     provider: str = ""  # optional: openai, anthropic
     routing_strategy: RoutingStrategy = RoutingStrategy.UNSPECIFIED
-    metadata: dict[str, str] = {}
+    metadata: SmallMap = EMPTY_MAP
 
 
-class Usage(BaseModel):
+class Usage(DelosModel):
     """Token usage information."""
 
     prompt_tokens: int = 0
@@ -46,7 +49,7 @@ class Usage(BaseModel):
     total_tokens: int = 0
 
 
-class CompletionResponse(BaseModel):
+class CompletionResponse(DelosModel):
     """Response from a completion request."""
 
     id: str = ""
@@ -56,10 +59,12 @@ class CompletionResponse(BaseModel):
     usage: Usage = Field(default_factory=Usage)
     latency_ms: float = 0.0
     finish_reason: str = ""
-    metadata: dict[str, str] = {}
+    metadata: SmallMap = EMPTY_MAP
+    cached: bool = False
+    trace_id: str = ""
 
 
-class Model(BaseModel):
+class Model(DelosModel):
     """Information about an available model."""
 
     id: str
@@ -73,7 +78,7 @@ class Model(BaseModel):
     cost_per_output_token: float = 0.0
 
 
-class Provider(BaseModel):
+class Provider(DelosModel):
     """Information about an LLM provider."""
 
     id: str
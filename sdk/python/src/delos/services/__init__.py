@@ -1,13 +1,28 @@
 """Service clients for Delos."""
 
-from delos.services.datasets import DatasetsClient
-from delos.services.deploy import DeployClient
-from delos.services.eval import EvalClient
-from delos.services.observe import ObserveClient
-from delos.services.prompt import PromptClient
-from delos.services.runtime import RuntimeClient
+from __future__ import annotations
+
+import importlib
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from delos.services.datasets import DatasetsClient
+    from delos.services.deploy import DeployClient
+    from delos.services.eval import AsyncEvalClient, EvalClient
+    from delos.services.observe import AsyncObserveClient, ObserveClient
+    from delos.services.prompt import AsyncPromptClient, PromptClient
+    from delos.services.runtime import (
+        AsyncRuntimeClient,
+        CachedRuntimeClient,
+        RuntimeClient,
+    )
 
 __all__ = [
+    "AsyncEvalClient",
+    "AsyncObserveClient",
+    "AsyncPromptClient",
+    "AsyncRuntimeClient",
+    "CachedRuntimeClient",
     "DatasetsClient",
     "DeployClient",
     "EvalClient",
@@ -15,3 +30,27 @@ __all__ = [
     "PromptClient",
     "RuntimeClient",
 ]
+
+# Client name -> defining module, imported on first access so that using one
+# service does not load the generated code of all the others.
+_CLIENT_MODULES = {
+    "AsyncEvalClient": "delos.services.eval",
+    "AsyncObserveClient": "delos.services.observe",
+    "AsyncPromptClient": "delos.services.prompt",
+    "AsyncRuntimeClient": "delos.services.runtime",
+    "CachedRuntimeClient": "delos.services.runtime",
+    "DatasetsClient": "delos.services.datasets",
+    "DeployClient": "delos.services.deploy",
+    "EvalClient": "delos.services.eval",
+    "ObserveClient": "delos.services.observe",
+    "PromptClient": "delos.services.prompt",
+    "RuntimeClient": "delos.services.runtime",
+}
+
+
+def __getattr__(name: str) -> Any:
+    """Import service clients lazily."""
+    module = _CLIENT_MODULES.get(name)
+    if module is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    return getattr(importlib.import_module(module), name)
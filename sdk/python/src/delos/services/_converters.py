@@ -0,0 +1,136 @@
+"""Protobuf-to-model converters generated at import time.
+
+Converters for the larger messages are compiled from the message descriptor
+into a single straight-line function per type: every field read is spelled
+out, the model's ``__dict__`` is built as one dict literal, and the names the
+function needs are closure variables rather than globals.
+
+Example:
+    >>> _to_rollout = build_converter(deploy_pb2.RolloutProgress.DESCRIPTOR, RolloutProgress)
+    >>> rollout = _to_rollout(response.rollout)
+"""
+
+from __future__ import annotations
+
+import typing
+from collections.abc import Callable, Mapping
+from typing import TYPE_CHECKING, Any
+
+from delos.models._base import ModelT
+from delos.models.common import EMPTY_MAP, SmallMap
+from delos.services._timestamp import timestamp_to_datetime
+
+if TYPE_CHECKING:
+    from google.protobuf.descriptor import Descriptor, FieldDescriptor
+
+_TIMESTAMP = "google.protobuf.Timestamp"
+
+# Names every generated converter may use, in addition to its namespace.
+_BUILTINS: dict[str, Any] = {
+    "_new": object.__new__,
+    "_setattr": object.__setattr__,
+    "_timestamp": timestamp_to_datetime,
+    "SmallMap": SmallMap,
+    "EMPTY_MAP": EMPTY_MAP,
+}
+
+
+def _is_repeated(fd: FieldDescriptor) -> bool:
+    """Check whether a field is repeated (``label`` is deprecated in newer protobuf)."""
+    is_repeated = getattr(fd, "is_repeated", None)
+    if is_repeated is not None:
+        return bool(is_repeated)
+    return fd.label == fd.LABEL_REPEATED
+
+
+def _field_expr(fd: FieldDescriptor, annotation: Any) -> str:
+    """Return the expression reading a field of ``pb`` as its model value."""
+    attr = f"pb.{fd.name}"
+    message = fd.message_type
+    if message is not None and message.GetOptions().map_entry:
+        if message.fields_by_name["value"].message_type is not None:
+            raise ValueError(f"message map field {fd.full_name} needs an override")
+        if annotation is SmallMap:
+            return f"SmallMap({attr}) if {attr} else EMPTY_MAP"
+        return f"dict({attr})"
+    if _is_repeated(fd):
+        if message is not None:
+            raise ValueError(f"repeated message field {fd.full_name} needs an override")
+        return f"tuple({attr})" if typing.get_origin(annotation) is tuple else f"list({attr})"
+    if message is not None:
+        if message.full_name != _TIMESTAMP:
+            raise ValueError(f"message field {fd.full_name} needs an override")
+        return f"_timestamp({attr})"
+    if fd.enum_type is not None:
+        raise ValueError(f"enum field {fd.full_name} needs an override")
+    return attr
+
+
+def build_converter(
+    descriptor: Descriptor,
+    model_cls: type[ModelT],
+    overrides: Mapping[str, str] | None = None,
+    namespace: Mapping[str, Any] | None = None,
+) -> Callable[[Any], ModelT]:
+    """Compile a function converting a protobuf message into ``model_cls``.
+
+    Each model field is read from the message field of the same name (or the
+    field's alias). Scalars, repeated scalars, scalar maps (as a ``SmallMap``
+    or a dict, following the annotation) and timestamps are handled
+    automatically; enums, nested messages and maps of messages need an entry in
+    ``overrides``, an expression over ``pb`` whose free names are taken from
+    ``namespace``. Like :func:`~delos.models._base.construct_trusted`, the
+    result is built without validation.
+
+    Args:
+        descriptor: Descriptor of the source message.
+        model_cls: Model to build.
+        overrides: Source expressions for fields that need explicit handling.
+        namespace: Names referenced by the override expressions.
+
+    Raises:
+        ValueError: If a model field has no counterpart in the message.
+    """
+    overrides = overrides or {}
+    entries = []
+    for name, field in model_cls.model_fields.items():
+        if name in overrides:
+            expr = overrides[name]
+        else:
+            fd = descriptor.fields_by_name.get(field.alias or name)
+            if fd is None:
+                raise ValueError(
+                    f"{descriptor.full_name} has no field for {model_cls.__name__}.{name}"
+                )
+            expr = _field_expr(fd, field.annotation)
+        entries.append(f"            {name!r}: {expr},")
+
+    cells = {
+        **_BUILTINS,
+        **(namespace or {}),
+        "_model": model_cls,
+        "_fields": frozenset(model_cls.model_fields),
+    }
+    # Initializes private attributes to their defaults.
+    post_init = "        model.model_post_init(None)\n" if model_cls.__pydantic_post_init__ else ""
+    body = "\n".join(entries)
+    source = (
+        f"def _make({', '.join(cells)}):\n"
+        "    def convert(pb):\n"
+        "        model = _new(_model)\n"
+        "        _setattr(model, '__dict__', {\n"
+        f"{body}\n"
+        "        })\n"
+        "        _setattr(model, '__pydantic_fields_set__', set(_fields))\n"
+        "        _setattr(model, '__pydantic_extra__', None)\n"
+        "        _setattr(model, '__pydantic_private__', None)\n"
+        f"{post_init}"
+        "        return model\n"
+        "    return convert\n"
+    )
+    scope: dict[str, Any] = {}
+    exec(compile(source, f"<converter {descriptor.full_name}>", "exec"), scope)
+    convert = scope["_make"](**cells)
+    convert.__name__ = convert.__qualname__ = f"to_{model_cls.__name__.lower()}"
+    convert.__doc__ = f"Convert a {descriptor.name} message to a {model_cls.__name__}."
+    return convert
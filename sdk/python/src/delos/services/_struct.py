@@ -0,0 +1,34 @@
+"""Conversion of ``google.protobuf.Struct`` messages to Python objects.
+
+Walks the ``Value`` oneofs directly instead of going through
+``json_format.MessageToDict``, which resolves every field by reflection.
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, Any
+
+if TYPE_CHECKING:
+    from google.protobuf import struct_pb2
+
+
+def value_to_python(value: struct_pb2.Value) -> Any:
+    """Convert a protobuf Value to the equivalent JSON-like Python object."""
+    kind = value.WhichOneof("kind")
+    if kind == "string_value":
+        return value.string_value
+    if kind == "number_value":
+        return value.number_value
+    if kind == "bool_value":
+        return value.bool_value
+    if kind == "struct_value":
+        return struct_to_dict(value.struct_value)
+    if kind == "list_value":
+        return [value_to_python(v) for v in value.list_value.values]
+    # null_value, or no kind set at all.
+    return None
+
+
+def struct_to_dict(struct: struct_pb2.Struct) -> dict[str, Any]:
+    """Convert a protobuf Struct to a dict; an unset Struct gives ``{}``."""
+    return {key: value_to_python(value) for key, value in struct.fields.items()}
@@ -1,53 +1,165 @@
-"""Base client for gRPC services."""
+"""Base clients for gRPC services."""
 
 from __future__ import annotations
 
-from typing import TYPE_CHECKING
+import itertools
+from abc import ABC, abstractmethod
+from collections.abc import Callable, Iterator
+from typing import TYPE_CHECKING, Any, Generic, TypeVar
 
 import grpc
 
+from delos._channel_cache import (
+    ChannelOptions,
+    get_aio_channel,
+    get_channel,
+    release_aio_channel,
+    release_channel,
+)
+
 if TYPE_CHECKING:
     from delos.config import ServiceEndpoint
 
+ChannelT = TypeVar("ChannelT")
+StubT = TypeVar("StubT")
+
+
+def _pool_options(index: int) -> ChannelOptions:
+    """Return the channel options for a pooled channel.
+
+    The first channel uses no extra options so it stays shared with every other
+    client of the endpoint. Additional channels get a local subchannel pool so
+    each opens its own connection instead of multiplexing onto the first one.
+    """
+    if index == 0:
+        return ()
+    return (("grpc.use_local_subchannel_pool", 1), ("delos.pool_index", index))
 
-class BaseClient:
-    """Base class for service clients."""
 
-    def __init__(self, endpoint: ServiceEndpoint, timeout: float = 30.0) -> None:
+class _PooledClient(ABC, Generic[ChannelT]):
+    """Channel pooling shared by the sync and async base clients.
+
+    Subclasses provide :meth:`_open_channel` for their kind of channel.
+    """
+
+    def __init__(
+        self, endpoint: ServiceEndpoint, timeout: float = 30.0, pool_size: int = 1
+    ) -> None:
         """Initialize the client.
 
         Args:
             endpoint: Service endpoint configuration.
             timeout: Default timeout for requests in seconds.
+            pool_size: Number of channels to spread requests across, unless the
+                endpoint sets its own ``channel_pool_size``.
         """
         self._endpoint = endpoint
         self._timeout = timeout
-        self._channel: grpc.Channel | None = None
+        self._pool_size = max(1, endpoint.channel_pool_size or pool_size)
+        self._channels: list[ChannelT] | None = None
+        self._channel_cycle: Iterator[ChannelT] | None = None
+        self._stubs: Iterator[Any] | None = None
+        self._stub_pool: list[Any] = []
+
+    @abstractmethod
+    def _open_channel(self, options: ChannelOptions) -> ChannelT:
+        """Acquire a channel for the endpoint with the given options."""
 
     @property
-    def channel(self) -> grpc.Channel:
-        """Get or create the gRPC channel."""
-        if self._channel is None:
-            if self._endpoint.use_tls:
-                credentials = grpc.ssl_channel_credentials()
-                self._channel = grpc.secure_channel(
-                    self._endpoint.address,
-                    credentials,
-                )
-            else:
-                self._channel = grpc.insecure_channel(self._endpoint.address)
-        return self._channel
+    def channels(self) -> list[ChannelT]:
+        """Get the pooled gRPC channels, creating them if needed."""
+        if self._channels is None:
+            self._channels = [self._open_channel(_pool_options(i)) for i in range(self._pool_size)]
+        return self._channels
+
+    @property
+    def channel(self) -> ChannelT:
+        """Get the primary gRPC channel, shared with other clients of the same endpoint."""
+        return self.channels[0]
+
+    def next_channel(self) -> ChannelT:
+        """Get the next channel from the pool in round-robin order."""
+        if self._channel_cycle is None:
+            self._channel_cycle = itertools.cycle(self.channels)
+        return next(self._channel_cycle)
+
+    def _stub_cycle(self, stub_type: Callable[[ChannelT], StubT]) -> Iterator[StubT]:
+        """Create one stub per pooled channel and cycle through them."""
+        self._stub_pool = [stub_type(channel) for channel in self.channels]
+        return itertools.cycle(self._stub_pool)
+
+    def _keyed_stub(self, stub: StubT, key: str) -> StubT:
+        """Return the pooled stub that serves calls for a key.
+
+        Calls sharing a key, such as repeated polls of one deployment, stay on
+        one channel while different keys spread across the pool.
+
+        Args:
+            stub: Any stub from the pool, returned as is when there is one channel.
+            key: Shard key for the call.
+        """
+        pool = self._stub_pool
+        if len(pool) <= 1:
+            return stub
+        return pool[hash(key) % len(pool)]
+
+    def _detach(self) -> int:
+        """Forget the pooled channels and stubs, returning how many were open."""
+        count = len(self._channels) if self._channels is not None else 0
+        self._channels = None
+        self._channel_cycle = None
+        self._stubs = None
+        self._stub_pool = []
+        return count
+
+
+class BaseClient(_PooledClient[grpc.Channel]):
+    """Base class for service clients."""
+
+    def _open_channel(self, options: ChannelOptions) -> grpc.Channel:
+        """Acquire a shared channel from the process-wide cache."""
+        return get_channel(self._endpoint, options)
 
     def close(self) -> None:
-        """Close the gRPC channel."""
-        if self._channel is not None:
-            self._channel.close()
-            self._channel = None
+        """Release the gRPC channels.
 
-    def __enter__(self) -> "BaseClient":
+        The underlying connections are closed once no other client uses them.
+        """
+        for i in range(self._detach()):
+            release_channel(self._endpoint, _pool_options(i))
+
+    def __enter__(self) -> BaseClient:
         """Context manager entry."""
         return self
 
     def __exit__(self, *args: object) -> None:
         """Context manager exit."""
         self.close()
+
+
+class AsyncBaseClient(_PooledClient[grpc.aio.Channel]):
+    """Base class for asyncio service clients built on ``grpc.aio``.
+
+    Channels are bound to the event loop that first uses the client, so an
+    instance must not be shared between loops.
+    """
+
+    def _open_channel(self, options: ChannelOptions) -> grpc.aio.Channel:
+        """Acquire a shared aio channel for the running event loop."""
+        return get_aio_channel(self._endpoint, options)
+
+    async def close(self) -> None:
+        """Release the gRPC channels.
+
+        The underlying connections are closed once no other client uses them.
+        """
+        for i in range(self._detach()):
+            await release_aio_channel(self._endpoint, _pool_options(i))
+
+    async def __aenter__(self) -> AsyncBaseClient:
+        """Async context manager entry."""
+        return self
+
+    async def __aexit__(self, *args: object) -> None:
+        """Async context manager exit."""
+        await self.close()
@@ -2,12 +2,12 @@
 
 from __future__ import annotations
 
-import sys
-from datetime import timezone
 from typing import TYPE_CHECKING, Any
 
+import grpc
 from google.protobuf import struct_pb2
 
+from delos.models._base import construct_trusted
 from delos.models.datasets import (
     Dataset,
     DatasetSchema,
@@ -16,36 +16,62 @@ from delos.models.datasets import (
     ExampleSource,
     SchemaField,
 )
+from delos.services._converters import build_converter
+from delos.services._struct import struct_to_dict
 from delos.services.base import BaseClient
 
 if TYPE_CHECKING:
-    from delos.config import ServiceEndpoint
+    from collections.abc import Iterator
+
+    from google.protobuf.internal.containers import RepeatedCompositeFieldContainer
 
-sys.path.insert(0, "gen/python")
+    from delos.config import ServiceEndpoint
 
 try:
-    from datasets.v1 import datasets_pb2, datasets_pb2_grpc
+    from delos._gen.datasets.v1 import datasets_pb2, datasets_pb2_grpc
 except ImportError:
     datasets_pb2 = None  # type: ignore
     datasets_pb2_grpc = None  # type: ignore
 
+if datasets_pb2 is not None:
+    # Enum <-> protobuf tables, built once rather than on every conversion.
+    # Protobuf enum values run contiguously from 0, so the reverse lookup is a
+    # tuple indexed by value.
+    _SOURCE_TO_PB = {
+        ExampleSource.UNSPECIFIED: datasets_pb2.EXAMPLE_SOURCE_UNSPECIFIED,
+        ExampleSource.MANUAL: datasets_pb2.EXAMPLE_SOURCE_MANUAL,
+        ExampleSource.GENERATED: datasets_pb2.EXAMPLE_SOURCE_GENERATED,
+        ExampleSource.PRODUCTION: datasets_pb2.EXAMPLE_SOURCE_PRODUCTION,
+        ExampleSource.IMPORTED: datasets_pb2.EXAMPLE_SOURCE_IMPORTED,
+    }
+    _SOURCE_FROM_PB = tuple(sorted(_SOURCE_TO_PB, key=_SOURCE_TO_PB.__getitem__))
+    _SOURCE_UNSPECIFIED = datasets_pb2.EXAMPLE_SOURCE_UNSPECIFIED
+
+# add_examples streams inputs larger than this, in batches of the given size;
+# smaller inputs are not worth the stream setup.
+_STREAM_THRESHOLD = 64
+_STREAM_BATCH_SIZE = 256
+
 
 class DatasetsClient(BaseClient):
     """Client for the datasets service."""
 
-    def __init__(self, endpoint: ServiceEndpoint, timeout: float = 30.0) -> None:
+    def __init__(
+        self, endpoint: ServiceEndpoint, timeout: float = 30.0, pool_size: int = 1
+    ) -> None:
         """Initialize the datasets client."""
-        super().__init__(endpoint, timeout)
-        self._stub: datasets_pb2_grpc.DatasetsServiceStub | None = None
+        super().__init__(endpoint, timeout, pool_size)
+        self._stubs: Iterator[datasets_pb2_grpc.DatasetsServiceStub] | None = None
 
     @property
     def stub(self) -> datasets_pb2_grpc.DatasetsServiceStub:
-        """Get the gRPC stub."""
-        if self._stub is None:
+        """Get the gRPC stub for the next pooled channel."""
+        stubs = self._stubs
+        if stubs is None:
             if datasets_pb2_grpc is None:
-                raise ImportError("Generated protobuf code not found. Run 'buf generate' first.")
-            self._stub = datasets_pb2_grpc.DatasetsServiceStub(self.channel)
-        return self._stub
+                raise ImportError("Generated protobuf code not found. Run 'make proto' first.")
+            stubs = self._stubs = self._stub_cycle(datasets_pb2_grpc.DatasetsServiceStub)
+        return next(stubs)
 
     def create(
         self,
@@ -72,9 +98,10 @@ class DatasetsClient(BaseClient):
         """
         pb_schema = None
         if schema:
+            schema_field = datasets_pb2.SchemaField
             pb_schema = datasets_pb2.DatasetSchema(
                 input_fields=[
-                    datasets_pb2.SchemaField(
+                    schema_field(
                         name=f.name,
                         type=f.type,
                         description=f.description,
@@ -83,7 +110,7 @@ class DatasetsClient(BaseClient):
                     for f in schema.input_fields
                 ],
                 expected_output_fields=[
-                    datasets_pb2.SchemaField(
+                    schema_field(
                         name=f.name,
                         type=f.type,
                         description=f.description,
@@ -110,9 +137,11 @@ class DatasetsClient(BaseClient):
         request = datasets_pb2.GetDatasetRequest(id=id)
         try:
             response = self.stub.GetDataset(request, timeout=self._timeout)
-            return self._to_dataset(response.dataset)
-        except Exception:
-            return None
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+        return self._to_dataset(response.dataset)
 
     def update(
         self,
@@ -158,7 +187,7 @@ class DatasetsClient(BaseClient):
             offset=offset,
         )
         response = self.stub.ListDatasets(request, timeout=self._timeout)
-        datasets = [self._to_dataset(d) for d in response.datasets]
+        datasets = list(map(self._to_dataset, response.datasets))
         return datasets, response.total_count
 
     def add_examples(
@@ -166,25 +195,55 @@ class DatasetsClient(BaseClient):
         dataset_id: str,
         examples: list[ExampleInput],
     ) -> tuple[list[Example], int]:
-        """Add examples to a dataset."""
-        pb_examples = []
-        for ex in examples:
-            pb_ex = datasets_pb2.ExampleInput(
-                input=self._dict_to_struct(ex.input),
-                expected_output=self._dict_to_struct(ex.expected_output),
-                metadata=ex.metadata,
-                source=self._source_to_pb(ex.source),
-            )
-            pb_examples.append(pb_ex)
+        """Add examples to a dataset.
 
-        request = datasets_pb2.AddExamplesRequest(
-            dataset_id=dataset_id,
-            examples=pb_examples,
-        )
-        response = self.stub.AddExamples(request, timeout=self._timeout)
-        examples_out = [self._to_example(e) for e in response.examples]
+        Large inputs are sent as a client stream of batches, so examples are
+        converted and sent incrementally instead of as one large request. The
+        service stores them together when the stream ends: either every
+        example is added or, on error, none is. The response still lists
+        every added example. One call may add at most 50,000 examples; split
+        larger imports across several calls.
+        """
+        if len(examples) <= _STREAM_THRESHOLD:
+            request = datasets_pb2.AddExamplesRequest(dataset_id=dataset_id)
+            self._add_example_inputs(request.examples, examples)
+            response = self.stub.AddExamples(request, timeout=self._timeout)
+        else:
+            response = self.stub.AddExamplesStream(
+                self._example_batches(dataset_id, examples), timeout=self._timeout
+            )
+        examples_out = list(map(self._to_example, response.examples))
         return examples_out, response.added_count
 
+    def _example_batches(
+        self, dataset_id: str, examples: list[ExampleInput]
+    ) -> Iterator[datasets_pb2.AddExamplesStreamRequest]:
+        """Yield stream requests carrying the examples in fixed-size batches."""
+        for start in range(0, len(examples), _STREAM_BATCH_SIZE):
+            request = datasets_pb2.AddExamplesStreamRequest(dataset_id=dataset_id)
+            self._add_example_inputs(request.examples, examples[start : start + _STREAM_BATCH_SIZE])
+            yield request
+
+    def _add_example_inputs(
+        self,
+        field: RepeatedCompositeFieldContainer[datasets_pb2.ExampleInput],
+        examples: list[ExampleInput],
+    ) -> None:
+        """Append example inputs to a request's repeated field.
+
+        Each element is filled in place; building standalone messages and
+        passing them to the request constructor would copy every example.
+        """
+        add = field.add
+        source_to_pb = self._source_to_pb
+        fill_struct = self._fill_struct
+        for ex in examples:
+            pb = add(source=source_to_pb(ex.source))
+            if ex.metadata:
+                pb.metadata.update(ex.metadata)
+            fill_struct(pb.input, ex.input)
+            fill_struct(pb.expected_output, ex.expected_output)
+
     def get_examples(
         self,
         dataset_id: str,
@@ -201,7 +260,7 @@ class DatasetsClient(BaseClient):
             shuffle=shuffle,
         )
         response = self.stub.GetExamples(request, timeout=self._timeout)
-        examples = [self._to_example(e) for e in response.examples]
+        examples = list(map(self._to_example, response.examples))
         return examples, response.total_count
 
     def remove_examples(self, dataset_id: str, example_ids: list[str]) -> int:
@@ -213,87 +272,73 @@ class DatasetsClient(BaseClient):
         response = self.stub.RemoveExamples(request, timeout=self._timeout)
         return response.removed_count
 
-    def _to_dataset(self, pb: datasets_pb2.Dataset) -> Dataset:
-        """Convert protobuf to model."""
-        schema = None
-        if pb.HasField("schema"):
-            schema = DatasetSchema(
-                input_fields=[
-                    SchemaField(
-                        name=f.name,
-                        type=f.type,
-                        description=f.description,
-                        required=f.required,
-                    )
-                    for f in pb.schema.input_fields
-                ],
-                expected_output_fields=[
-                    SchemaField(
-                        name=f.name,
-                        type=f.type,
-                        description=f.description,
-                        required=f.required,
-                    )
-                    for f in pb.schema.expected_output_fields
-                ],
-            )
-
-        return Dataset(
-            id=pb.id,
-            name=pb.name,
-            description=pb.description,
-            prompt_id=pb.prompt_id,
-            schema_=schema,
-            example_count=pb.example_count,
-            last_updated=pb.last_updated.ToDatetime(timezone.utc) if pb.HasField("last_updated") else None,
-            tags=list(pb.tags),
-            metadata=dict(pb.metadata),
-            version=pb.version,
-            created_by=pb.created_by,
-            created_at=pb.created_at.ToDatetime(timezone.utc) if pb.HasField("created_at") else None,
-        )
-
-    def _to_example(self, pb: datasets_pb2.Example) -> Example:
-        """Convert protobuf example to model."""
-        return Example(
-            id=pb.id,
-            dataset_id=pb.dataset_id,
-            input=self._struct_to_dict(pb.input),
-            expected_output=self._struct_to_dict(pb.expected_output),
-            metadata=dict(pb.metadata),
-            source=self._source_from_pb(pb.source),
-            created_at=pb.created_at.ToDatetime(timezone.utc) if pb.HasField("created_at") else None,
+    @staticmethod
+    def _to_schema(pb: datasets_pb2.DatasetSchema) -> DatasetSchema:
+        """Convert protobuf schema to model."""
+        return construct_trusted(
+            DatasetSchema,
+            input_fields=[
+                construct_trusted(
+                    SchemaField,
+                    name=f.name,
+                    type=f.type,
+                    description=f.description,
+                    required=f.required,
+                )
+                for f in pb.input_fields
+            ],
+            expected_output_fields=[
+                construct_trusted(
+                    SchemaField,
+                    name=f.name,
+                    type=f.type,
+                    description=f.description,
+                    required=f.required,
+                )
+                for f in pb.expected_output_fields
+            ],
         )
 
-    def _dict_to_struct(self, d: dict[str, Any]) -> struct_pb2.Struct:
-        """Convert dict to protobuf Struct."""
-        struct = struct_pb2.Struct()
-        struct.update(d)
-        return struct
+    def _fill_struct(self, struct: struct_pb2.Struct, d: dict[str, Any]) -> None:
+        """Populate a message's Struct field in place from a dict.
 
-    def _struct_to_dict(self, struct: struct_pb2.Struct) -> dict[str, Any]:
-        """Convert protobuf Struct to dict."""
-        from google.protobuf.json_format import MessageToDict
-        return MessageToDict(struct)
+        Writing into the parent's field avoids building a temporary Struct
+        that the message constructor would then copy.
+        """
+        struct.SetInParent()
+        if d:
+            struct.update(d)
 
     def _source_to_pb(self, source: ExampleSource) -> int:
         """Convert ExampleSource to protobuf."""
-        mapping = {
-            ExampleSource.UNSPECIFIED: datasets_pb2.EXAMPLE_SOURCE_UNSPECIFIED,
-            ExampleSource.MANUAL: datasets_pb2.EXAMPLE_SOURCE_MANUAL,
-            ExampleSource.GENERATED: datasets_pb2.EXAMPLE_SOURCE_GENERATED,
-            ExampleSource.PRODUCTION: datasets_pb2.EXAMPLE_SOURCE_PRODUCTION,
-            ExampleSource.IMPORTED: datasets_pb2.EXAMPLE_SOURCE_IMPORTED,
-        }
-        return mapping.get(source, datasets_pb2.EXAMPLE_SOURCE_UNSPECIFIED)
-
-    def _source_from_pb(self, source: int) -> ExampleSource:
+        return _SOURCE_TO_PB.get(source, _SOURCE_UNSPECIFIED)
+
+    @staticmethod
+    def _source_from_pb(source: int) -> ExampleSource:
         """Convert protobuf to ExampleSource."""
-        mapping = {
-            datasets_pb2.EXAMPLE_SOURCE_UNSPECIFIED: ExampleSource.UNSPECIFIED,
-            datasets_pb2.EXAMPLE_SOURCE_MANUAL: ExampleSource.MANUAL,
-            datasets_pb2.EXAMPLE_SOURCE_GENERATED: ExampleSource.GENERATED,
-            datasets_pb2.EXAMPLE_SOURCE_PRODUCTION: ExampleSource.PRODUCTION,
-            datasets_pb2.EXAMPLE_SOURCE_IMPORTED: ExampleSource.IMPORTED,
-        }
-        return mapping.get(source, ExampleSource.UNSPECIFIED)
+        if 0 <= source < len(_SOURCE_FROM_PB):
+            return _SOURCE_FROM_PB[source]
+        return ExampleSource.UNSPECIFIED
+
+    if datasets_pb2 is not None:
+        # Converters for the top-level messages, compiled from their descriptors.
+        _to_dataset = staticmethod(
+            build_converter(
+                datasets_pb2.Dataset.DESCRIPTOR,
+                Dataset,
+                {"schema_": '_to_schema(pb.schema) if pb.HasField("schema") else None'},
+                {"_to_schema": _to_schema},
+            )
+        )
+        _to_example = staticmethod(
+            build_converter(
+                datasets_pb2.Example.DESCRIPTOR,
+                Example,
+                {
+                    "input": "_struct_to_dict(pb.input)",
+                    "expected_output": "_struct_to_dict(pb.expected_output)",
+                    "source": "_source_from_pb(pb.source)",
+                },
+                {"_struct_to_dict": struct_to_dict, "_source_from_pb": _source_from_pb},
+            )
+        )
@@ -2,10 +2,11 @@
 
 from __future__ import annotations
 
-import sys
-from datetime import timezone
 from typing import TYPE_CHECKING
 
+import grpc
+
+from delos.models._base import construct_trusted
 from delos.models.deploy import (
     ConditionResult,
     Deployment,
@@ -18,36 +19,69 @@ from delos.models.deploy import (
     QualityGateResult,
     RolloutProgress,
 )
+from delos.services._converters import build_converter
+from delos.services._timestamp import timestamp_to_datetime
 from delos.services.base import BaseClient
 
 if TYPE_CHECKING:
-    from delos.config import ServiceEndpoint
+    from collections.abc import Iterator
 
-sys.path.insert(0, "gen/python")
+    from delos.config import ServiceEndpoint
 
 try:
-    from deploy.v1 import deploy_pb2, deploy_pb2_grpc
+    from delos._gen.deploy.v1 import deploy_pb2, deploy_pb2_grpc
 except ImportError:
     deploy_pb2 = None  # type: ignore
     deploy_pb2_grpc = None  # type: ignore
 
+if deploy_pb2 is not None:
+    # Enum <-> protobuf tables, built once rather than on every conversion.
+    # Protobuf enum values run contiguously from 0, so the reverse lookup is a
+    # tuple indexed by value.
+    _TYPE_TO_PB = {
+        DeploymentType.UNSPECIFIED: deploy_pb2.DEPLOYMENT_TYPE_UNSPECIFIED,
+        DeploymentType.IMMEDIATE: deploy_pb2.DEPLOYMENT_TYPE_IMMEDIATE,
+        DeploymentType.GRADUAL: deploy_pb2.DEPLOYMENT_TYPE_GRADUAL,
+        DeploymentType.CANARY: deploy_pb2.DEPLOYMENT_TYPE_CANARY,
+        DeploymentType.BLUE_GREEN: deploy_pb2.DEPLOYMENT_TYPE_BLUE_GREEN,
+    }
+    _TYPE_FROM_PB = tuple(sorted(_TYPE_TO_PB, key=_TYPE_TO_PB.__getitem__))
+    _TYPE_UNSPECIFIED = deploy_pb2.DEPLOYMENT_TYPE_UNSPECIFIED
+
+    _STATUS_TO_PB = {
+        DeploymentStatus.UNSPECIFIED: deploy_pb2.DEPLOYMENT_STATUS_UNSPECIFIED,
+        DeploymentStatus.PENDING_APPROVAL: deploy_pb2.DEPLOYMENT_STATUS_PENDING_APPROVAL,
+        DeploymentStatus.PENDING_GATES: deploy_pb2.DEPLOYMENT_STATUS_PENDING_GATES,
+        DeploymentStatus.GATES_FAILED: deploy_pb2.DEPLOYMENT_STATUS_GATES_FAILED,
+        DeploymentStatus.IN_PROGRESS: deploy_pb2.DEPLOYMENT_STATUS_IN_PROGRESS,
+        DeploymentStatus.COMPLETED: deploy_pb2.DEPLOYMENT_STATUS_COMPLETED,
+        DeploymentStatus.ROLLED_BACK: deploy_pb2.DEPLOYMENT_STATUS_ROLLED_BACK,
+        DeploymentStatus.CANCELLED: deploy_pb2.DEPLOYMENT_STATUS_CANCELLED,
+        DeploymentStatus.FAILED: deploy_pb2.DEPLOYMENT_STATUS_FAILED,
+    }
+    _STATUS_FROM_PB = tuple(sorted(_STATUS_TO_PB, key=_STATUS_TO_PB.__getitem__))
+    _STATUS_UNSPECIFIED = deploy_pb2.DEPLOYMENT_STATUS_UNSPECIFIED
+
 
 class DeployClient(BaseClient):
     """Client for the deploy service."""
 
-    def __init__(self, endpoint: ServiceEndpoint, timeout: float = 30.0) -> None:
+    def __init__(
+        self, endpoint: ServiceEndpoint, timeout: float = 30.0, pool_size: int = 1
+    ) -> None:
         """Initialize the deploy client."""
-        super().__init__(endpoint, timeout)
-        self._stub: deploy_pb2_grpc.DeployServiceStub | None = None
+        super().__init__(endpoint, timeout, pool_size)
+        self._stubs: Iterator[deploy_pb2_grpc.DeployServiceStub] | None = None
 
     @property
     def stub(self) -> deploy_pb2_grpc.DeployServiceStub:
-        """Get the gRPC stub."""
-        if self._stub is None:
+        """Get the gRPC stub for the next pooled channel."""
+        stubs = self._stubs
+        if stubs is None:
             if deploy_pb2_grpc is None:
-                raise ImportError("Generated protobuf code not found. Run 'buf generate' first.")
-            self._stub = deploy_pb2_grpc.DeployServiceStub(self.channel)
-        return self._stub
+                raise ImportError("Generated protobuf code not found. Run 'make proto' first.")
+            stubs = self._stubs = self._stub_cycle(deploy_pb2_grpc.DeployServiceStub)
+        return next(stubs)
 
     def create(
         self,
@@ -87,10 +121,12 @@ class DeployClient(BaseClient):
         """Get a deployment by ID."""
         request = deploy_pb2.GetDeploymentRequest(id=id)
         try:
-            response = self.stub.GetDeployment(request, timeout=self._timeout)
-            return self._to_deployment(response.deployment)
-        except Exception:
-            return None
+            response = self._keyed_stub(self.stub, id).GetDeployment(request, timeout=self._timeout)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+        return self._to_deployment(response.deployment)
 
     def list(
         self,
@@ -110,7 +146,7 @@ class DeployClient(BaseClient):
             offset=offset,
         )
         response = self.stub.ListDeployments(request, timeout=self._timeout)
-        deployments = [self._to_deployment(d) for d in response.deployments]
+        deployments = list(map(self._to_deployment, response.deployments))
         return deployments, response.total_count
 
     def approve(self, id: str, *, comment: str = "") -> Deployment:
@@ -139,22 +175,14 @@ class DeployClient(BaseClient):
     ) -> tuple[DeploymentStatus, RolloutProgress | None, list[QualityGateResult]]:
         """Get real-time deployment status."""
         request = deploy_pb2.GetDeploymentStatusRequest(id=id)
-        response = self.stub.GetDeploymentStatus(request, timeout=self._timeout)
+        stub = self._keyed_stub(self.stub, id)
+        response = stub.GetDeploymentStatus(request, timeout=self._timeout)
 
         rollout = None
         if response.HasField("rollout"):
-            rollout = RolloutProgress(
-                current_percentage=response.rollout.current_percentage,
-                target_percentage=response.rollout.target_percentage,
-                last_increment_at=response.rollout.last_increment_at.ToDatetime(timezone.utc)
-                if response.rollout.HasField("last_increment_at")
-                else None,
-                next_increment_at=response.rollout.next_increment_at.ToDatetime(timezone.utc)
-                if response.rollout.HasField("next_increment_at")
-                else None,
-            )
+            rollout = self._to_rollout(response.rollout)
 
-        gate_results = [self._to_gate_result(r) for r in response.gate_results]
+        gate_results = list(map(self._to_gate_result, response.gate_results))
         return self._status_from_pb(response.status), rollout, gate_results
 
     def create_quality_gate(
@@ -166,18 +194,17 @@ class DeployClient(BaseClient):
         required: bool = True,
     ) -> QualityGate:
         """Create a quality gate."""
-        pb_conditions = []
-        if conditions:
-            for c in conditions:
-                pb_conditions.append(
-                    deploy_pb2.GateCondition(
-                        type=c.type,
-                        operator=c.operator,
-                        threshold=c.threshold,
-                        eval_run_id=c.eval_run_id,
-                        dataset_id=c.dataset_id,
-                    )
-                )
+        gate_condition = deploy_pb2.GateCondition
+        pb_conditions = [
+            gate_condition(
+                type=c.type,
+                operator=c.operator,
+                threshold=c.threshold,
+                eval_run_id=c.eval_run_id,
+                dataset_id=c.dataset_id,
+            )
+            for c in conditions or ()
+        ]
 
         request = deploy_pb2.CreateQualityGateRequest(
             name=name,
@@ -192,80 +219,41 @@ class DeployClient(BaseClient):
         """List quality gates for a prompt."""
         request = deploy_pb2.ListQualityGatesRequest(prompt_id=prompt_id)
         response = self.stub.ListQualityGates(request, timeout=self._timeout)
-        return [self._to_quality_gate(g) for g in response.quality_gates]
-
-    def _to_deployment(self, pb: deploy_pb2.Deployment) -> Deployment:
-        """Convert protobuf to model."""
-        strategy = None
-        if pb.HasField("strategy"):
-            strategy = DeploymentStrategy(
-                type=self._type_from_pb(pb.strategy.type),
-                initial_percentage=pb.strategy.initial_percentage,
-                increment=pb.strategy.increment,
-                interval_seconds=pb.strategy.interval_seconds,
-                auto_rollback=pb.strategy.auto_rollback,
-                rollback_threshold=pb.strategy.rollback_threshold,
-            )
-
-        rollout = None
-        if pb.HasField("rollout"):
-            rollout = RolloutProgress(
-                current_percentage=pb.rollout.current_percentage,
-                target_percentage=pb.rollout.target_percentage,
-                last_increment_at=pb.rollout.last_increment_at.ToDatetime(timezone.utc)
-                if pb.rollout.HasField("last_increment_at")
-                else None,
-                next_increment_at=pb.rollout.next_increment_at.ToDatetime(timezone.utc)
-                if pb.rollout.HasField("next_increment_at")
-                else None,
-            )
-
-        return Deployment(
-            id=pb.id,
-            prompt_id=pb.prompt_id,
-            from_version=pb.from_version,
-            to_version=pb.to_version,
-            environment=pb.environment,
-            strategy=strategy,
-            status=self._status_from_pb(pb.status),
-            status_message=pb.status_message,
-            gate_results=[self._to_gate_result(r) for r in pb.gate_results],
-            gates_passed=pb.gates_passed,
-            rollout=rollout,
-            created_at=pb.created_at.ToDatetime(timezone.utc) if pb.HasField("created_at") else None,
-            started_at=pb.started_at.ToDatetime(timezone.utc) if pb.HasField("started_at") else None,
-            completed_at=pb.completed_at.ToDatetime(timezone.utc) if pb.HasField("completed_at") else None,
-            created_by=pb.created_by,
-            approved_by=pb.approved_by,
-            metadata=dict(pb.metadata),
-        )
+        return list(map(self._to_quality_gate, response.quality_gates))
 
-    def _to_gate_result(self, pb: deploy_pb2.QualityGateResult) -> QualityGateResult:
+    @staticmethod
+    def _to_gate_result(pb: deploy_pb2.QualityGateResult) -> QualityGateResult:
         """Convert protobuf gate result to model."""
-        return QualityGateResult(
+        return construct_trusted(
+            QualityGateResult,
             gate_id=pb.gate_id,
             gate_name=pb.gate_name,
             passed=pb.passed,
             message=pb.message,
-            condition_results=[
-                ConditionResult(
+            condition_results=tuple(
+                construct_trusted(
+                    ConditionResult,
                     type=c.type,
                     expected=c.expected,
                     actual=c.actual,
                     passed=c.passed,
                 )
                 for c in pb.condition_results
-            ],
+            )
+            if pb.condition_results
+            else (),
         )
 
     def _to_quality_gate(self, pb: deploy_pb2.QualityGate) -> QualityGate:
         """Convert protobuf quality gate to model."""
-        return QualityGate(
+        return construct_trusted(
+            QualityGate,
             id=pb.id,
             name=pb.name,
             prompt_id=pb.prompt_id,
-            conditions=[
-                GateCondition(
+            conditions=tuple(
+                construct_trusted(
+                    GateCondition,
                     type=c.type,
                     operator=c.operator,
                     threshold=c.threshold,
@@ -273,60 +261,66 @@ class DeployClient(BaseClient):
                     dataset_id=c.dataset_id,
                 )
                 for c in pb.conditions
-            ],
+            )
+            if pb.conditions
+            else (),
             required=pb.required,
-            created_at=pb.created_at.ToDatetime(timezone.utc) if pb.HasField("created_at") else None,
+            created_at=timestamp_to_datetime(pb.created_at),
             created_by=pb.created_by,
         )
 
     def _type_to_pb(self, t: DeploymentType) -> int:
         """Convert DeploymentType to protobuf."""
-        mapping = {
-            DeploymentType.UNSPECIFIED: deploy_pb2.DEPLOYMENT_TYPE_UNSPECIFIED,
-            DeploymentType.IMMEDIATE: deploy_pb2.DEPLOYMENT_TYPE_IMMEDIATE,
-            DeploymentType.GRADUAL: deploy_pb2.DEPLOYMENT_TYPE_GRADUAL,
-            DeploymentType.CANARY: deploy_pb2.DEPLOYMENT_TYPE_CANARY,
-            DeploymentType.BLUE_GREEN: deploy_pb2.DEPLOYMENT_TYPE_BLUE_GREEN,
-        }
-        return mapping.get(t, deploy_pb2.DEPLOYMENT_TYPE_UNSPECIFIED)
-
-    def _type_from_pb(self, t: int) -> DeploymentType:
+        return _TYPE_TO_PB.get(t, _TYPE_UNSPECIFIED)
+
+    @staticmethod
+    def _type_from_pb(t: int) -> DeploymentType:
         """Convert protobuf to DeploymentType."""
-        mapping = {
-            deploy_pb2.DEPLOYMENT_TYPE_UNSPECIFIED: DeploymentType.UNSPECIFIED,
-            deploy_pb2.DEPLOYMENT_TYPE_IMMEDIATE: DeploymentType.IMMEDIATE,
-            deploy_pb2.DEPLOYMENT_TYPE_GRADUAL: DeploymentType.GRADUAL,
-            deploy_pb2.DEPLOYMENT_TYPE_CANARY: DeploymentType.CANARY,
-            deploy_pb2.DEPLOYMENT_TYPE_BLUE_GREEN: DeploymentType.BLUE_GREEN,
-        }
-        return mapping.get(t, DeploymentType.UNSPECIFIED)
+        if 0 <= t < len(_TYPE_FROM_PB):
+            return _TYPE_FROM_PB[t]
+        return DeploymentType.UNSPECIFIED
 
     def _status_to_pb(self, s: DeploymentStatus) -> int:
         """Convert DeploymentStatus to protobuf."""
-        mapping = {
-            DeploymentStatus.UNSPECIFIED: deploy_pb2.DEPLOYMENT_STATUS_UNSPECIFIED,
-            DeploymentStatus.PENDING_APPROVAL: deploy_pb2.DEPLOYMENT_STATUS_PENDING_APPROVAL,
-            DeploymentStatus.PENDING_GATES: deploy_pb2.DEPLOYMENT_STATUS_PENDING_GATES,
-            DeploymentStatus.GATES_FAILED: deploy_pb2.DEPLOYMENT_STATUS_GATES_FAILED,
-            DeploymentStatus.IN_PROGRESS: deploy_pb2.DEPLOYMENT_STATUS_IN_PROGRESS,
-            DeploymentStatus.COMPLETED: deploy_pb2.DEPLOYMENT_STATUS_COMPLETED,
-            DeploymentStatus.ROLLED_BACK: deploy_pb2.DEPLOYMENT_STATUS_ROLLED_BACK,
-            DeploymentStatus.CANCELLED: deploy_pb2.DEPLOYMENT_STATUS_CANCELLED,
-            DeploymentStatus.FAILED: deploy_pb2.DEPLOYMENT_STATUS_FAILED,
-        }
-        return mapping.get(s, deploy_pb2.DEPLOYMENT_STATUS_UNSPECIFIED)
-
-    def _status_from_pb(self, s: int) -> DeploymentStatus:
+        return _STATUS_TO_PB.get(s, _STATUS_UNSPECIFIED)
+
+    @staticmethod
+    def _status_from_pb(s: int) -> DeploymentStatus:
         """Convert protobuf to DeploymentStatus."""
-        mapping = {
-            deploy_pb2.DEPLOYMENT_STATUS_UNSPECIFIED: DeploymentStatus.UNSPECIFIED,
-            deploy_pb2.DEPLOYMENT_STATUS_PENDING_APPROVAL: DeploymentStatus.PENDING_APPROVAL,
-            deploy_pb2.DEPLOYMENT_STATUS_PENDING_GATES: DeploymentStatus.PENDING_GATES,
-            deploy_pb2.DEPLOYMENT_STATUS_GATES_FAILED: DeploymentStatus.GATES_FAILED,
-            deploy_pb2.DEPLOYMENT_STATUS_IN_PROGRESS: DeploymentStatus.IN_PROGRESS,
-            deploy_pb2.DEPLOYMENT_STATUS_COMPLETED: DeploymentStatus.COMPLETED,
-            deploy_pb2.DEPLOYMENT_STATUS_ROLLED_BACK: DeploymentStatus.ROLLED_BACK,
-            deploy_pb2.DEPLOYMENT_STATUS_CANCELLED: DeploymentStatus.CANCELLED,
-            deploy_pb2.DEPLOYMENT_STATUS_FAILED: DeploymentStatus.FAILED,
-        }
-        return mapping.get(s, DeploymentStatus.UNSPECIFIED)
+        if 0 <= s < len(_STATUS_FROM_PB):
+            return _STATUS_FROM_PB[s]
+        return DeploymentStatus.UNSPECIFIED
+
+    if deploy_pb2 is not None:
+        # Converters for the deployment messages, compiled from their descriptors.
+        _to_strategy = staticmethod(
+            build_converter(
+                deploy_pb2.DeploymentStrategy.DESCRIPTOR,
+                DeploymentStrategy,
+                {"type": "_type_from_pb(pb.type)"},
+                {"_type_from_pb": _type_from_pb},
+            )
+        )
+        _to_rollout = staticmethod(
+            build_converter(deploy_pb2.RolloutProgress.DESCRIPTOR, RolloutProgress)
+        )
+        _to_deployment = staticmethod(
+            build_converter(
+                deploy_pb2.Deployment.DESCRIPTOR,
+                Deployment,
+                {
+                    "strategy": '_to_strategy(pb.strategy) if pb.HasField("strategy") else None',
+                    "status": "_status_from_pb(pb.status)",
+                    "gate_results": (
+                        "tuple(map(_to_gate_result, pb.gate_results)) if pb.gate_results else ()"
+                    ),
+                    "rollout": '_to_rollout(pb.rollout) if pb.HasField("rollout") else None',
+                },
+                {
+                    "_to_strategy": _to_strategy,
+                    "_to_rollout": _to_rollout,
+                    "_status_from_pb": _status_from_pb,
+                    "_to_gate_result": _to_gate_result,
+                },
+            )
+        )
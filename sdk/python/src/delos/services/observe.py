@@ -2,41 +2,151 @@
 
 from __future__ import annotations
 
-import sys
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING
 
-from delos.models.observe import Span, SpanKind, SpanStatus, Trace
-from delos.services.base import BaseClient
+import grpc
+
+from delos.models._base import construct_trusted
+from delos.models.common import EMPTY_MAP, SmallMap
+from delos.models.observe import Span, SpanStatus, Trace
+from delos.services._timestamp import (
+    UNIX_EPOCH,
+    duration_to_timedelta,
+    timestamp_to_datetime,
+)
+from delos.services.base import AsyncBaseClient, BaseClient
 
 if TYPE_CHECKING:
-    from delos.config import ServiceEndpoint
+    from collections.abc import Iterator
 
-sys.path.insert(0, "gen/python")
+    from delos.config import ServiceEndpoint
 
 try:
-    from observe.v1 import observe_pb2, observe_pb2_grpc
+    from delos._gen.observe.v1 import observe_pb2, observe_pb2_grpc
 except ImportError:
     observe_pb2 = None  # type: ignore
     observe_pb2_grpc = None  # type: ignore
 
+if observe_pb2 is not None:
+    # Enum <-> protobuf tables, built once rather than on every conversion.
+    # Protobuf enum values run contiguously from 0, so the reverse lookup is a
+    # tuple indexed by value. An unset span status is SPAN_STATUS_UNSPECIFIED.
+    _STATUS_TO_PB = {
+        SpanStatus.UNSET: observe_pb2.SPAN_STATUS_UNSPECIFIED,
+        SpanStatus.OK: observe_pb2.SPAN_STATUS_OK,
+        SpanStatus.ERROR: observe_pb2.SPAN_STATUS_ERROR,
+    }
+    _STATUS_FROM_PB = tuple(sorted(_STATUS_TO_PB, key=_STATUS_TO_PB.__getitem__))
+    _STATUS_UNSPECIFIED = observe_pb2.SPAN_STATUS_UNSPECIFIED
+
+
+class _ObserveClientBase:
+    """Converters and request builders shared by the sync and async observe clients."""
+
+    def _ingest_request(self, spans: list[Span]) -> observe_pb2.IngestTracesRequest:
+        """Build the request ingesting the given spans."""
+        request = observe_pb2.IngestTracesRequest()
+        add = request.spans.add
+        status_to_pb = self._status_to_pb
+        for span in spans:
+            # Fill each span in place in the request; proto3 defaults are skipped.
+            pb_span = add(
+                trace_id=span.trace_id,
+                span_id=span.span_id,
+                name=span.name,
+                service_name=span.service_name,
+                status=status_to_pb(span.status),
+            )
+            if span.parent_span_id:
+                pb_span.parent_span_id = span.parent_span_id
+            if span.attributes:
+                pb_span.attributes.update(span.attributes)
+            pb_span.start_time.FromDatetime(span.start_time)
+            if span.end_time is not None:
+                pb_span.duration.FromTimedelta(span.end_time - span.start_time)
+        return request
+
+    @staticmethod
+    def _query_request(
+        service_name: str, start_time: datetime | None, end_time: datetime | None, limit: int
+    ) -> observe_pb2.QueryTracesRequest:
+        """Build the request for a trace query."""
+        request = observe_pb2.QueryTracesRequest(
+            service_name=service_name,
+            limit=limit,
+        )
+        if start_time:
+            request.start_time.FromDatetime(start_time)
+        if end_time:
+            request.end_time.FromDatetime(end_time)
+        return request
+
+    def _to_trace(self, pb: observe_pb2.Trace) -> Trace:
+        """Convert protobuf to model."""
+        spans = list(map(self._to_span, pb.spans))
+        start_time = timestamp_to_datetime(pb.start_time)
+        duration = duration_to_timedelta(pb.duration)
+        return construct_trusted(
+            Trace,
+            trace_id=pb.trace_id,
+            spans=spans,
+            service_name=pb.root_service,
+            start_time=start_time,
+            end_time=start_time + duration if start_time and duration else None,
+        )
+
+    def _to_span(self, pb: observe_pb2.Span) -> Span:
+        """Convert protobuf span to model.
 
-class ObserveClient(BaseClient):
+        The proto carries no span kind or status message, so those keep their
+        model defaults. A span without a duration has no end time.
+        """
+        start_time = timestamp_to_datetime(pb.start_time) or UNIX_EPOCH
+        duration = duration_to_timedelta(pb.duration)
+        return construct_trusted(
+            Span,
+            trace_id=pb.trace_id,
+            span_id=pb.span_id,
+            parent_span_id=pb.parent_span_id or None,
+            name=pb.name,
+            start_time=start_time,
+            end_time=start_time + duration if duration is not None else None,
+            status=self._status_from_pb(pb.status),
+            attributes=SmallMap(pb.attributes) if pb.attributes else EMPTY_MAP,
+            service_name=pb.service_name,
+        )
+
+    def _status_to_pb(self, status: SpanStatus) -> int:
+        """Convert SpanStatus to protobuf."""
+        return _STATUS_TO_PB.get(status, _STATUS_UNSPECIFIED)
+
+    def _status_from_pb(self, status: int) -> SpanStatus:
+        """Convert protobuf to SpanStatus."""
+        if 0 <= status < len(_STATUS_FROM_PB):
+            return _STATUS_FROM_PB[status]
+        return SpanStatus.UNSET
+
+
+class ObserveClient(_ObserveClientBase, BaseClient):
     """Client for the observe service."""
 
-    def __init__(self, endpoint: ServiceEndpoint, timeout: float = 30.0) -> None:
+    def __init__(
+        self, endpoint: ServiceEndpoint, timeout: float = 30.0, pool_size: int = 1
+    ) -> None:
         """Initialize the observe client."""
-        super().__init__(endpoint, timeout)
-        self._stub: observe_pb2_grpc.ObserveServiceStub | None = None
+        super().__init__(endpoint, timeout, pool_size)
+        self._stubs: Iterator[observe_pb2_grpc.ObserveServiceStub] | None = None
 
     @property
     def stub(self) -> observe_pb2_grpc.ObserveServiceStub:
-        """Get the gRPC stub."""
-        if self._stub is None:
+        """Get the gRPC stub for the next pooled channel."""
+        stubs = self._stubs
+        if stubs is None:
             if observe_pb2_grpc is None:
-                raise ImportError("Generated protobuf code not found. Run 'buf generate' first.")
-            self._stub = observe_pb2_grpc.ObserveServiceStub(self.channel)
-        return self._stub
+                raise ImportError("Generated protobuf code not found. Run 'make proto' first.")
+            stubs = self._stubs = self._stub_cycle(observe_pb2_grpc.ObserveServiceStub)
+        return next(stubs)
 
     def ingest_spans(self, spans: list[Span]) -> int:
         """Ingest spans into the observe service.
@@ -47,27 +157,8 @@ class ObserveClient(BaseClient):
         Returns:
             Number of spans accepted.
         """
-        pb_spans = []
-        for span in spans:
-            pb_span = observe_pb2.Span(
-                trace_id=span.trace_id,
-                span_id=span.span_id,
-                parent_span_id=span.parent_span_id or "",
-                name=span.name,
-                kind=self._kind_to_pb(span.kind),
-                status=self._status_to_pb(span.status),
-                status_message=span.status_message or "",
-                attributes=span.attributes,
-                service_name=span.service_name,
-            )
-            if span.start_time:
-                pb_span.start_time.FromDatetime(span.start_time)
-            if span.end_time:
-                pb_span.end_time.FromDatetime(span.end_time)
-            pb_spans.append(pb_span)
-
-        request = observe_pb2.IngestSpansRequest(spans=pb_spans)
-        response = self.stub.IngestSpans(request, timeout=self._timeout)
+        request = self._ingest_request(spans)
+        response = self.stub.IngestTraces(request, timeout=self._timeout)
         return response.accepted_count
 
     def get_trace(self, trace_id: str) -> Trace | None:
@@ -82,9 +173,11 @@ class ObserveClient(BaseClient):
         request = observe_pb2.GetTraceRequest(trace_id=trace_id)
         try:
             response = self.stub.GetTrace(request, timeout=self._timeout)
-            return self._to_trace(response.trace)
-        except Exception:
-            return None
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+        return self._to_trace(response.trace)
 
     def query_traces(
         self,
@@ -105,83 +198,61 @@ class ObserveClient(BaseClient):
         Returns:
             List of matching traces.
         """
-        request = observe_pb2.QueryTracesRequest(
-            service_name=service_name,
-            limit=limit,
-        )
-        if start_time:
-            request.start_time.FromDatetime(start_time)
-        if end_time:
-            request.end_time.FromDatetime(end_time)
-
+        request = self._query_request(service_name, start_time, end_time, limit)
         response = self.stub.QueryTraces(request, timeout=self._timeout)
-        return [self._to_trace(t) for t in response.traces]
+        return list(map(self._to_trace, response.traces))
 
-    def _to_trace(self, pb: observe_pb2.Trace) -> Trace:
-        """Convert protobuf to model."""
-        spans = [self._to_span(s) for s in pb.spans]
-        return Trace(
-            trace_id=pb.trace_id,
-            spans=spans,
-            service_name=pb.service_name,
-            start_time=pb.start_time.ToDatetime(timezone.utc) if pb.HasField("start_time") else None,
-            end_time=pb.end_time.ToDatetime(timezone.utc) if pb.HasField("end_time") else None,
-        )
 
-    def _to_span(self, pb: observe_pb2.Span) -> Span:
-        """Convert protobuf span to model."""
-        return Span(
-            trace_id=pb.trace_id,
-            span_id=pb.span_id,
-            parent_span_id=pb.parent_span_id if pb.parent_span_id else None,
-            name=pb.name,
-            kind=self._kind_from_pb(pb.kind),
-            start_time=pb.start_time.ToDatetime(timezone.utc),
-            end_time=pb.end_time.ToDatetime(timezone.utc) if pb.HasField("end_time") else None,
-            status=self._status_from_pb(pb.status),
-            status_message=pb.status_message if pb.status_message else None,
-            attributes=dict(pb.attributes),
-            service_name=pb.service_name,
-        )
+class AsyncObserveClient(_ObserveClientBase, AsyncBaseClient):
+    """Asyncio client for the observe service.
 
-    def _kind_to_pb(self, kind: SpanKind) -> int:
-        """Convert SpanKind to protobuf."""
-        mapping = {
-            SpanKind.UNSPECIFIED: observe_pb2.SPAN_KIND_UNSPECIFIED,
-            SpanKind.INTERNAL: observe_pb2.SPAN_KIND_INTERNAL,
-            SpanKind.SERVER: observe_pb2.SPAN_KIND_SERVER,
-            SpanKind.CLIENT: observe_pb2.SPAN_KIND_CLIENT,
-            SpanKind.PRODUCER: observe_pb2.SPAN_KIND_PRODUCER,
-            SpanKind.CONSUMER: observe_pb2.SPAN_KIND_CONSUMER,
-        }
-        return mapping.get(kind, observe_pb2.SPAN_KIND_UNSPECIFIED)
-
-    def _kind_from_pb(self, kind: int) -> SpanKind:
-        """Convert protobuf to SpanKind."""
-        mapping = {
-            observe_pb2.SPAN_KIND_UNSPECIFIED: SpanKind.UNSPECIFIED,
-            observe_pb2.SPAN_KIND_INTERNAL: SpanKind.INTERNAL,
-            observe_pb2.SPAN_KIND_SERVER: SpanKind.SERVER,
-            observe_pb2.SPAN_KIND_CLIENT: SpanKind.CLIENT,
-            observe_pb2.SPAN_KIND_PRODUCER: SpanKind.PRODUCER,
-            observe_pb2.SPAN_KIND_CONSUMER: SpanKind.CONSUMER,
-        }
-        return mapping.get(kind, SpanKind.UNSPECIFIED)
+    Mirrors :class:`ObserveClient` with awaitable methods, so span ingestion
+    and queries can overlap on one event loop.
+    """
 
-    def _status_to_pb(self, status: SpanStatus) -> int:
-        """Convert SpanStatus to protobuf."""
-        mapping = {
-            SpanStatus.UNSET: observe_pb2.SPAN_STATUS_UNSET,
-            SpanStatus.OK: observe_pb2.SPAN_STATUS_OK,
-            SpanStatus.ERROR: observe_pb2.SPAN_STATUS_ERROR,
-        }
-        return mapping.get(status, observe_pb2.SPAN_STATUS_UNSET)
+    def __init__(
+        self, endpoint: ServiceEndpoint, timeout: float = 30.0, pool_size: int = 1
+    ) -> None:
+        """Initialize the async observe client."""
+        super().__init__(endpoint, timeout, pool_size)
+        self._stubs: Iterator[observe_pb2_grpc.ObserveServiceStub] | None = None
 
-    def _status_from_pb(self, status: int) -> SpanStatus:
-        """Convert protobuf to SpanStatus."""
-        mapping = {
-            observe_pb2.SPAN_STATUS_UNSET: SpanStatus.UNSET,
-            observe_pb2.SPAN_STATUS_OK: SpanStatus.OK,
-            observe_pb2.SPAN_STATUS_ERROR: SpanStatus.ERROR,
-        }
-        return mapping.get(status, SpanStatus.UNSET)
+    @property
+    def stub(self) -> observe_pb2_grpc.ObserveServiceStub:
+        """Get the gRPC stub for the next pooled channel."""
+        stubs = self._stubs
+        if stubs is None:
+            if observe_pb2_grpc is None:
+                raise ImportError("Generated protobuf code not found. Run 'make proto' first.")
+            stubs = self._stubs = self._stub_cycle(observe_pb2_grpc.ObserveServiceStub)
+        return next(stubs)
+
+    async def ingest_spans(self, spans: list[Span]) -> int:
+        """Ingest spans into the observe service, returning how many were accepted."""
+        request = self._ingest_request(spans)
+        response = await self.stub.IngestTraces(request, timeout=self._timeout)
+        return response.accepted_count
+
+    async def get_trace(self, trace_id: str) -> Trace | None:
+        """Get a trace by ID, or None if it does not exist."""
+        request = observe_pb2.GetTraceRequest(trace_id=trace_id)
+        try:
+            response = await self.stub.GetTrace(request, timeout=self._timeout)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+        return self._to_trace(response.trace)
+
+    async def query_traces(
+        self,
+        *,
+        service_name: str = "",
+        start_time: datetime | None = None,
+        end_time: datetime | None = None,
+        limit: int = 100,
+    ) -> list[Trace]:
+        """Query traces; see :meth:`ObserveClient.query_traces`."""
+        request = self._query_request(service_name, start_time, end_time, limit)
+        response = await self.stub.QueryTraces(request, timeout=self._timeout)
+        return list(map(self._to_trace, response.traces))
@@ -2,42 +2,120 @@
 
 from __future__ import annotations
 
-import sys
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import TYPE_CHECKING
 
+import grpc
+
+from delos.models._base import construct_trusted
+from delos.models.common import EMPTY_MAP, SmallMap
 from delos.models.prompt import Prompt, PromptMessage, PromptVariable, PromptVersion
-from delos.services.base import BaseClient
+from delos.services._timestamp import timestamp_to_datetime
+from delos.services.base import AsyncBaseClient, BaseClient
 
 if TYPE_CHECKING:
-    from delos.config import ServiceEndpoint
+    from collections.abc import Iterable, Iterator
 
-# Add gen/python to path for imports
-sys.path.insert(0, "gen/python")
+    from delos.config import ServiceEndpoint
 
 try:
-    from prompt.v1 import prompt_pb2, prompt_pb2_grpc
+    from delos._gen.prompt.v1 import prompt_pb2, prompt_pb2_grpc
 except ImportError:
     prompt_pb2 = None  # type: ignore
     prompt_pb2_grpc = None  # type: ignore
 
 
-class PromptClient(BaseClient):
+class _PromptClientBase:
+    """Converters and request builders shared by the sync and async prompt clients."""
+
+    @staticmethod
+    def _messages_to_pb(messages: Iterable[PromptMessage]) -> list[prompt_pb2.PromptMessage]:
+        """Convert prompt messages to protobuf."""
+        return [prompt_pb2.PromptMessage(role=m.role, content=m.content) for m in messages]
+
+    @staticmethod
+    def _variables_to_pb(variables: Iterable[PromptVariable]) -> list[prompt_pb2.PromptVariable]:
+        """Convert prompt variables to protobuf."""
+        return [
+            prompt_pb2.PromptVariable(
+                name=v.name,
+                description=v.description,
+                default_value=v.default_value,
+                required=v.required,
+            )
+            for v in variables
+        ]
+
+    def _to_prompt(self, pb: prompt_pb2.Prompt) -> Prompt:
+        """Convert protobuf to model."""
+        return construct_trusted(
+            Prompt,
+            id=pb.id,
+            name=pb.name,
+            slug=pb.slug,
+            description=pb.description,
+            current_version=pb.current_version,
+            versions=list(map(self._to_version, pb.versions)),
+            tags=list(pb.tags),
+            metadata=SmallMap(pb.metadata) if pb.metadata else EMPTY_MAP,
+            created_at=timestamp_to_datetime(pb.created_at),
+            updated_at=timestamp_to_datetime(pb.updated_at),
+            created_by=pb.created_by,
+        )
+
+    def _to_version(self, pb: prompt_pb2.PromptVersion) -> PromptVersion:
+        """Convert protobuf version to model."""
+        return construct_trusted(
+            PromptVersion,
+            version=pb.version,
+            template=pb.template,
+            system_prompt=pb.system_prompt,
+            messages=list(map(self._to_message, pb.messages)),
+            variables=list(map(self._to_variable, pb.variables)),
+            model=pb.model,
+            temperature=pb.temperature,
+            max_tokens=pb.max_tokens,
+            created_at=timestamp_to_datetime(pb.created_at),
+            created_by=pb.created_by,
+            commit_message=pb.commit_message,
+        )
+
+    @staticmethod
+    def _to_message(pb: prompt_pb2.PromptMessage) -> PromptMessage:
+        """Convert protobuf message to model."""
+        return construct_trusted(PromptMessage, role=pb.role, content=pb.content)
+
+    @staticmethod
+    def _to_variable(pb: prompt_pb2.PromptVariable) -> PromptVariable:
+        """Convert protobuf variable to model."""
+        return construct_trusted(
+            PromptVariable,
+            name=pb.name,
+            description=pb.description,
+            default_value=pb.default_value,
+            required=pb.required,
+        )
+
+
+class PromptClient(_PromptClientBase, BaseClient):
     """Client for the prompt service."""
 
-    def __init__(self, endpoint: ServiceEndpoint, timeout: float = 30.0) -> None:
+    def __init__(
+        self, endpoint: ServiceEndpoint, timeout: float = 30.0, pool_size: int = 1
+    ) -> None:
         """Initialize the prompt client."""
-        super().__init__(endpoint, timeout)
-        self._stub: prompt_pb2_grpc.PromptServiceStub | None = None
+        super().__init__(endpoint, timeout, pool_size)
+        self._stubs: Iterator[prompt_pb2_grpc.PromptServiceStub] | None = None
 
     @property
     def stub(self) -> prompt_pb2_grpc.PromptServiceStub:
-        """Get the gRPC stub."""
-        if self._stub is None:
+        """Get the gRPC stub for the next pooled channel."""
+        stubs = self._stubs
+        if stubs is None:
             if prompt_pb2_grpc is None:
-                raise ImportError("Generated protobuf code not found. Run 'buf generate' first.")
-            self._stub = prompt_pb2_grpc.PromptServiceStub(self.channel)
-        return self._stub
+                raise ImportError("Generated protobuf code not found. Run 'make proto' first.")
+            stubs = self._stubs = self._stub_cycle(prompt_pb2_grpc.PromptServiceStub)
+        return next(stubs)
 
     def create(
         self,
@@ -74,31 +152,14 @@ class PromptClient(BaseClient):
         Returns:
             The created prompt.
         """
-        pb_messages = []
-        if messages:
-            for m in messages:
-                pb_messages.append(prompt_pb2.PromptMessage(role=m.role, content=m.content))
-
-        pb_variables = []
-        if variables:
-            for v in variables:
-                pb_variables.append(
-                    prompt_pb2.PromptVariable(
-                        name=v.name,
-                        description=v.description,
-                        default_value=v.default_value,
-                        required=v.required,
-                    )
-                )
-
         request = prompt_pb2.CreatePromptRequest(
             name=name,
             slug=slug,
             description=description,
             template=template,
             system_prompt=system_prompt,
-            messages=pb_messages,
-            variables=pb_variables,
+            messages=self._messages_to_pb(messages or ()),
+            variables=self._variables_to_pb(variables or ()),
             model=model,
             temperature=temperature,
             max_tokens=max_tokens,
@@ -122,9 +183,11 @@ class PromptClient(BaseClient):
         request = prompt_pb2.GetPromptRequest(id=id_or_slug, version=version or 0)
         try:
             response = self.stub.GetPrompt(request, timeout=self._timeout)
-            return self._to_prompt(response.prompt)
-        except Exception:
-            return None
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+        return self._to_prompt(response.prompt)
 
     def update(
         self,
@@ -155,30 +218,12 @@ class PromptClient(BaseClient):
         Returns:
             The updated prompt with the new version.
         """
-        pb_messages = None
-        if messages is not None:
-            pb_messages = [
-                prompt_pb2.PromptMessage(role=m.role, content=m.content) for m in messages
-            ]
-
-        pb_variables = None
-        if variables is not None:
-            pb_variables = [
-                prompt_pb2.PromptVariable(
-                    name=v.name,
-                    description=v.description,
-                    default_value=v.default_value,
-                    required=v.required,
-                )
-                for v in variables
-            ]
-
         request = prompt_pb2.UpdatePromptRequest(
             id=id,
             template=template or "",
             system_prompt=system_prompt or "",
-            messages=pb_messages or [],
-            variables=pb_variables or [],
+            messages=self._messages_to_pb(messages or ()),
+            variables=self._variables_to_pb(variables or ()),
             model=model or "",
             temperature=temperature or 0.0,
             max_tokens=max_tokens or 0,
@@ -228,7 +273,7 @@ class PromptClient(BaseClient):
         )
 
         response = self.stub.ListPrompts(request, timeout=self._timeout)
-        prompts = [self._to_prompt(p) for p in response.prompts]
+        prompts = list(map(self._to_prompt, response.prompts))
         return prompts, response.total_count
 
     def get_version(self, id: str, version: int) -> PromptVersion | None:
@@ -244,9 +289,11 @@ class PromptClient(BaseClient):
         request = prompt_pb2.GetPromptVersionRequest(id=id, version=version)
         try:
             response = self.stub.GetPromptVersion(request, timeout=self._timeout)
-            return self._to_version(response.version)
-        except Exception:
-            return None
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+        return self._to_version(response.version)
 
     def list_versions(self, id: str) -> list[PromptVersion]:
         """List all versions of a prompt.
@@ -259,47 +306,143 @@ class PromptClient(BaseClient):
         """
         request = prompt_pb2.ListVersionsRequest(id=id)
         response = self.stub.ListVersions(request, timeout=self._timeout)
-        return [self._to_version(v) for v in response.versions]
+        return list(map(self._to_version, response.versions))
 
-    def _to_prompt(self, pb: prompt_pb2.Prompt) -> Prompt:
-        """Convert protobuf to model."""
-        versions = [self._to_version(v) for v in pb.versions]
-        return Prompt(
-            id=pb.id,
-            name=pb.name,
-            slug=pb.slug,
-            description=pb.description,
-            current_version=pb.current_version,
-            versions=versions,
-            tags=list(pb.tags),
-            metadata=dict(pb.metadata),
-            created_at=pb.created_at.ToDatetime(timezone.utc) if pb.HasField("created_at") else None,
-            updated_at=pb.updated_at.ToDatetime(timezone.utc) if pb.HasField("updated_at") else None,
-            created_by=pb.created_by,
+
+class AsyncPromptClient(_PromptClientBase, AsyncBaseClient):
+    """Asyncio client for the prompt service.
+
+    Mirrors :class:`PromptClient` with awaitable methods, so many calls can be
+    in flight at once on one event loop.
+    """
+
+    def __init__(
+        self, endpoint: ServiceEndpoint, timeout: float = 30.0, pool_size: int = 1
+    ) -> None:
+        """Initialize the async prompt client."""
+        super().__init__(endpoint, timeout, pool_size)
+        self._stubs: Iterator[prompt_pb2_grpc.PromptServiceStub] | None = None
+
+    @property
+    def stub(self) -> prompt_pb2_grpc.PromptServiceStub:
+        """Get the gRPC stub for the next pooled channel."""
+        stubs = self._stubs
+        if stubs is None:
+            if prompt_pb2_grpc is None:
+                raise ImportError("Generated protobuf code not found. Run 'make proto' first.")
+            stubs = self._stubs = self._stub_cycle(prompt_pb2_grpc.PromptServiceStub)
+        return next(stubs)
+
+    async def create(
+        self,
+        name: str,
+        *,
+        slug: str = "",
+        description: str = "",
+        template: str = "",
+        system_prompt: str = "",
+        messages: list[PromptMessage] | None = None,
+        variables: list[PromptVariable] | None = None,
+        model: str = "",
+        temperature: float = 0.7,
+        max_tokens: int = 1024,
+        tags: list[str] | None = None,
+        metadata: dict[str, str] | None = None,
+    ) -> Prompt:
+        """Create a new prompt; see :meth:`PromptClient.create`."""
+        request = prompt_pb2.CreatePromptRequest(
+            name=name,
+            slug=slug,
+            description=description,
+            template=template,
+            system_prompt=system_prompt,
+            messages=self._messages_to_pb(messages or ()),
+            variables=self._variables_to_pb(variables or ()),
+            model=model,
+            temperature=temperature,
+            max_tokens=max_tokens,
+            tags=tags or [],
+            metadata=metadata or {},
         )
+        response = await self.stub.CreatePrompt(request, timeout=self._timeout)
+        return self._to_prompt(response.prompt)
 
-    def _to_version(self, pb: prompt_pb2.PromptVersion) -> PromptVersion:
-        """Convert protobuf version to model."""
-        messages = [PromptMessage(role=m.role, content=m.content) for m in pb.messages]
-        variables = [
-            PromptVariable(
-                name=v.name,
-                description=v.description,
-                default_value=v.default_value,
-                required=v.required,
-            )
-            for v in pb.variables
-        ]
-        return PromptVersion(
-            version=pb.version,
-            template=pb.template,
-            system_prompt=pb.system_prompt,
-            messages=messages,
-            variables=variables,
-            model=pb.model,
-            temperature=pb.temperature,
-            max_tokens=pb.max_tokens,
-            created_at=pb.created_at.ToDatetime(timezone.utc) if pb.HasField("created_at") else None,
-            created_by=pb.created_by,
-            commit_message=pb.commit_message,
+    async def get(self, id_or_slug: str, *, version: int | None = None) -> Prompt | None:
+        """Get a prompt by ID or slug, or None if it does not exist."""
+        request = prompt_pb2.GetPromptRequest(id=id_or_slug, version=version or 0)
+        try:
+            response = await self.stub.GetPrompt(request, timeout=self._timeout)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+        return self._to_prompt(response.prompt)
+
+    async def update(
+        self,
+        id: str,
+        *,
+        template: str | None = None,
+        system_prompt: str | None = None,
+        messages: list[PromptMessage] | None = None,
+        variables: list[PromptVariable] | None = None,
+        model: str | None = None,
+        temperature: float | None = None,
+        max_tokens: int | None = None,
+        commit_message: str = "",
+    ) -> Prompt:
+        """Update a prompt, creating a new version; see :meth:`PromptClient.update`."""
+        request = prompt_pb2.UpdatePromptRequest(
+            id=id,
+            template=template or "",
+            system_prompt=system_prompt or "",
+            messages=self._messages_to_pb(messages or ()),
+            variables=self._variables_to_pb(variables or ()),
+            model=model or "",
+            temperature=temperature or 0.0,
+            max_tokens=max_tokens or 0,
+            commit_message=commit_message,
         )
+        response = await self.stub.UpdatePrompt(request, timeout=self._timeout)
+        return self._to_prompt(response.prompt)
+
+    async def delete(self, id: str) -> bool:
+        """Delete a prompt."""
+        request = prompt_pb2.DeletePromptRequest(id=id)
+        response = await self.stub.DeletePrompt(request, timeout=self._timeout)
+        return response.success
+
+    async def list(
+        self,
+        *,
+        tags: list[str] | None = None,
+        search: str = "",
+        limit: int = 100,
+        offset: int = 0,
+    ) -> tuple[list[Prompt], int]:
+        """List prompts, returning (prompts, total_count)."""
+        request = prompt_pb2.ListPromptsRequest(
+            tags=tags or [],
+            search=search,
+            limit=limit,
+            offset=offset,
+        )
+        response = await self.stub.ListPrompts(request, timeout=self._timeout)
+        return list(map(self._to_prompt, response.prompts)), response.total_count
+
+    async def get_version(self, id: str, version: int) -> PromptVersion | None:
+        """Get a specific version of a prompt, or None if it does not exist."""
+        request = prompt_pb2.GetPromptVersionRequest(id=id, version=version)
+        try:
+            response = await self.stub.GetPromptVersion(request, timeout=self._timeout)
+        except grpc.RpcError as e:
+            if e.code() == grpc.StatusCode.NOT_FOUND:
+                return None
+            raise
+        return self._to_version(response.version)
+
+    async def list_versions(self, id: str) -> list[PromptVersion]:
+        """List all versions of a prompt."""
+        request = prompt_pb2.ListVersionsRequest(id=id)
+        response = await self.stub.ListVersions(request, timeout=self._timeout)
+        return list(map(self._to_version, response.versions))
@@ -2,12 +2,22 @@
 
 from __future__ import annotations
 
-import sys
-from collections.abc import Iterator
-from typing import TYPE_CHECKING
+import time
+from collections import OrderedDict
+from collections.abc import (
+    AsyncIterable,
+    AsyncIterator,
+    Callable,
+    Iterable,
+    Iterator,
+    Mapping,
+    MutableMapping,
+)
+from typing import TYPE_CHECKING, Any
+
+import grpc
 
 from delos.models.runtime import (
-    CompletionParams,
     CompletionResponse,
     Message,
     Model,
@@ -15,36 +25,315 @@ from delos.models.runtime import (
     RoutingStrategy,
     Usage,
 )
-from delos.services.base import BaseClient
+from delos.services.base import AsyncBaseClient, BaseClient
 
 if TYPE_CHECKING:
     from delos.config import ServiceEndpoint
 
-sys.path.insert(0, "gen/python")
-
 try:
-    from runtime.v1 import runtime_pb2, runtime_pb2_grpc
+    from delos._gen.runtime.v1 import runtime_pb2, runtime_pb2_grpc
 except ImportError:
     runtime_pb2 = None  # type: ignore
     runtime_pb2_grpc = None  # type: ignore
 
+if runtime_pb2 is not None:
+    # Routing strategy -> protobuf enum, built once rather than on every call.
+    _STRATEGY_TO_PB = {
+        RoutingStrategy.UNSPECIFIED: runtime_pb2.ROUTING_STRATEGY_UNSPECIFIED,
+        RoutingStrategy.COST: runtime_pb2.ROUTING_STRATEGY_COST_OPTIMIZED,
+        RoutingStrategy.LATENCY: runtime_pb2.ROUTING_STRATEGY_LATENCY_OPTIMIZED,
+        RoutingStrategy.QUALITY: runtime_pb2.ROUTING_STRATEGY_QUALITY_OPTIMIZED,
+    }
+    _STRATEGY_UNSPECIFIED = runtime_pb2.ROUTING_STRATEGY_UNSPECIFIED
+
+
+def _coalesced(responses: Iterable[Any], window: float) -> Iterator[str]:
+    """Join the deltas of stream responses arriving within ``window`` seconds."""
+    monotonic = time.monotonic
+    buffer: list[str] = []
+    deadline = 0.0
+    for response in responses:
+        delta = response.delta
+        if not delta:
+            continue
+        if not buffer:
+            deadline = monotonic() + window
+        buffer.append(delta)
+        if monotonic() >= deadline:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+
+
+async def _acoalesced(responses: AsyncIterable[Any], window: float) -> AsyncIterator[str]:
+    """Async version of :func:`_coalesced`."""
+    monotonic = time.monotonic
+    buffer: list[str] = []
+    deadline = 0.0
+    async for response in responses:
+        delta = response.delta
+        if not delta:
+            continue
+        if not buffer:
+            deadline = monotonic() + window
+        buffer.append(delta)
+        if monotonic() >= deadline:
+            yield "".join(buffer)
+            buffer = []
+    if buffer:
+        yield "".join(buffer)
+
+
+def _add_messages(params: runtime_pb2.CompletionParams, messages: list[Message] | None) -> None:
+    """Append conversation messages to completion params in place."""
+    add = params.messages.add
+    for m in messages or ():
+        add(role=m.role, content=m.content)
+
+
+class CompletionTemplate:
+    """Completion settings prepared by ``build_template`` for reuse.
+
+    Immutable once built; one template can be shared by any number of calls,
+    including concurrent ones.
+    """
+
+    __slots__ = ("_params",)
+
+    def __init__(self, params: runtime_pb2.CompletionParams) -> None:
+        """Wrap encoded completion params."""
+        self._params = params
+
+
+class _RuntimeClientBase:
+    """Converters and request builders shared by the sync and async runtime clients."""
+
+    @staticmethod
+    def _completion_params(
+        messages: list[Message] | None = None,
+        *,
+        model: str = "",
+        system_prompt: str = "",
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        top_p: float = 1.0,
+        stop_sequences: list[str] | None = None,
+        provider: str = "",
+        routing_strategy: RoutingStrategy = RoutingStrategy.UNSPECIFIED,
+        metadata: dict[str, str] | None = None,
+    ) -> runtime_pb2.CompletionParams:
+        """Build completion params from the keyword arguments of ``complete``.
+
+        The service has no separate system prompt field; ``system_prompt`` is
+        sent as a leading system message, which every provider understands.
+        """
+        params = runtime_pb2.CompletionParams(
+            model=model,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            stop=stop_sequences or [],
+            provider=provider,
+            routing=_STRATEGY_TO_PB.get(routing_strategy, _STRATEGY_UNSPECIFIED),
+            metadata=metadata or {},
+        )
+        if system_prompt:
+            params.messages.add(role="system", content=system_prompt)
+        _add_messages(params, messages)
+        return params
+
+    @staticmethod
+    def _templated_params(
+        template: CompletionTemplate, messages: list[Message] | None
+    ) -> runtime_pb2.CompletionParams:
+        """Build completion params from a template and the conversation."""
+        params = runtime_pb2.CompletionParams()
+        params.CopyFrom(template._params)
+        _add_messages(params, messages)
+        return params
+
+    def build_template(
+        self,
+        *,
+        model: str = "",
+        system_prompt: str = "",
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        top_p: float = 1.0,
+        stop_sequences: list[str] | None = None,
+        provider: str = "",
+        routing_strategy: RoutingStrategy = RoutingStrategy.UNSPECIFIED,
+        metadata: dict[str, str] | None = None,
+    ) -> CompletionTemplate:
+        """Prepare completion settings once for reuse across many ``complete`` calls.
+
+        Pass the result as ``complete(messages, template=...)``. Each call then
+        copies the already-encoded settings instead of rebuilding them field by
+        field, which roughly halves request construction for loops, such as
+        agent turns, that keep the model and sampling settings fixed.
+
+        Args:
+            model: Model to use.
+            system_prompt: System prompt.
+            max_tokens: Maximum tokens to generate.
+            temperature: Sampling temperature.
+            top_p: Top-p sampling.
+            stop_sequences: Stop sequences.
+            provider: Specific provider to use.
+            routing_strategy: Routing strategy.
+            metadata: Request metadata.
+        """
+        params = self._completion_params(
+            model=model,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=top_p,
+            stop_sequences=stop_sequences,
+            provider=provider,
+            routing_strategy=routing_strategy,
+            metadata=metadata,
+        )
+        return CompletionTemplate(params)
+
+    def _batch_request(
+        self, batch: Iterable[Mapping[str, Any]]
+    ) -> runtime_pb2.CompleteBatchRequest:
+        """Build the request for a batch of completions."""
+        completion_params = self._completion_params
+        params = [completion_params(**kwargs) for kwargs in batch]
+        return runtime_pb2.CompleteBatchRequest(params=params)
+
+    def _complete_requests(
+        self, batch: Iterable[Mapping[str, Any]]
+    ) -> Iterator[runtime_pb2.CompleteRequest]:
+        """Build a complete request per entry of ``batch`` as they are consumed."""
+        completion_params = self._completion_params
+        complete_request = runtime_pb2.CompleteRequest
+        for kwargs in batch:
+            yield complete_request(params=completion_params(**kwargs))
+
+    def _stream_request(
+        self,
+        messages: list[Message] | None,
+        model: str,
+        system_prompt: str,
+        max_tokens: int,
+        temperature: float,
+    ) -> runtime_pb2.CompleteStreamRequest:
+        """Build the request for a streaming completion."""
+        # Streams have always left top_p unset (0), letting providers apply
+        # their own default; every other field matches a default complete().
+        params = self._completion_params(
+            messages,
+            model=model,
+            system_prompt=system_prompt,
+            max_tokens=max_tokens,
+            temperature=temperature,
+            top_p=0.0,
+        )
+        return runtime_pb2.CompleteStreamRequest(params=params)
+
+    @staticmethod
+    def _to_providers(response: runtime_pb2.ListProvidersResponse) -> list[Provider]:
+        """Convert a list-providers response to providers."""
+        providers = []
+        for p in response.providers:
+            # The service quotes one blended rate per model for every token.
+            costs = p.cost_per_1k_tokens
+            models = [
+                Model(
+                    id=m,
+                    name=m,
+                    provider=p.name,
+                    cost_per_input_token=costs.get(m, 0.0) / 1000,
+                    cost_per_output_token=costs.get(m, 0.0) / 1000,
+                )
+                for m in p.models
+            ]
+            providers.append(
+                Provider(id=p.name, name=p.name, models=models, is_available=p.available)
+            )
+        return providers
+
+    @staticmethod
+    def _provider_models(providers: list[Provider], provider: str) -> list[Model]:
+        """Collect the models of every provider, or only of ``provider`` if given."""
+        return [m for p in providers if not provider or p.name == provider for m in p.models]
+
+    def invalidate_catalog(self) -> None:
+        """Drop cached model and provider listings so the next call refetches them."""
+        self._catalog.clear()
+
+    def _fresh_catalog(self, key: tuple[str, str]) -> list[Any] | None:
+        """Return a cached listing younger than the catalog TTL, if any."""
+        entry = self._catalog.get(key)
+        if entry is not None and time.monotonic() - entry[0] < self._catalog_ttl:
+            return list(entry[1])
+        return None
+
+    def _stale_catalog(self, key: tuple[str, str]) -> list[Any] | None:
+        """Return a cached listing regardless of age, if any."""
+        entry = self._catalog.get(key)
+        return list(entry[1]) if entry is not None else None
+
+    def _store_catalog(self, key: tuple[str, str], listing: list[Any]) -> list[Any]:
+        """Cache a freshly fetched listing and return a copy for the caller."""
+        self._catalog[key] = (time.monotonic(), listing)
+        return list(listing)
 
-class RuntimeClient(BaseClient):
+    def _to_response(self, pb: runtime_pb2.CompleteResponse) -> CompletionResponse:
+        """Convert protobuf to model."""
+        return CompletionResponse(
+            id=pb.id,
+            content=pb.content,
+            model=pb.model,
+            provider=pb.provider,
+            usage=Usage(
+                prompt_tokens=pb.usage.prompt_tokens,
+                completion_tokens=pb.usage.completion_tokens,
+                total_tokens=pb.usage.total_tokens,
+            ),
+            cached=pb.cached,
+            trace_id=pb.trace_id,
+        )
+
+
+class RuntimeClient(_RuntimeClientBase, BaseClient):
     """Client for the runtime service."""
 
-    def __init__(self, endpoint: ServiceEndpoint, timeout: float = 30.0) -> None:
-        """Initialize the runtime client."""
-        super().__init__(endpoint, timeout)
-        self._stub: runtime_pb2_grpc.RuntimeServiceStub | None = None
+    def __init__(
+        self,
+        endpoint: ServiceEndpoint,
+        timeout: float = 30.0,
+        pool_size: int = 1,
+        catalog_ttl: float = 300.0,
+    ) -> None:
+        """Initialize the runtime client.
+
+        Args:
+            endpoint: Service endpoint configuration.
+            timeout: Default timeout for requests in seconds.
+            pool_size: Number of channels to spread requests across.
+            catalog_ttl: Seconds to reuse ``list_models`` and ``list_providers``
+                results before refetching them; 0 disables the cache.
+        """
+        super().__init__(endpoint, timeout, pool_size)
+        self._stubs: Iterator[runtime_pb2_grpc.RuntimeServiceStub] | None = None
+        self._catalog_ttl = catalog_ttl
+        self._catalog: dict[tuple[str, str], tuple[float, list[Any]]] = {}
+        self._catalog_futures: dict[tuple[str, str], grpc.Future] = {}
 
     @property
     def stub(self) -> runtime_pb2_grpc.RuntimeServiceStub:
-        """Get the gRPC stub."""
-        if self._stub is None:
+        """Get the gRPC stub for the next pooled channel."""
+        stubs = self._stubs
+        if stubs is None:
             if runtime_pb2_grpc is None:
-                raise ImportError("Generated protobuf code not found. Run 'buf generate' first.")
-            self._stub = runtime_pb2_grpc.RuntimeServiceStub(self.channel)
-        return self._stub
+                raise ImportError("Generated protobuf code not found. Run 'make proto' first.")
+            stubs = self._stubs = self._stub_cycle(runtime_pb2_grpc.RuntimeServiceStub)
+        return next(stubs)
 
     def complete(
         self,
@@ -59,6 +348,8 @@ class RuntimeClient(BaseClient):
         provider: str = "",
         routing_strategy: RoutingStrategy = RoutingStrategy.UNSPECIFIED,
         metadata: dict[str, str] | None = None,
+        template: CompletionTemplate | None = None,
+        compression: grpc.Compression | None = None,
     ) -> CompletionResponse:
         """Generate a completion.
 
@@ -73,41 +364,92 @@ class RuntimeClient(BaseClient):
             provider: Specific provider to use.
             routing_strategy: Routing strategy.
             metadata: Request metadata.
+            template: Settings from :meth:`build_template`. When given, they
+                are used instead of every argument other than ``messages``.
+            compression: Compression for this call. Defaults to the channel's
+                gzip; pass ``grpc.Compression.NoCompression`` to save CPU when
+                bandwidth is not a concern, such as on a local network.
 
         Returns:
             The completion response.
         """
-        pb_messages = []
-        if messages:
-            for m in messages:
-                pb_messages.append(runtime_pb2.Message(role=m.role, content=m.content))
-
-        strategy_map = {
-            RoutingStrategy.UNSPECIFIED: runtime_pb2.ROUTING_STRATEGY_UNSPECIFIED,
-            RoutingStrategy.COST: runtime_pb2.ROUTING_STRATEGY_COST,
-            RoutingStrategy.LATENCY: runtime_pb2.ROUTING_STRATEGY_LATENCY,
-            RoutingStrategy.QUALITY: runtime_pb2.ROUTING_STRATEGY_QUALITY,
-        }
-
-        params = runtime_pb2.CompletionParams(
-            model=model,
-            messages=pb_messages,
-            system_prompt=system_prompt,
-            max_tokens=max_tokens,
-            temperature=temperature,
-            top_p=top_p,
-            stop_sequences=stop_sequences or [],
-            provider=provider,
-            routing_strategy=strategy_map.get(
-                routing_strategy, runtime_pb2.ROUTING_STRATEGY_UNSPECIFIED
-            ),
-            metadata=metadata or {},
-        )
+        if template is not None:
+            params = self._templated_params(template, messages)
+        else:
+            params = self._completion_params(
+                messages,
+                model=model,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                stop_sequences=stop_sequences,
+                provider=provider,
+                routing_strategy=routing_strategy,
+                metadata=metadata,
+            )
+        return self._send_complete(params, compression)
 
+    def _send_complete(
+        self, params: runtime_pb2.CompletionParams, compression: grpc.Compression | None
+    ) -> CompletionResponse:
+        """Issue the ``Complete`` RPC for built params."""
         request = runtime_pb2.CompleteRequest(params=params)
-        response = self.stub.Complete(request, timeout=self._timeout)
+        response = self.stub.Complete(request, timeout=self._timeout, compression=compression)
         return self._to_response(response)
 
+    def complete_many(
+        self, batch: Iterable[Mapping[str, Any]], *, compression: grpc.Compression | None = None
+    ) -> list[CompletionResponse]:
+        """Generate several independent completions in one RPC.
+
+        Sending one ``CompleteBatch`` request instead of a ``Complete`` call per
+        prompt pays the per-call Python and protobuf overhead once per batch.
+        The server runs the completions concurrently; if any fails, the whole
+        call fails.
+
+        Args:
+            batch: Keyword arguments for each completion, as accepted by
+                :meth:`complete`.
+            compression: Compression for this call; see :meth:`complete`.
+
+        Returns:
+            One response per entry of ``batch``, in the same order.
+        """
+        request = self._batch_request(batch)
+        response = self.stub.CompleteBatch(request, timeout=self._timeout, compression=compression)
+        return list(map(self._to_response, response.responses))
+
+    def complete_bidi(
+        self,
+        batch: Iterable[Mapping[str, Any]],
+        *,
+        timeout: float | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> Iterator[CompletionResponse]:
+        """Generate completions over one bidirectional stream.
+
+        Requests are built from ``batch`` only as the stream sends them, and
+        each response is yielded as soon as it and those before it are done.
+        Unlike :meth:`complete_many`, ``batch`` may be a long or open-ended
+        generator, such as an agent loop, without holding it all in memory.
+
+        Args:
+            batch: Keyword arguments for each completion, as accepted by
+                :meth:`complete`.
+            timeout: Deadline for the whole stream in seconds. None by
+                default, since the stream lasts as long as ``batch``.
+            compression: Compression for this call; see :meth:`complete`.
+
+        Yields:
+            One response per entry of ``batch``, in the same order.
+        """
+        requests = self._complete_requests(batch)
+        to_response = self._to_response
+        responses = self.stub.CompleteBidi(requests, timeout=timeout, compression=compression)
+        for response in responses:
+            yield to_response(response)
+
     def complete_stream(
         self,
         messages: list[Message] | None = None,
@@ -116,95 +458,343 @@ class RuntimeClient(BaseClient):
         system_prompt: str = "",
         max_tokens: int = 1024,
         temperature: float = 0.7,
+        coalesce_ms: float = 0,
+        compression: grpc.Compression | None = None,
         **kwargs: object,
     ) -> Iterator[str]:
         """Generate a streaming completion.
 
+        Args:
+            coalesce_ms: Join chunks arriving within this many milliseconds of
+                the first one held back and yield them as one string, cutting
+                per-chunk overhead on token-sized streams. Held chunks are
+                released when a later chunk arrives or the stream ends. 0
+                yields every chunk as it arrives.
+            compression: Compression for this call; see :meth:`complete`.
+
         Yields:
             Content chunks as they are generated.
         """
-        pb_messages = []
-        if messages:
-            for m in messages:
-                pb_messages.append(runtime_pb2.Message(role=m.role, content=m.content))
-
-        params = runtime_pb2.CompletionParams(
-            model=model,
-            messages=pb_messages,
-            system_prompt=system_prompt,
-            max_tokens=max_tokens,
-            temperature=temperature,
+        request = self._stream_request(messages, model, system_prompt, max_tokens, temperature)
+        responses = self.stub.CompleteStream(
+            request, timeout=self._timeout, compression=compression
         )
+        if coalesce_ms > 0:
+            yield from _coalesced(responses, coalesce_ms / 1000)
+            return
+        for response in responses:
+            delta = response.delta
+            if delta:
+                yield delta
+
+    def prefetch_models(self, provider: str = "") -> None:
+        """Start fetching the model listing in the background.
+
+        Call this before the first completions of a session; the next
+        :meth:`list_models` call then waits on the request already in flight
+        instead of starting one, so the catalog round trip overlaps with the
+        completion work. Does nothing while a fresh listing is cached or a
+        fetch is pending.
 
-        request = runtime_pb2.CompleteStreamRequest(params=params)
-        for response in self.stub.CompleteStream(request, timeout=self._timeout):
-            if response.content:
-                yield response.content
+        Args:
+            provider: Provider the models will be listed for (optional). Every
+                provider's models arrive in one listing, so this does not
+                change what is fetched.
+        """
+        self.prefetch_providers()
+
+    def prefetch_providers(self) -> None:
+        """Start fetching the provider listing in the background.
+
+        See :meth:`prefetch_models`; both share one listing.
+        """
+        key = ("providers", "")
+        if self._fresh_catalog(key) is None and key not in self._catalog_futures:
+            request = runtime_pb2.ListProvidersRequest()
+            self._catalog_futures[key] = self.stub.ListProviders.future(
+                request, timeout=self._timeout
+            )
+
+    def _fetch_catalog(
+        self, key: tuple[str, str], fetch: Callable[[], Any], convert: Callable[[Any], list[Any]]
+    ) -> list[Any]:
+        """Return a cached listing, or fetch, cache and return a fresh one.
+
+        Waits on a prefetched request for ``key`` when there is one. Falls
+        back to the last cached listing, whatever its age, if the fetch fails.
+        """
+        listing = self._fresh_catalog(key)
+        if listing is not None:
+            return listing
+        future = self._catalog_futures.pop(key, None)
+        try:
+            response = future.result() if future is not None else fetch()
+        except grpc.RpcError:
+            listing = self._stale_catalog(key)
+            if listing is None:
+                raise
+            return listing
+        return self._store_catalog(key, convert(response))
 
     def list_models(self, provider: str = "") -> list[Model]:
         """List available models.
 
+        Models are taken from the provider listing, so this shares its cache
+        with :meth:`list_providers`: results are reused for ``catalog_ttl``
+        seconds, and if refetching fails the last listing is used instead of
+        raising, when there is one.
+
         Args:
             provider: Filter by provider (optional).
 
         Returns:
             List of available models.
         """
-        request = runtime_pb2.ListModelsRequest(provider=provider)
-        response = self.stub.ListModels(request, timeout=self._timeout)
-        return [
-            Model(
-                id=m.id,
-                name=m.name,
-                provider=m.provider,
-                context_window=m.context_window,
-                max_output_tokens=m.max_output_tokens,
-                supports_vision=m.supports_vision,
-                supports_function_calling=m.supports_function_calling,
-                cost_per_input_token=m.cost_per_input_token,
-                cost_per_output_token=m.cost_per_output_token,
-            )
-            for m in response.models
-        ]
+        return self._provider_models(self.list_providers(), provider)
 
     def list_providers(self) -> list[Provider]:
         """List available providers.
 
+        Results are cached for ``catalog_ttl`` seconds. If refetching fails,
+        the last listing is returned instead of raising, when there is one.
+
         Returns:
             List of available providers.
         """
-        request = runtime_pb2.ListProvidersRequest()
-        response = self.stub.ListProviders(request, timeout=self._timeout)
-        return [
-            Provider(
-                id=p.id,
-                name=p.name,
-                models=[
-                    Model(
-                        id=m.id,
-                        name=m.name,
-                        provider=m.provider,
-                    )
-                    for m in p.models
-                ],
-                is_available=p.is_available,
+        return self._fetch_catalog(
+            ("providers", ""),
+            lambda: self.stub.ListProviders(
+                runtime_pb2.ListProvidersRequest(), timeout=self._timeout
+            ),
+            self._to_providers,
+        )
+
+
+class CachedRuntimeClient(RuntimeClient):
+    """Runtime client that answers repeated completions from a local cache.
+
+    Agent loops often re-issue the exact same request; a hit here skips both
+    the round trip and the model call. Requests are keyed on their encoded
+    params, so any difference in messages, settings or metadata is a miss.
+    Only ``complete`` is cached; batch and streaming calls always go to the
+    service.
+
+    Example:
+        >>> runtime = CachedRuntimeClient(config.runtime, max_entries=4096)
+        >>> runtime.complete(messages=history, model="gpt-4", temperature=0)
+    """
+
+    def __init__(
+        self,
+        endpoint: ServiceEndpoint,
+        timeout: float = 30.0,
+        pool_size: int = 1,
+        catalog_ttl: float = 300.0,
+        *,
+        max_entries: int = 1024,
+        deterministic_only: bool = False,
+        store: MutableMapping[bytes, CompletionResponse] | None = None,
+    ) -> None:
+        """Initialize the cached runtime client.
+
+        Args:
+            endpoint: Service endpoint configuration.
+            timeout: Default timeout for requests in seconds.
+            pool_size: Number of channels to spread requests across.
+            catalog_ttl: Seconds to reuse ``list_models`` and ``list_providers``
+                results before refetching them; 0 disables the cache.
+            max_entries: Completions to keep in the built-in store, least
+                recently used evicted first. Ignored when ``store`` is given.
+            deterministic_only: Only cache requests with a temperature of 0,
+                so sampled completions are always generated afresh.
+            store: Mapping to cache completions in instead of the built-in
+                in-memory store, e.g. one shared between clients. It is
+                responsible for its own size bound.
+        """
+        super().__init__(endpoint, timeout, pool_size, catalog_ttl)
+        self._max_entries = max_entries
+        self._deterministic_only = deterministic_only
+        self._store: MutableMapping[bytes, CompletionResponse] = (
+            OrderedDict() if store is None else store
+        )
+
+    def clear_cache(self) -> None:
+        """Drop every cached completion."""
+        self._store.clear()
+
+    def _send_complete(
+        self, params: runtime_pb2.CompletionParams, compression: grpc.Compression | None
+    ) -> CompletionResponse:
+        """Return a cached completion for the params, issuing the RPC on a miss."""
+        if self._deterministic_only and params.temperature:
+            return super()._send_complete(params, compression)
+
+        # The store holds its own copies and hands out fresh ones, so callers
+        # that modify a response cannot change what later hits return.
+        key = params.SerializeToString(deterministic=True)
+        store = self._store
+        cached = store.get(key)
+        if cached is not None:
+            if isinstance(store, OrderedDict):
+                store.move_to_end(key)
+            return cached.model_copy(deep=True)
+
+        response = super()._send_complete(params, compression)
+        store[key] = response.model_copy(deep=True)
+        if isinstance(store, OrderedDict) and len(store) > self._max_entries:
+            store.popitem(last=False)
+        return response
+
+
+class AsyncRuntimeClient(_RuntimeClientBase, AsyncBaseClient):
+    """Asyncio client for the runtime service.
+
+    Mirrors :class:`RuntimeClient` with awaitable methods. Prefer it when
+    issuing many completions at once: they can all be in flight on one event
+    loop, e.g. via ``asyncio.gather``, instead of needing a thread each.
+    """
+
+    def __init__(
+        self,
+        endpoint: ServiceEndpoint,
+        timeout: float = 30.0,
+        pool_size: int = 1,
+        catalog_ttl: float = 300.0,
+    ) -> None:
+        """Initialize the async runtime client; see :class:`RuntimeClient`."""
+        super().__init__(endpoint, timeout, pool_size)
+        self._stubs: Iterator[runtime_pb2_grpc.RuntimeServiceStub] | None = None
+        self._catalog_ttl = catalog_ttl
+        self._catalog: dict[tuple[str, str], tuple[float, list[Any]]] = {}
+
+    @property
+    def stub(self) -> runtime_pb2_grpc.RuntimeServiceStub:
+        """Get the gRPC stub for the next pooled channel."""
+        stubs = self._stubs
+        if stubs is None:
+            if runtime_pb2_grpc is None:
+                raise ImportError("Generated protobuf code not found. Run 'make proto' first.")
+            stubs = self._stubs = self._stub_cycle(runtime_pb2_grpc.RuntimeServiceStub)
+        return next(stubs)
+
+    async def complete(
+        self,
+        messages: list[Message] | None = None,
+        *,
+        model: str = "",
+        system_prompt: str = "",
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        top_p: float = 1.0,
+        stop_sequences: list[str] | None = None,
+        provider: str = "",
+        routing_strategy: RoutingStrategy = RoutingStrategy.UNSPECIFIED,
+        metadata: dict[str, str] | None = None,
+        template: CompletionTemplate | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> CompletionResponse:
+        """Generate a completion; see :meth:`RuntimeClient.complete`."""
+        if template is not None:
+            params = self._templated_params(template, messages)
+        else:
+            params = self._completion_params(
+                messages,
+                model=model,
+                system_prompt=system_prompt,
+                max_tokens=max_tokens,
+                temperature=temperature,
+                top_p=top_p,
+                stop_sequences=stop_sequences,
+                provider=provider,
+                routing_strategy=routing_strategy,
+                metadata=metadata,
             )
-            for p in response.providers
-        ]
+        request = runtime_pb2.CompleteRequest(params=params)
+        response = await self.stub.Complete(request, timeout=self._timeout, compression=compression)
+        return self._to_response(response)
 
-    def _to_response(self, pb: runtime_pb2.CompleteResponse) -> CompletionResponse:
-        """Convert protobuf to model."""
-        return CompletionResponse(
-            id=pb.id,
-            content=pb.content,
-            model=pb.model,
-            provider=pb.provider,
-            usage=Usage(
-                prompt_tokens=pb.usage.prompt_tokens,
-                completion_tokens=pb.usage.completion_tokens,
-                total_tokens=pb.usage.total_tokens,
-            ),
-            latency_ms=pb.latency_ms,
-            finish_reason=pb.finish_reason,
-            metadata=dict(pb.metadata),
+    async def complete_many(
+        self, batch: Iterable[Mapping[str, Any]], *, compression: grpc.Compression | None = None
+    ) -> list[CompletionResponse]:
+        """Generate several completions in one RPC; see :meth:`RuntimeClient.complete_many`."""
+        request = self._batch_request(batch)
+        response = await self.stub.CompleteBatch(
+            request, timeout=self._timeout, compression=compression
         )
+        return list(map(self._to_response, response.responses))
+
+    async def complete_bidi(
+        self,
+        batch: Iterable[Mapping[str, Any]] | AsyncIterable[Mapping[str, Any]],
+        *,
+        timeout: float | None = None,
+        compression: grpc.Compression | None = None,
+    ) -> AsyncIterator[CompletionResponse]:
+        """Generate completions over one bidirectional stream.
+
+        See :meth:`RuntimeClient.complete_bidi`; ``batch`` may also be an
+        async iterable.
+        """
+        if isinstance(batch, AsyncIterable):
+            requests = self._acomplete_requests(batch)
+        else:
+            requests = self._complete_requests(batch)
+        to_response = self._to_response
+        responses = self.stub.CompleteBidi(requests, timeout=timeout, compression=compression)
+        async for response in responses:
+            yield to_response(response)
+
+    async def _acomplete_requests(
+        self, batch: AsyncIterable[Mapping[str, Any]]
+    ) -> AsyncIterator[runtime_pb2.CompleteRequest]:
+        """Build a complete request per entry of an async ``batch``."""
+        completion_params = self._completion_params
+        complete_request = runtime_pb2.CompleteRequest
+        async for kwargs in batch:
+            yield complete_request(params=completion_params(**kwargs))
+
+    async def complete_stream(
+        self,
+        messages: list[Message] | None = None,
+        *,
+        model: str = "",
+        system_prompt: str = "",
+        max_tokens: int = 1024,
+        temperature: float = 0.7,
+        coalesce_ms: float = 0,
+        compression: grpc.Compression | None = None,
+        **kwargs: object,
+    ) -> AsyncIterator[str]:
+        """Generate a streaming completion; see :meth:`RuntimeClient.complete_stream`."""
+        request = self._stream_request(messages, model, system_prompt, max_tokens, temperature)
+        responses = self.stub.CompleteStream(
+            request, timeout=self._timeout, compression=compression
+        )
+        if coalesce_ms > 0:
+            async for chunk in _acoalesced(responses, coalesce_ms / 1000):
+                yield chunk
+            return
+        async for response in responses:
+            delta = response.delta
+            if delta:
+                yield delta
+
+    async def list_models(self, provider: str = "") -> list[Model]:
+        """List available models; cached as in :meth:`RuntimeClient.list_models`."""
+        return self._provider_models(await self.list_providers(), provider)
+
+    async def list_providers(self) -> list[Provider]:
+        """List available providers; cached as in :meth:`RuntimeClient.list_providers`."""
+        key = ("providers", "")
+        providers = self._fresh_catalog(key)
+        if providers is not None:
+            return providers
+        request = runtime_pb2.ListProvidersRequest()
+        try:
+            response = await self.stub.ListProviders(request, timeout=self._timeout)
+        except grpc.RpcError:
+            providers = self._stale_catalog(key)
+            if providers is None:
+                raise
+            return providers
+        return self._store_catalog(key, self._to_providers(response))
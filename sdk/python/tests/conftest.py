@@ -0,0 +1,33 @@
+"""Shared fixtures for the Delos SDK tests."""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterator
+from concurrent import futures
+from typing import Any
+
+import grpc
+import pytest
+
+from delos.config import ServiceEndpoint
+
+
+@pytest.fixture
+def serve() -> Iterator[Callable[[Callable[[Any, grpc.Server], None], Any], ServiceEndpoint]]:
+    """Start an in-process gRPC server for a servicer and return its endpoint.
+
+    Usage: ``endpoint = serve(add_XServicer_to_server, servicer)``.
+    """
+    servers: list[grpc.Server] = []
+
+    def start(add_servicer: Callable[[Any, grpc.Server], None], servicer: Any) -> ServiceEndpoint:
+        server = grpc.server(futures.ThreadPoolExecutor(max_workers=4))
+        add_servicer(servicer, server)
+        port = server.add_insecure_port("127.0.0.1:0")
+        server.start()
+        servers.append(server)
+        return ServiceEndpoint(host="127.0.0.1", port=port)
+
+    yield start
+    for server in servers:
+        server.stop(None)
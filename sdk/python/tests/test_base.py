@@ -0,0 +1,22 @@
+"""Tests for the base service clients."""
+
+from __future__ import annotations
+
+import pytest
+
+from delos.config import ServiceEndpoint
+from delos.services.base import AsyncBaseClient, BaseClient, _PooledClient
+
+
+def test_pooled_client_requires_open_channel():
+    class NoChannel(_PooledClient[object]):
+        pass
+
+    with pytest.raises(TypeError, match="_open_channel"):
+        NoChannel(ServiceEndpoint())
+
+
+def test_base_clients_are_concrete():
+    endpoint = ServiceEndpoint()
+    assert BaseClient(endpoint)._pool_size == 1
+    assert AsyncBaseClient(endpoint, pool_size=3)._pool_size == 3
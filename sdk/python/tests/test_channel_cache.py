@@ -0,0 +1,111 @@
+"""Tests for the shared gRPC channel caches."""
+
+from __future__ import annotations
+
+import asyncio
+
+import grpc
+import pytest
+
+from delos._channel_cache import AsyncChannelCache, ChannelCache, _merge_options
+from delos.config import ServiceEndpoint
+
+ENDPOINT = ServiceEndpoint(host="127.0.0.1", port=1)
+OTHER = ServiceEndpoint(host="127.0.0.1", port=2)
+POOLED = (("delos.pool_index", 1),)
+
+
+def _is_closed(channel: grpc.Channel) -> bool:
+    try:
+        channel.unary_unary("/test.Service/Call")(b"", timeout=0.01)
+    except ValueError:
+        return True
+    except grpc.RpcError:
+        return False
+    raise AssertionError("call to an unreachable endpoint succeeded")
+
+
+def test_acquire_shares_channels_by_endpoint_and_options():
+    cache = ChannelCache()
+    channel = cache.acquire(ENDPOINT)
+
+    assert cache.acquire(ENDPOINT) is channel
+    assert cache.acquire(ServiceEndpoint(host="127.0.0.1", port=1)) is channel
+    assert cache.acquire(ENDPOINT, POOLED) is not channel
+    assert cache.acquire(OTHER) is not channel
+    cache.clear()
+
+
+def test_channel_closes_on_last_release():
+    cache = ChannelCache()
+    channel = cache.acquire(ENDPOINT)
+    cache.acquire(ENDPOINT)
+
+    cache.release(ENDPOINT)
+    assert not _is_closed(channel)
+    cache.release(ENDPOINT)
+    assert _is_closed(channel)
+
+    cache.release(ENDPOINT)  # already released: no-op
+    assert cache.acquire(ENDPOINT) is not channel
+    cache.clear()
+
+
+def test_clear_closes_every_channel():
+    cache = ChannelCache()
+    channels = [cache.acquire(ENDPOINT), cache.acquire(ENDPOINT, POOLED), cache.acquire(OTHER)]
+
+    cache.clear()
+
+    assert all(_is_closed(channel) for channel in channels)
+    assert cache.acquire(ENDPOINT) not in channels
+    cache.clear()
+
+
+def test_endpoint_options_override_defaults():
+    defaults = (("a", 1), ("b", 2))
+    endpoint = ServiceEndpoint(channel_options=(("b", 3), ("c", 4)))
+
+    assert _merge_options(defaults, ServiceEndpoint()) is defaults
+    assert _merge_options(defaults, endpoint) == (("a", 1), ("b", 3), ("c", 4))
+
+
+async def test_async_cache_refcounts_per_loop():
+    cache = AsyncChannelCache()
+    channel = cache.acquire(ENDPOINT)
+    assert cache.acquire(ENDPOINT) is channel
+    assert cache.acquire(ENDPOINT, POOLED) is not channel
+
+    call = channel.unary_unary("/test.Service/Call")
+    await cache.release(ENDPOINT)
+    await cache.release(ENDPOINT, POOLED)
+    with pytest.raises(grpc.aio.AioRpcError):  # still open, endpoint unreachable
+        await call(b"", timeout=0.01)
+    await cache.release(ENDPOINT)
+    with pytest.raises(grpc.aio.UsageError):
+        await call(b"", timeout=0.01)
+
+    await cache.release(ENDPOINT)  # already released: no-op
+    assert not cache._loops
+
+
+def test_async_cache_keeps_loops_apart():
+    cache = AsyncChannelCache()
+
+    async def acquire() -> grpc.aio.Channel:
+        return cache.acquire(ENDPOINT)
+
+    loop_a, loop_b = asyncio.new_event_loop(), asyncio.new_event_loop()
+    try:
+        first = loop_a.run_until_complete(acquire())
+        assert loop_a.run_until_complete(acquire()) is first
+        assert loop_b.run_until_complete(acquire()) is not first
+
+        loop_b.run_until_complete(cache.release(ENDPOINT))
+        assert list(cache._loops) == [loop_a]
+        assert loop_a.run_until_complete(acquire()) is first
+    finally:
+        for loop in (loop_a, loop_b):
+            while loop in cache._loops:
+                loop.run_until_complete(cache.release(ENDPOINT))
+            loop.close()
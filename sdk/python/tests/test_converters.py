@@ -0,0 +1,265 @@
+"""Tests for the descriptor-compiled protobuf converters."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+import pytest
+from google.protobuf import struct_pb2, timestamp_pb2
+
+from delos._gen.datasets.v1 import datasets_pb2
+from delos._gen.deploy.v1 import deploy_pb2
+from delos._gen.eval.v1 import eval_pb2
+from delos.models._base import DelosModel
+from delos.models.common import EMPTY_MAP, SmallMap
+from delos.models.datasets import Dataset, Example, ExampleSource
+from delos.models.deploy import Deployment, DeploymentStatus, DeploymentType
+from delos.models.eval import EvalResult, EvalRun, EvalRunStatus
+from delos.services._converters import build_converter
+from delos.services.datasets import DatasetsClient
+from delos.services.deploy import DeployClient
+from delos.services.eval import EvalClient
+
+WHEN = datetime(2025, 3, 4, 5, 6, 7, 890123, tzinfo=UTC)
+
+
+def _ts(when: datetime) -> timestamp_pb2.Timestamp:
+    ts = timestamp_pb2.Timestamp()
+    ts.FromDatetime(when)
+    return ts
+
+
+def _struct(values: dict) -> struct_pb2.Struct:
+    struct = struct_pb2.Struct()
+    struct.update(values)
+    return struct
+
+
+def test_deployment_round_trip():
+    pb = deploy_pb2.Deployment(
+        id="dep-1",
+        prompt_id="p",
+        from_version=1,
+        to_version=2,
+        environment="production",
+        strategy=deploy_pb2.DeploymentStrategy(
+            type=deploy_pb2.DEPLOYMENT_TYPE_CANARY,
+            initial_percentage=5,
+            increment=10,
+            interval_seconds=60,
+            auto_rollback=True,
+            rollback_threshold=0.5,
+        ),
+        status=deploy_pb2.DEPLOYMENT_STATUS_IN_PROGRESS,
+        status_message="rolling",
+        gate_results=[deploy_pb2.QualityGateResult(gate_id="g", gate_name="G", passed=True)],
+        gates_passed=True,
+        rollout=deploy_pb2.RolloutProgress(
+            current_percentage=15, target_percentage=100, last_increment_at=_ts(WHEN)
+        ),
+        created_at=_ts(WHEN),
+        created_by="me",
+        metadata={"team": "core"},
+    )
+
+    expected = Deployment.model_validate(
+        {
+            "id": "dep-1",
+            "prompt_id": "p",
+            "from_version": 1,
+            "to_version": 2,
+            "environment": "production",
+            "strategy": {
+                "type": DeploymentType.CANARY,
+                "initial_percentage": 5,
+                "increment": 10,
+                "interval_seconds": 60,
+                "auto_rollback": True,
+                "rollback_threshold": 0.5,
+            },
+            "status": DeploymentStatus.IN_PROGRESS,
+            "status_message": "rolling",
+            "gate_results": [{"gate_id": "g", "gate_name": "G", "passed": True}],
+            "gates_passed": True,
+            "rollout": {
+                "current_percentage": 15,
+                "target_percentage": 100,
+                "last_increment_at": WHEN,
+            },
+            "created_at": WHEN,
+            "created_by": "me",
+            "metadata": SmallMap({"team": "core"}),
+        }
+    )
+    assert DeployClient._to_deployment(pb) == expected
+
+
+def test_deployment_unset_fields_take_model_defaults():
+    deployment = DeployClient._to_deployment(deploy_pb2.Deployment(id="dep-1", prompt_id="p"))
+
+    assert deployment == Deployment(id="dep-1", prompt_id="p")
+    assert deployment.strategy is None and deployment.rollout is None
+    assert deployment.created_at is None and deployment.completed_at is None
+    assert deployment.gate_results == () and deployment.metadata is EMPTY_MAP
+    assert deployment.model_fields_set == set(Deployment.model_fields)
+
+
+def test_dataset_and_example_round_trip():
+    dataset = DatasetsClient._to_dataset(
+        datasets_pb2.Dataset(
+            id="ds",
+            name="qa",
+            schema=datasets_pb2.DatasetSchema(
+                input_fields=[datasets_pb2.SchemaField(name="q", type="string", required=True)]
+            ),
+            example_count=3,
+            last_updated=_ts(WHEN),
+            tags=["a", "b"],
+            metadata={"k": "v"},
+            version=4,
+        )
+    )
+    example = DatasetsClient._to_example(
+        datasets_pb2.Example(
+            id="ex",
+            dataset_id="ds",
+            input=_struct({"q": "hi", "n": 2, "nested": {"ok": True}, "list": [1, "x"]}),
+            metadata={"m": "1"},
+            source=datasets_pb2.EXAMPLE_SOURCE_IMPORTED,
+        )
+    )
+
+    assert dataset == Dataset.model_validate(
+        {
+            "id": "ds",
+            "name": "qa",
+            "schema": {"input_fields": [{"name": "q", "type": "string"}]},
+            "example_count": 3,
+            "last_updated": WHEN,
+            "tags": ("a", "b"),
+            "metadata": SmallMap({"k": "v"}),
+            "version": 4,
+        }
+    )
+    assert example == Example(
+        id="ex",
+        dataset_id="ds",
+        input={"q": "hi", "n": 2, "nested": {"ok": True}, "list": [1, "x"]},
+        metadata=SmallMap({"m": "1"}),
+        source=ExampleSource.IMPORTED,
+    )
+    assert example.expected_output == {} and example.created_at is None
+
+
+def test_eval_run_round_trip():
+    pb = eval_pb2.EvalRun(
+        id="run",
+        name="nightly",
+        prompt_version=3,
+        config=eval_pb2.EvalConfig(
+            evaluators=[eval_pb2.EvaluatorConfig(type="exact", params={"case": "no"}, weight=2)],
+            model="m",
+            concurrency=4,
+        ),
+        status=eval_pb2.EVAL_RUN_STATUS_COMPLETED,
+        total_examples=2,
+        completed_examples=2,
+        summary=eval_pb2.EvalSummary(overall_score=0.5, scores_by_evaluator={"exact": 0.5}),
+        started_at=_ts(WHEN),
+        metadata={"k": "v"},
+    )
+
+    assert EvalClient._to_run(pb) == EvalRun.model_validate(
+        {
+            "id": "run",
+            "name": "nightly",
+            "prompt_version": 3,
+            "config": {
+                "evaluators": [{"type": "exact", "params": {"case": "no"}, "weight": 2.0}],
+                "model": "m",
+                "concurrency": 4,
+            },
+            "status": EvalRunStatus.COMPLETED,
+            "total_examples": 2,
+            "completed_examples": 2,
+            "summary": {"overall_score": 0.5, "scores_by_evaluator": {"exact": 0.5}},
+            "started_at": WHEN,
+            "metadata": SmallMap({"k": "v"}),
+        }
+    )
+    unset = EvalClient._to_run(eval_pb2.EvalRun(id="run", name="n"))
+    assert unset == EvalRun(id="run", name="n")
+    assert unset.config is None and unset.summary is None and unset.started_at is None
+
+
+def test_eval_result_round_trip():
+    pb = eval_pb2.EvalResult(
+        id="r",
+        eval_run_id="run",
+        example_id="ex",
+        input=_struct({"q": "hi"}),
+        actual_output=_struct({"a": "hello"}),
+        evaluator_results={
+            "exact": eval_pb2.EvaluatorResult(
+                evaluator_type="exact", score=1.0, passed=True, details={"why": "match"}
+            )
+        },
+        overall_score=1.0,
+        passed=True,
+        latency_ms=12.5,
+        tokens_used=7,
+        cost_usd=0.001,
+    )
+
+    assert EvalClient._to_result(pb) == EvalResult.model_validate(
+        {
+            "id": "r",
+            "eval_run_id": "run",
+            "example_id": "ex",
+            "input": {"q": "hi"},
+            "actual_output": {"a": "hello"},
+            "evaluator_results": {
+                "exact": {
+                    "evaluator_type": "exact",
+                    "score": 1.0,
+                    "passed": True,
+                    "details": {"why": "match"},
+                }
+            },
+            "overall_score": 1.0,
+            "passed": True,
+            "latency_ms": 12.5,
+            "tokens_used": 7,
+            "cost_usd": 0.001,
+        }
+    )
+
+
+def test_converted_containers_are_not_shared():
+    pb = eval_pb2.EvaluatorResult(evaluator_type="exact", details={"why": "match"})
+    first = EvalClient._to_evaluator_result(pb)
+    second = EvalClient._to_evaluator_result(pb)
+
+    first.details["why"] = "changed"
+    assert second.details == {"why": "match"}
+    assert EvalClient._to_evaluator_result.__name__ == "to_evaluatorresult"
+
+
+class _Unknown(DelosModel):
+    not_a_field: int = 0
+
+
+class _Strategy(DelosModel):
+    type: int = 0
+
+
+def test_missing_and_unsupported_fields_raise():
+    with pytest.raises(ValueError, match="has no field for _Unknown.not_a_field"):
+        build_converter(deploy_pb2.RolloutProgress.DESCRIPTOR, _Unknown)
+    with pytest.raises(ValueError, match="enum field .* needs an override"):
+        build_converter(deploy_pb2.DeploymentStrategy.DESCRIPTOR, _Strategy)
+
+    to_strategy = build_converter(
+        deploy_pb2.DeploymentStrategy.DESCRIPTOR, _Strategy, {"type": "int(pb.type) + 100"}
+    )
+    assert to_strategy(deploy_pb2.DeploymentStrategy(type=2)).type == 102
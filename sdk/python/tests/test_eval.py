@@ -0,0 +1,49 @@
+"""Tests for the eval client."""
+
+from __future__ import annotations
+
+from delos._gen.eval.v1 import eval_pb2, eval_pb2_grpc
+from delos.services.eval import AsyncEvalClient, EvalClient
+
+
+class _ResultsStream(eval_pb2_grpc.EvalServiceServicer):
+    """Streams a run's results in batches of two, applying offset and limit."""
+
+    def __init__(self, count: int) -> None:
+        self.results = [
+            eval_pb2.EvalResult(id=f"r{i}", eval_run_id="run", passed=i % 2 == 0)
+            for i in range(count)
+        ]
+        self.requests: list[eval_pb2.GetEvalResultsRequest] = []
+
+    def GetEvalResultsStream(self, request, context):  # noqa: N802
+        self.requests.append(request)
+        results = [r for r in self.results if not (request.failed_only and r.passed)]
+        results = results[request.offset :]
+        if request.limit:
+            results = results[: request.limit]
+        for start in range(0, len(results), 2):
+            yield eval_pb2.GetEvalResultsStreamResponse(results=results[start : start + 2])
+
+
+def test_iter_results_spans_batches(serve):
+    servicer = _ResultsStream(5)
+    endpoint = serve(eval_pb2_grpc.add_EvalServiceServicer_to_server, servicer)
+    with EvalClient(endpoint) as client:
+        every = [r.id for r in client.iter_results("run")]
+        window = [r.id for r in client.iter_results("run", offset=1, limit=3)]
+        failed = [r.id for r in client.iter_results("run", failed_only=True)]
+
+    assert every == ["r0", "r1", "r2", "r3", "r4"]
+    assert window == ["r1", "r2", "r3"]
+    assert failed == ["r1", "r3"]
+    assert (servicer.requests[1].offset, servicer.requests[1].limit) == (1, 3)
+
+
+async def test_async_iter_results_spans_batches(serve):
+    servicer = _ResultsStream(3)
+    endpoint = serve(eval_pb2_grpc.add_EvalServiceServicer_to_server, servicer)
+    async with AsyncEvalClient(endpoint) as client:
+        ids = [r.id async for r in client.iter_results("run")]
+
+    assert ids == ["r0", "r1", "r2"]
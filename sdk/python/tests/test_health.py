@@ -0,0 +1,94 @@
+"""Tests for the hand-encoded health checking client."""
+
+from __future__ import annotations
+
+import grpc
+import pytest
+from google.protobuf import wrappers_pb2
+
+from delos._health import SERVING, deserialize_status, serialize_request
+from delos.client import AsyncDelosClient, DelosClient
+from delos.config import DelosConfig, ServiceEndpoint
+
+# HealthCheckResponse.ServingStatus values
+UNKNOWN, NOT_SERVING = 0, 2
+
+# Int32Value and HealthCheckResponse both hold a varint in field 1.
+SERVING_BYTES = wrappers_pb2.Int32Value(value=SERVING).SerializeToString()
+NOT_SERVING_BYTES = wrappers_pb2.Int32Value(value=NOT_SERVING).SerializeToString()
+
+UNREACHABLE = ServiceEndpoint(host="127.0.0.1", port=1)
+
+
+def test_deserialize_status():
+    assert deserialize_status(SERVING_BYTES) == SERVING
+    assert deserialize_status(NOT_SERVING_BYTES) == NOT_SERVING
+    assert deserialize_status(b"") == UNKNOWN
+
+
+def test_deserialize_status_skips_unknown_fields():
+    unknown = b"".join(
+        [
+            b"\x12\x03abc",  # field 2, length-delimited
+            b"\x19" + bytes(8),  # field 3, 64-bit
+            b"\x25" + bytes(4),  # field 4, 32-bit
+            b"\x28\x96\x01",  # field 5, multi-byte varint
+        ]
+    )
+    assert deserialize_status(unknown + SERVING_BYTES) == SERVING
+    assert deserialize_status(SERVING_BYTES + unknown) == SERVING
+
+    with pytest.raises(ValueError, match="unsupported wire type 3"):
+        deserialize_status(b"\x0b")
+
+
+def test_serialize_request():
+    service = "delos.runtime.v1." + "x" * 200  # length needs a two-byte varint
+
+    assert serialize_request("") == b""
+    assert wrappers_pb2.StringValue.FromString(serialize_request(service)).value == service
+
+
+def _health_server(serve, status: bytes) -> ServiceEndpoint:
+    handler = grpc.method_handlers_generic_handler(
+        "grpc.health.v1.Health",
+        {"Check": grpc.unary_unary_rpc_method_handler(lambda request, context: status)},
+    )
+    return serve(lambda h, server: server.add_generic_rpc_handlers((h,)), handler)
+
+
+def _config(serve) -> DelosConfig:
+    """Serving observe, not serving runtime, every other service unreachable."""
+    return DelosConfig(
+        observe=_health_server(serve, SERVING_BYTES),
+        runtime=_health_server(serve, NOT_SERVING_BYTES),
+        prompt=UNREACHABLE,
+        datasets=UNREACHABLE,
+        eval=UNREACHABLE,
+        deploy=UNREACHABLE,
+        connect_timeout=2.0,
+    )
+
+
+EXPECTED = {
+    "observe": True,
+    "runtime": False,
+    "prompt": False,
+    "datasets": False,
+    "eval": False,
+    "deploy": False,
+}
+
+
+def test_health_check(serve):
+    with DelosClient(_config(serve)) as client:
+        assert client.health_check() == EXPECTED
+        assert client.health_check() == EXPECTED  # reuses the cached channels
+
+
+async def test_async_health_check(serve):
+    config = _config(serve)
+    with DelosClient(config) as client:
+        assert await client.async_health_check() == EXPECTED
+    async with AsyncDelosClient(config) as client:
+        assert await client.health_check() == EXPECTED
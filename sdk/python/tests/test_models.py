@@ -0,0 +1,103 @@
+"""Tests for model helpers."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from delos.models.observe import Span, Trace
+from delos.models.prompt import Prompt, PromptVersion
+
+START = datetime(2025, 1, 1, tzinfo=UTC)
+
+
+def _span(span_id: str, parent: str | None = None) -> Span:
+    return Span(
+        trace_id="t", span_id=span_id, parent_span_id=parent, name=span_id, start_time=START
+    )
+
+
+def test_get_span_follows_replaced_span():
+    trace = Trace(trace_id="t", spans=[_span("a"), _span("c", "a")])
+    assert trace.get_span("a").span_id == "a"
+
+    trace.spans[0] = _span("b")
+
+    assert trace.get_span("a") is None
+    assert trace.get_span("b") is trace.spans[0]
+    assert trace.get_span("c") is trace.spans[1]
+
+
+def test_get_span_sees_reordered_and_appended_spans():
+    trace = Trace(trace_id="t", spans=[_span("a"), _span("b", "a")])
+    assert trace.get_span("b").span_id == "b"
+
+    trace.spans.reverse()
+    trace.spans.append(_span("c", "a"))
+
+    assert trace.get_span("b") is trace.spans[0]
+    assert trace.get_span("a") is trace.spans[1]
+    assert trace.get_span("c") is trace.spans[2]
+
+
+def test_root_span_follows_replaced_span():
+    trace = Trace(trace_id="t", spans=[_span("a"), _span("b", "a")])
+    assert trace.root_span.span_id == "a"
+
+    trace.spans[0] = _span("x", "b")
+    assert trace.root_span is None
+
+    trace.spans[1] = _span("r")
+    assert trace.root_span.span_id == "r"
+
+
+def test_get_version_follows_replaced_version():
+    prompt = Prompt(
+        id="p",
+        name="p",
+        current_version=2,
+        versions=[
+            PromptVersion(version=1, template="one"),
+            PromptVersion(version=2, template="two"),
+        ],
+    )
+    assert prompt.render() == "two"
+
+    prompt.versions[1] = PromptVersion(version=2, template="two, edited")
+    assert prompt.render() == "two, edited"
+
+    prompt.versions.pop(0)
+    prompt.versions.append(PromptVersion(version=3, template="three"))
+    assert prompt.get_version(1) is None
+    assert prompt.get_version(2).template == "two, edited"
+    assert prompt.get_version(3).template == "three"
+
+
+def _prompt(template: str) -> Prompt:
+    return Prompt(id="p", name="p", versions=[PromptVersion(version=1, template=template)])
+
+
+def test_render_keeps_unknown_placeholders():
+    prompt = _prompt("Hi {{name}}, see {{missing}} and {{ spaced }}.")
+    assert prompt.render({"name": "Ada"}) == "Hi Ada, see {{missing}} and {{ spaced }}."
+    assert prompt.render() == prompt.render({}) == "Hi {{name}}, see {{missing}} and {{ spaced }}."
+
+
+def test_render_fills_repeated_placeholders():
+    prompt = _prompt("{{x}} + {{x}} = {{y}}")
+    assert prompt.render({"x": "1", "y": "2"}) == "1 + 1 = 2"
+
+
+def test_render_inserts_values_verbatim():
+    prompt = _prompt("{{a}} then {{b}}")
+    rendered = prompt.render({"a": "{{b}}", "b": "{not {{a}}}"})
+    assert rendered == "{{b}} then {not {{a}}}"
+    assert _prompt("{{{a}}}").render({"a": "x"}) == "{x}"
+
+
+def test_root_span_is_first_parentless_span():
+    trace = Trace(trace_id="t", spans=[_span("c", "r"), _span("r"), _span("other")])
+    assert trace.root_span.span_id == "r"
+
+    trace.spans.insert(0, _span("new"))
+    assert trace.root_span.span_id == "new"
+    assert Trace(trace_id="t", spans=[_span("c", "r")]).root_span is None
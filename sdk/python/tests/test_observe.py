@@ -0,0 +1,119 @@
+"""Tests for the observe client."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+
+import grpc
+import pytest
+
+from delos._gen.observe.v1 import observe_pb2, observe_pb2_grpc
+from delos.models.observe import Span, SpanStatus
+from delos.services.observe import AsyncObserveClient, ObserveClient
+
+START = datetime(2025, 1, 2, 3, 4, 5, 678000, tzinfo=UTC)
+
+
+class _TraceStore(observe_pb2_grpc.ObserveServiceServicer):
+    """Keeps ingested spans and serves them back as traces."""
+
+    def __init__(self) -> None:
+        self.spans: list[observe_pb2.Span] = []
+        self.fail_with: grpc.StatusCode | None = None
+
+    def IngestTraces(self, request, context):  # noqa: N802
+        self.spans.extend(request.spans)
+        return observe_pb2.IngestTracesResponse(accepted_count=len(request.spans))
+
+    def _trace(self, trace_id: str) -> observe_pb2.Trace:
+        spans = [s for s in self.spans if s.trace_id == trace_id]
+        trace = observe_pb2.Trace(trace_id=trace_id, spans=spans, root_service="api")
+        trace.start_time.CopyFrom(spans[0].start_time)
+        trace.duration.FromTimedelta(timedelta(seconds=2))
+        return trace
+
+    def GetTrace(self, request, context):  # noqa: N802
+        if self.fail_with is not None:
+            context.abort(self.fail_with, "failing on purpose")
+        if not any(s.trace_id == request.trace_id for s in self.spans):
+            context.abort(grpc.StatusCode.NOT_FOUND, "trace not found")
+        return observe_pb2.GetTraceResponse(trace=self._trace(request.trace_id))
+
+    def QueryTraces(self, request, context):  # noqa: N802
+        trace_ids = dict.fromkeys(s.trace_id for s in self.spans)
+        return observe_pb2.QueryTracesResponse(traces=[self._trace(t) for t in trace_ids])
+
+
+def _spans() -> list[Span]:
+    return [
+        Span(
+            trace_id="t1",
+            span_id="root",
+            name="handle",
+            start_time=START,
+            end_time=START + timedelta(seconds=2),
+            status=SpanStatus.OK,
+            attributes={"http.method": "GET"},
+            service_name="api",
+        ),
+        Span(
+            trace_id="t1",
+            span_id="child",
+            parent_span_id="root",
+            name="query",
+            start_time=START + timedelta(milliseconds=5),
+            status=SpanStatus.ERROR,
+            service_name="db",
+        ),
+    ]
+
+
+def test_ingest_then_get_trace_round_trips(serve):
+    endpoint = serve(observe_pb2_grpc.add_ObserveServiceServicer_to_server, _TraceStore())
+    with ObserveClient(endpoint) as client:
+        assert client.ingest_spans(_spans()) == 2
+        trace = client.get_trace("t1")
+
+    assert trace is not None
+    assert trace.service_name == "api"
+    assert trace.start_time == START
+    assert trace.end_time == START + timedelta(seconds=2)
+    assert trace.spans == _spans()
+    assert trace.root_span.span_id == "root"
+    assert trace.get_span("child").end_time is None
+
+
+def test_query_traces_converts_every_trace(serve):
+    endpoint = serve(observe_pb2_grpc.add_ObserveServiceServicer_to_server, _TraceStore())
+    with ObserveClient(endpoint) as client:
+        client.ingest_spans(_spans())
+        traces = client.query_traces(service_name="api")
+
+    assert [t.trace_id for t in traces] == ["t1"]
+    assert traces[0].spans == _spans()
+
+
+def test_get_trace_returns_none_only_when_not_found(serve):
+    store = _TraceStore()
+    endpoint = serve(observe_pb2_grpc.add_ObserveServiceServicer_to_server, store)
+    with ObserveClient(endpoint) as client:
+        assert client.get_trace("missing") is None
+
+    store.fail_with = grpc.StatusCode.UNAVAILABLE
+    with ObserveClient(endpoint) as client, pytest.raises(grpc.RpcError) as excinfo:
+        client.get_trace("t1")
+    assert excinfo.value.code() == grpc.StatusCode.UNAVAILABLE
+
+
+async def test_async_get_trace_returns_none_only_when_not_found(serve):
+    store = _TraceStore()
+    endpoint = serve(observe_pb2_grpc.add_ObserveServiceServicer_to_server, store)
+    async with AsyncObserveClient(endpoint) as client:
+        await client.ingest_spans(_spans())
+        assert (await client.get_trace("t1")).spans == _spans()
+        assert await client.get_trace("missing") is None
+
+        store.fail_with = grpc.StatusCode.INTERNAL
+        with pytest.raises(grpc.RpcError) as excinfo:
+            await client.get_trace("t1")
+    assert excinfo.value.code() == grpc.StatusCode.INTERNAL
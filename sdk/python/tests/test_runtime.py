@@ -0,0 +1,399 @@
+"""Tests for the runtime client."""
+
+from __future__ import annotations
+
+import grpc
+import pytest
+
+from delos._gen.runtime.v1 import runtime_pb2, runtime_pb2_grpc
+from delos.models.runtime import CompletionResponse, Message, RoutingStrategy, Usage
+from delos.services.runtime import AsyncRuntimeClient, CachedRuntimeClient, RuntimeClient
+
+HELLO = [Message(role="user", content="hello")]
+
+
+class _EchoRuntime(runtime_pb2_grpc.RuntimeServiceServicer):
+    """Answers every completion with its last message, recording the params."""
+
+    def __init__(self) -> None:
+        self.params: list[runtime_pb2.CompletionParams] = []
+
+    def _answer(self, params: runtime_pb2.CompletionParams) -> runtime_pb2.CompleteResponse:
+        self.params.append(params)
+        n = len(self.params)
+        return runtime_pb2.CompleteResponse(
+            id=str(n),
+            content=params.messages[-1].content,
+            message=runtime_pb2.Message(role="assistant", content=params.messages[-1].content),
+            provider=params.provider or "mock",
+            model=params.model or "mock-model",
+            usage=runtime_pb2.Usage(prompt_tokens=1, completion_tokens=2, total_tokens=3),
+            trace_id=f"trace-{n}",
+        )
+
+    def Complete(self, request, context):  # noqa: N802
+        return self._answer(request.params)
+
+    def CompleteBatch(self, request, context):  # noqa: N802
+        return runtime_pb2.CompleteBatchResponse(
+            responses=[self._answer(p) for p in request.params]
+        )
+
+    def CompleteBidi(self, request_iterator, context):  # noqa: N802
+        for request in request_iterator:
+            if request.params.messages[-1].content == "fail":
+                context.abort(grpc.StatusCode.INVALID_ARGUMENT, "bad request")
+            yield self._answer(request.params)
+
+    def CompleteStream(self, request, context):  # noqa: N802
+        """Stream the last message back a character at a time, then a final message."""
+        content = self._answer(request.params).content
+        for char in content:
+            yield runtime_pb2.CompleteStreamResponse(id="s", delta=char)
+        yield runtime_pb2.CompleteStreamResponse(
+            id="s", done=True, message=runtime_pb2.Message(role="assistant", content=content)
+        )
+
+
+@pytest.fixture
+def echo(serve):
+    servicer = _EchoRuntime()
+    return servicer, serve(runtime_pb2_grpc.add_RuntimeServiceServicer_to_server, servicer)
+
+
+def _batch(*contents: str) -> list[dict]:
+    return [{"messages": [Message(role="user", content=c)], "model": "m"} for c in contents]
+
+
+def test_complete_sends_proto_fields(echo):
+    servicer, endpoint = echo
+    with RuntimeClient(endpoint) as client:
+        response = client.complete(
+            HELLO,
+            model="m",
+            system_prompt="be brief",
+            max_tokens=5,
+            temperature=0.25,
+            top_p=0.5,
+            stop_sequences=["END"],
+            provider="p",
+            routing_strategy=RoutingStrategy.COST,
+            metadata={"k": "v"},
+        )
+
+    (params,) = servicer.params
+    assert [(m.role, m.content) for m in params.messages] == [
+        ("system", "be brief"),
+        ("user", "hello"),
+    ]
+    assert (params.model, params.provider) == ("m", "p")
+    assert (params.max_tokens, params.temperature, params.top_p) == (5, 0.25, 0.5)
+    assert list(params.stop) == ["END"]
+    assert params.routing == runtime_pb2.ROUTING_STRATEGY_COST_OPTIMIZED
+    assert dict(params.metadata) == {"k": "v"}
+    assert response == CompletionResponse(
+        id="1",
+        content="hello",
+        model="m",
+        provider="p",
+        usage=Usage(prompt_tokens=1, completion_tokens=2, total_tokens=3),
+        trace_id="trace-1",
+    )
+
+
+def test_complete_many_and_bidi_keep_order(echo):
+    servicer, endpoint = echo
+    with RuntimeClient(endpoint) as client:
+        many = client.complete_many(_batch("a", "b", "c"))
+        bidi = list(client.complete_bidi(iter(_batch("d", "e"))))
+
+    assert [(r.id, r.content, r.model) for r in many] == [
+        ("1", "a", "m"),
+        ("2", "b", "m"),
+        ("3", "c", "m"),
+    ]
+    assert [(r.id, r.content) for r in bidi] == [("4", "d"), ("5", "e")]
+    assert all(len(p.messages) == 1 and p.routing == 0 for p in servicer.params)
+
+
+async def test_async_complete_many_and_bidi(echo):
+    _, endpoint = echo
+
+    async def batch():
+        for kwargs in _batch("c", "d"):
+            yield kwargs
+
+    async with AsyncRuntimeClient(endpoint) as client:
+        single = await client.complete(HELLO, system_prompt="be brief")
+        many = await client.complete_many(_batch("a", "b"))
+        bidi = [r async for r in client.complete_bidi(batch())]
+
+    assert (single.id, single.content, single.model) == ("1", "hello", "mock-model")
+    assert [r.content for r in many] == ["a", "b"]
+    assert [(r.id, r.content) for r in bidi] == [("4", "c"), ("5", "d")]
+
+
+def test_complete_bidi_yields_in_order_until_failure(echo):
+    servicer, endpoint = echo
+    with RuntimeClient(endpoint) as client:
+        responses = client.complete_bidi(iter(_batch("a", "b", "fail", "d")))
+        assert next(responses).content == "a"
+        assert next(responses).content == "b"
+        with pytest.raises(grpc.RpcError) as exc:
+            next(responses)
+
+    assert exc.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+    assert [p.messages[0].content for p in servicer.params] == ["a", "b"]
+
+
+async def test_async_complete_bidi_raises_on_failure(echo):
+    _, endpoint = echo
+    received = []
+    async with AsyncRuntimeClient(endpoint) as client:
+        with pytest.raises(grpc.RpcError) as exc:
+            async for response in client.complete_bidi(_batch("a", "fail")):
+                received.append(response.content)
+
+    assert exc.value.code() == grpc.StatusCode.INVALID_ARGUMENT
+    assert received == ["a"]
+
+
+def test_template_is_reused_unchanged(echo):
+    servicer, endpoint = echo
+    with RuntimeClient(endpoint) as client:
+        template = client.build_template(
+            model="m", system_prompt="be brief", temperature=0.0, stop_sequences=["END"]
+        )
+        first = client.complete(HELLO, template=template)
+        second = client.complete([Message(role="user", content="again")], template=template)
+        ignored = client.complete(HELLO, model="other", template=template)
+
+    assert [r.content for r in (first, second, ignored)] == ["hello", "again", "hello"]
+    for params in servicer.params:
+        assert params.model == "m"
+        assert (params.temperature, list(params.stop)) == (0.0, ["END"])
+        assert [m.role for m in params.messages] == ["system", "user"]
+    assert servicer.params[0] == servicer.params[2]
+    assert [m.role for m in template._params.messages] == ["system"]
+
+
+async def test_async_complete_with_template(echo):
+    servicer, endpoint = echo
+    async with AsyncRuntimeClient(endpoint) as client:
+        template = client.build_template(model="m", max_tokens=7)
+        responses = [await client.complete(HELLO, template=template) for _ in range(2)]
+
+    assert [r.id for r in responses] == ["1", "2"]
+    assert all((p.model, p.max_tokens, len(p.messages)) == ("m", 7, 1) for p in servicer.params)
+
+
+def test_complete_stream_yields_deltas(echo):
+    _, endpoint = echo
+    with RuntimeClient(endpoint) as client:
+        chunks = list(client.complete_stream(HELLO))
+        coalesced = list(client.complete_stream(HELLO, coalesce_ms=60_000))
+
+    assert chunks == ["h", "e", "l", "l", "o"]
+    assert coalesced == ["hello"]
+
+
+async def test_async_complete_stream_yields_deltas(echo):
+    _, endpoint = echo
+    async with AsyncRuntimeClient(endpoint) as client:
+        chunks = [c async for c in client.complete_stream(HELLO)]
+        coalesced = [c async for c in client.complete_stream(HELLO, coalesce_ms=60_000)]
+
+    assert chunks == ["h", "e", "l", "l", "o"]
+    assert coalesced == ["hello"]
+
+
+def test_complete_stream_builds_params_like_complete(echo):
+    servicer, endpoint = echo
+    with RuntimeClient(endpoint) as client:
+        list(client.complete_stream(HELLO, model="m", system_prompt="be brief", max_tokens=9))
+        client.complete(HELLO, model="m", system_prompt="be brief", max_tokens=9, top_p=0.0)
+
+    streamed, completed = servicer.params
+    assert streamed == completed
+    assert [(m.role, m.content) for m in streamed.messages] == [
+        ("system", "be brief"),
+        ("user", "hello"),
+    ]
+    assert (streamed.max_tokens, streamed.temperature, streamed.top_p) == (9, 0.7, 0.0)
+
+
+async def test_async_complete_stream_builds_params(echo):
+    servicer, endpoint = echo
+    async with AsyncRuntimeClient(endpoint) as client:
+        async for _ in client.complete_stream(HELLO, model="m", temperature=0.0):
+            pass
+
+    (params,) = servicer.params
+    assert (params.model, params.temperature, params.max_tokens) == ("m", 0.0, 1024)
+    assert [m.content for m in params.messages] == ["hello"]
+
+
+def test_cache_answers_identical_requests(echo):
+    servicer, endpoint = echo
+    with CachedRuntimeClient(endpoint) as client:
+        first = client.complete(HELLO, model="m", metadata={"a": "1", "b": "2"})
+        again = client.complete(HELLO, model="m", metadata={"b": "2", "a": "1"})
+        other = client.complete(HELLO, model="other")
+        prompted = client.complete(HELLO, model="m", system_prompt="be brief")
+        stopped = client.complete(HELLO, model="m", stop_sequences=["END"])
+
+    assert first.id == again.id == "1"
+    assert (other.id, prompted.id, stopped.id) == ("2", "3", "4")
+    assert len(servicer.params) == 4
+
+
+def test_cached_responses_are_copies(echo):
+    _, endpoint = echo
+    with CachedRuntimeClient(endpoint) as client:
+        first = client.complete(HELLO)
+        first.content = "changed"
+        first.usage.total_tokens = 99
+        hit = client.complete(HELLO)
+        hit.content = "changed again"
+
+        assert hit.content == "changed again"
+        assert client.complete(HELLO).content == "hello"
+        assert client.complete(HELLO).usage.total_tokens == 3
+
+
+def test_lru_evicts_least_recently_used(echo):
+    servicer, endpoint = echo
+    a = [Message(role="user", content="a")]
+    b = [Message(role="user", content="b")]
+    c = [Message(role="user", content="c")]
+    with CachedRuntimeClient(endpoint, max_entries=2) as client:
+        client.complete(a)
+        client.complete(b)
+        client.complete(a)  # hit; b is now least recently used
+        client.complete(c)  # evicts b
+        assert len(servicer.params) == 3
+
+        assert client.complete(a).id == "1"
+        assert client.complete(c).id == "3"
+        assert len(servicer.params) == 3
+        assert client.complete(b).id == "4"
+
+
+def test_deterministic_only_bypasses_sampled_requests(echo):
+    servicer, endpoint = echo
+    with CachedRuntimeClient(endpoint, deterministic_only=True) as client:
+        assert client.complete(HELLO, temperature=0.7).id == "1"
+        assert client.complete(HELLO, temperature=0.7).id == "2"
+        assert client.complete(HELLO, temperature=0).id == "3"
+        assert client.complete(HELLO, temperature=0).id == "3"
+    assert len(servicer.params) == 3
+
+
+def test_custom_store_and_clear_cache(echo):
+    servicer, endpoint = echo
+    store: dict[bytes, CompletionResponse] = {}
+    with CachedRuntimeClient(endpoint, store=store) as client:
+        client.complete(HELLO)
+        assert len(store) == 1
+        client.clear_cache()
+        assert not store
+        assert client.complete(HELLO).id == "2"
+    assert len(servicer.params) == 2
+
+
+class _Catalog(runtime_pb2_grpc.RuntimeServiceServicer):
+    """Lists two providers, counting calls; fails while ``fail_with`` is set."""
+
+    def __init__(self) -> None:
+        self.calls = 0
+        self.fail_with: grpc.StatusCode | None = None
+
+    def ListProviders(self, request, context):  # noqa: N802
+        self.calls += 1
+        if self.fail_with is not None:
+            context.abort(self.fail_with, "catalog unavailable")
+        return runtime_pb2.ListProvidersResponse(
+            providers=[
+                runtime_pb2.Provider(
+                    name="openai",
+                    models=["gpt-4", "gpt-4o"],
+                    available=True,
+                    cost_per_1k_tokens={"gpt-4": 0.03},
+                ),
+                runtime_pb2.Provider(name="ollama", models=["llama3"], available=False),
+            ]
+        )
+
+
+@pytest.fixture
+def catalog(serve):
+    servicer = _Catalog()
+    return servicer, serve(runtime_pb2_grpc.add_RuntimeServiceServicer_to_server, servicer)
+
+
+def test_list_providers_converts_proto(catalog):
+    _, endpoint = catalog
+    with RuntimeClient(endpoint) as client:
+        openai, ollama = client.list_providers()
+
+    assert (openai.id, openai.name, openai.is_available) == ("openai", "openai", True)
+    assert (ollama.id, ollama.is_available) == ("ollama", False)
+    assert [m.id for m in openai.models] == ["gpt-4", "gpt-4o"]
+    gpt4 = openai.models[0]
+    assert (gpt4.name, gpt4.provider) == ("gpt-4", "openai")
+    assert gpt4.cost_per_input_token == gpt4.cost_per_output_token == pytest.approx(0.00003)
+    assert openai.models[1].cost_per_input_token == 0.0
+
+
+def test_catalog_is_cached_until_invalidated(catalog):
+    servicer, endpoint = catalog
+    with RuntimeClient(endpoint) as client:
+        assert len(client.list_providers()) == 2
+        assert [m.id for m in client.list_models()] == ["gpt-4", "gpt-4o", "llama3"]
+        assert [m.id for m in client.list_models(provider="ollama")] == ["llama3"]
+        assert servicer.calls == 1
+
+        client.invalidate_catalog()
+        client.list_models()
+        assert servicer.calls == 2
+
+
+def test_catalog_ttl_zero_refetches_and_falls_back_when_stale(catalog):
+    servicer, endpoint = catalog
+    with RuntimeClient(endpoint, catalog_ttl=0) as client:
+        client.list_providers()
+        client.list_providers()
+        assert servicer.calls == 2
+
+        servicer.fail_with = grpc.StatusCode.UNAVAILABLE
+        assert [m.id for m in client.list_models(provider="openai")] == ["gpt-4", "gpt-4o"]
+        assert servicer.calls == 3
+
+    with RuntimeClient(endpoint) as fresh, pytest.raises(grpc.RpcError):
+        fresh.list_providers()
+
+
+async def test_async_catalog_is_cached(catalog):
+    servicer, endpoint = catalog
+    async with AsyncRuntimeClient(endpoint) as client:
+        assert [p.name for p in await client.list_providers()] == ["openai", "ollama"]
+        assert [m.id for m in await client.list_models(provider="openai")] == ["gpt-4", "gpt-4o"]
+        assert servicer.calls == 1
+
+        servicer.fail_with = grpc.StatusCode.UNAVAILABLE
+        client.invalidate_catalog()
+        with pytest.raises(grpc.RpcError):
+            await client.list_models()
+
+
+def test_list_models_waits_on_prefetch(catalog):
+    servicer, endpoint = catalog
+    with RuntimeClient(endpoint) as client:
+        client.prefetch_models(provider="openai")
+        client.prefetch_models()  # already pending
+        client.prefetch_providers()
+        assert [m.id for m in client.list_models(provider="openai")] == ["gpt-4", "gpt-4o"]
+        assert len(client.list_providers()) == 2
+
+        client.prefetch_models()  # fresh listing cached
+        assert servicer.calls == 1
@@ -2,6 +2,7 @@ package datasets
 
 import (
 	"context"
+	"io"
 	"log/slog"
 
 	"google.golang.org/grpc"
@@ -143,19 +144,9 @@ func (h *Handler) DeleteDataset(ctx context.Context, req *datasetsv1.DeleteDatas
 func (h *Handler) AddExamples(ctx context.Context, req *datasetsv1.AddExamplesRequest) (*datasetsv1.AddExamplesResponse, error) {
 	h.logger.InfoContext(ctx, "adding examples", "dataset_id", req.DatasetId, "count", len(req.Examples))
 
-	exampleInputs := make([]ExampleInput, len(req.Examples))
-	for i, ex := range req.Examples {
-		exampleInputs[i] = ExampleInput{
-			Input:          structToMap(ex.Input),
-			ExpectedOutput: structToMap(ex.ExpectedOutput),
-			Metadata:       ex.Metadata,
-			Source:         exampleSourceFromProto(ex.Source),
-		}
-	}
-
 	input := AddExamplesInput{
 		DatasetID: req.DatasetId,
-		Examples:  exampleInputs,
+		Examples:  exampleInputsFromProto(req.Examples),
 	}
 
 	examples, err := h.service.AddExamples(ctx, input)
@@ -175,6 +166,67 @@ func (h *Handler) AddExamples(ctx context.Context, req *datasetsv1.AddExamplesRe
 	}, nil
 }
 
+// maxStreamedExamples bounds the examples one AddExamplesStream call may send.
+// They are buffered until the stream ends, so this caps the handler's memory.
+const maxStreamedExamples = 50000
+
+// AddExamplesStream adds examples received as a client stream of batches.
+// Batches are buffered and stored together once the stream ends, so a failure
+// at any point leaves the dataset unchanged, as with AddExamples. A stream
+// carrying more than maxStreamedExamples fails with ResourceExhausted as soon
+// as the limit is crossed.
+func (h *Handler) AddExamplesStream(stream datasetsv1.DatasetsService_AddExamplesStreamServer) error {
+	ctx := stream.Context()
+
+	var datasetID string
+	var inputs []ExampleInput
+	for {
+		req, err := stream.Recv()
+		if err == io.EOF {
+			break
+		}
+		if err != nil {
+			return err
+		}
+
+		if datasetID == "" {
+			datasetID = req.DatasetId
+			if datasetID == "" {
+				return status.Error(codes.InvalidArgument, "dataset_id is required")
+			}
+		}
+		if len(inputs)+len(req.Examples) > maxStreamedExamples {
+			return status.Errorf(codes.ResourceExhausted,
+				"stream exceeds %d examples; split the import across several streams", maxStreamedExamples)
+		}
+		inputs = append(inputs, exampleInputsFromProto(req.Examples)...)
+	}
+	if datasetID == "" {
+		return status.Error(codes.InvalidArgument, "dataset_id is required")
+	}
+
+	examples, err := h.service.AddExamples(ctx, AddExamplesInput{
+		DatasetID: datasetID,
+		Examples:  inputs,
+	})
+	if err != nil {
+		h.logger.ErrorContext(ctx, "failed to add examples", "error", err)
+		return status.Errorf(codes.Internal, "failed to add examples: %v", err)
+	}
+
+	h.logger.InfoContext(ctx, "added streamed examples", "dataset_id", datasetID, "count", len(examples))
+
+	protoExamples := make([]*datasetsv1.Example, len(examples))
+	for i, e := range examples {
+		protoExamples[i] = exampleToProto(e)
+	}
+
+	return stream.SendAndClose(&datasetsv1.AddExamplesStreamResponse{
+		AddedCount: int32(len(protoExamples)),
+		Examples:   protoExamples,
+	})
+}
+
 // GetExamples retrieves examples from a dataset.
 func (h *Handler) GetExamples(ctx context.Context, req *datasetsv1.GetExamplesRequest) (*datasetsv1.GetExamplesResponse, error) {
 	h.logger.InfoContext(ctx, "getting examples", "dataset_id", req.DatasetId)
@@ -338,6 +390,19 @@ func exampleSourceToProto(s ExampleSource) datasetsv1.ExampleSource {
 	}
 }
 
+func exampleInputsFromProto(inputs []*datasetsv1.ExampleInput) []ExampleInput {
+	exampleInputs := make([]ExampleInput, len(inputs))
+	for i, ex := range inputs {
+		exampleInputs[i] = ExampleInput{
+			Input:          structToMap(ex.Input),
+			ExpectedOutput: structToMap(ex.ExpectedOutput),
+			Metadata:       ex.Metadata,
+			Source:         exampleSourceFromProto(ex.Source),
+		}
+	}
+	return exampleInputs
+}
+
 func exampleSourceFromProto(s datasetsv1.ExampleSource) ExampleSource {
 	switch s {
 	case datasetsv1.ExampleSource_EXAMPLE_SOURCE_MANUAL:
@@ -0,0 +1,179 @@
+package datasets
+
+import (
+	"context"
+	"errors"
+	"io"
+	"log/slog"
+	"os"
+	"strconv"
+	"testing"
+
+	"google.golang.org/grpc"
+	"google.golang.org/grpc/codes"
+	"google.golang.org/grpc/status"
+
+	datasetsv1 "github.com/instantcocoa/delos/gen/go/datasets/v1"
+)
+
+// fakeAddExamplesStream replays requests to AddExamplesStream, then returns
+// recvErr (io.EOF when unset), and records the response.
+type fakeAddExamplesStream struct {
+	grpc.ServerStream
+	requests []*datasetsv1.AddExamplesStreamRequest
+	recvErr  error
+	response *datasetsv1.AddExamplesStreamResponse
+}
+
+func (s *fakeAddExamplesStream) Context() context.Context { return context.Background() }
+
+func (s *fakeAddExamplesStream) Recv() (*datasetsv1.AddExamplesStreamRequest, error) {
+	if len(s.requests) == 0 {
+		if s.recvErr != nil {
+			return nil, s.recvErr
+		}
+		return nil, io.EOF
+	}
+	req := s.requests[0]
+	s.requests = s.requests[1:]
+	return req, nil
+}
+
+func (s *fakeAddExamplesStream) SendAndClose(resp *datasetsv1.AddExamplesStreamResponse) error {
+	s.response = resp
+	return nil
+}
+
+func newTestHandler(t *testing.T) (*Handler, *MemoryStore, string) {
+	t.Helper()
+	store := NewMemoryStore()
+	svc := NewDatasetsService(store)
+	logger := slog.New(slog.NewTextHandler(os.Stdout, &slog.HandlerOptions{Level: slog.LevelError}))
+
+	dataset, err := svc.CreateDataset(context.Background(), CreateDatasetInput{Name: "test"})
+	if err != nil {
+		t.Fatalf("failed to create dataset: %v", err)
+	}
+	return NewHandler(logger, svc), store, dataset.ID
+}
+
+func exampleBatch(datasetID string, n int) *datasetsv1.AddExamplesStreamRequest {
+	req := &datasetsv1.AddExamplesStreamRequest{DatasetId: datasetID}
+	for i := 0; i < n; i++ {
+		req.Examples = append(req.Examples, &datasetsv1.ExampleInput{
+			Metadata: map[string]string{"n": strconv.Itoa(i)},
+		})
+	}
+	return req
+}
+
+func storedExamples(t *testing.T, store *MemoryStore, datasetID string) int {
+	t.Helper()
+	_, total, err := store.GetExamples(context.Background(), GetExamplesQuery{DatasetID: datasetID})
+	if err != nil {
+		t.Fatalf("failed to get examples: %v", err)
+	}
+	return total
+}
+
+func TestAddExamplesStream_AddsAllBatches(t *testing.T) {
+	h, store, datasetID := newTestHandler(t)
+	stream := &fakeAddExamplesStream{requests: []*datasetsv1.AddExamplesStreamRequest{
+		exampleBatch(datasetID, 3),
+		exampleBatch("", 2), // later dataset_id values are ignored
+	}}
+
+	if err := h.AddExamplesStream(stream); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+
+	if stream.response.AddedCount != 5 || len(stream.response.Examples) != 5 {
+		t.Errorf("expected 5 added examples, got %d (%d returned)",
+			stream.response.AddedCount, len(stream.response.Examples))
+	}
+	if got := storedExamples(t, store, datasetID); got != 5 {
+		t.Errorf("expected 5 stored examples, got %d", got)
+	}
+}
+
+func TestAddExamplesStream_RecvErrorAddsNothing(t *testing.T) {
+	h, store, datasetID := newTestHandler(t)
+	recvErr := status.Error(codes.Canceled, "client went away")
+	stream := &fakeAddExamplesStream{
+		requests: []*datasetsv1.AddExamplesStreamRequest{exampleBatch(datasetID, 3)},
+		recvErr:  recvErr,
+	}
+
+	err := h.AddExamplesStream(stream)
+	if !errors.Is(err, recvErr) {
+		t.Fatalf("expected receive error, got %v", err)
+	}
+	if stream.response != nil {
+		t.Error("expected no response")
+	}
+	if got := storedExamples(t, store, datasetID); got != 0 {
+		t.Errorf("expected no stored examples after a failed stream, got %d", got)
+	}
+}
+
+func TestAddExamplesStream_UnknownDatasetAddsNothing(t *testing.T) {
+	h, _, _ := newTestHandler(t)
+	stream := &fakeAddExamplesStream{requests: []*datasetsv1.AddExamplesStreamRequest{
+		exampleBatch("missing", 2),
+	}}
+
+	err := h.AddExamplesStream(stream)
+	if status.Code(err) != codes.Internal {
+		t.Fatalf("expected Internal, got %v", err)
+	}
+}
+
+func TestAddExamplesStream_RequiresDatasetID(t *testing.T) {
+	for name, requests := range map[string][]*datasetsv1.AddExamplesStreamRequest{
+		"missing on first message": {exampleBatch("", 1)},
+		"empty stream":             nil,
+	} {
+		t.Run(name, func(t *testing.T) {
+			h, _, _ := newTestHandler(t)
+			err := h.AddExamplesStream(&fakeAddExamplesStream{requests: requests})
+			if status.Code(err) != codes.InvalidArgument {
+				t.Fatalf("expected InvalidArgument, got %v", err)
+			}
+		})
+	}
+}
+
+func TestAddExamplesStream_RejectsStreamsOverLimit(t *testing.T) {
+	h, store, datasetID := newTestHandler(t)
+	stream := &fakeAddExamplesStream{requests: []*datasetsv1.AddExamplesStreamRequest{
+		exampleBatch(datasetID, maxStreamedExamples-1),
+		exampleBatch("", 2),
+		exampleBatch("", 1), // never received
+	}}
+
+	err := h.AddExamplesStream(stream)
+	if status.Code(err) != codes.ResourceExhausted {
+		t.Fatalf("expected ResourceExhausted, got %v", err)
+	}
+	if len(stream.requests) != 1 {
+		t.Errorf("expected the handler to stop reading at the limit, %d requests left", len(stream.requests))
+	}
+	if got := storedExamples(t, store, datasetID); got != 0 {
+		t.Errorf("expected no stored examples, got %d", got)
+	}
+}
+
+func TestAddExamplesStream_AcceptsStreamsAtLimit(t *testing.T) {
+	h, store, datasetID := newTestHandler(t)
+	stream := &fakeAddExamplesStream{requests: []*datasetsv1.AddExamplesStreamRequest{
+		exampleBatch(datasetID, maxStreamedExamples-1),
+		exampleBatch("", 1),
+	}}
+
+	if err := h.AddExamplesStream(stream); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if got := storedExamples(t, store, datasetID); got != maxStreamedExamples {
+		t.Errorf("expected %d stored examples, got %d", maxStreamedExamples, got)
+	}
+}
@@ -148,6 +148,58 @@ func (h *Handler) GetEvalResults(ctx context.Context, req *evalv1.GetEvalResults
 	}, nil
 }
 
+// resultsStreamBatchSize is the number of results sent per GetEvalResultsStream message.
+const resultsStreamBatchSize = 256
+
+// GetEvalResultsStream streams results for an evaluation run in batches.
+//
+// Each batch is read from the store with its own limited query, so at most
+// one batch of results is held in memory however large the run is.
+func (h *Handler) GetEvalResultsStream(req *evalv1.GetEvalResultsRequest, stream evalv1.EvalService_GetEvalResultsStreamServer) error {
+	ctx := stream.Context()
+	h.logger.InfoContext(ctx, "streaming eval results", "eval_run_id", req.EvalRunId)
+
+	offset := int(req.Offset)
+	remaining := int(req.Limit) // 0 streams every result
+	for {
+		if err := ctx.Err(); err != nil {
+			return status.FromContextError(err).Err()
+		}
+
+		size := resultsStreamBatchSize
+		if req.Limit > 0 {
+			size = min(size, remaining)
+		}
+		results, _, err := h.service.GetEvalResults(ctx, GetEvalResultsQuery{
+			EvalRunID:  req.EvalRunId,
+			FailedOnly: req.FailedOnly,
+			Limit:      size,
+			Offset:     offset,
+		})
+		if err != nil {
+			h.logger.ErrorContext(ctx, "failed to get eval results", "error", err)
+			return status.Errorf(codes.Internal, "failed to get eval results: %v", err)
+		}
+		if len(results) == 0 {
+			return nil
+		}
+
+		batch := make([]*evalv1.EvalResult, len(results))
+		for i, r := range results {
+			batch[i] = evalResultToProto(r)
+		}
+		if err := stream.Send(&evalv1.GetEvalResultsStreamResponse{Results: batch}); err != nil {
+			return err
+		}
+
+		offset += len(results)
+		remaining -= len(results)
+		if len(results) < size || (req.Limit > 0 && remaining == 0) {
+			return nil
+		}
+	}
+}
+
 // CompareRuns compares two evaluation runs.
 func (h *Handler) CompareRuns(ctx context.Context, req *evalv1.CompareRunsRequest) (*evalv1.CompareRunsResponse, error) {
 	h.logger.InfoContext(ctx, "comparing runs", "run_a", req.RunIdA, "run_b", req.RunIdB)
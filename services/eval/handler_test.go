@@ -0,0 +1,193 @@
+package eval
+
+import (
+	"context"
+	"fmt"
+	"log/slog"
+	"os"
+	"slices"
+	"testing"
+	"time"
+
+	"google.golang.org/grpc"
+	"google.golang.org/grpc/codes"
+	"google.golang.org/grpc/status"
+
+	evalv1 "github.com/instantcocoa/delos/gen/go/eval/v1"
+)
+
+// recordingStore records the results queries made against a MemoryStore.
+type recordingStore struct {
+	*MemoryStore
+	queries []GetEvalResultsQuery
+}
+
+func (s *recordingStore) GetEvalResults(ctx context.Context, query GetEvalResultsQuery) ([]*EvalResult, int, error) {
+	s.queries = append(s.queries, query)
+	return s.MemoryStore.GetEvalResults(ctx, query)
+}
+
+// fakeResultsStream records the result IDs of each message sent, and cancels
+// its context once cancelAfter messages have been sent (never when 0).
+type fakeResultsStream struct {
+	grpc.ServerStream
+	ctx         context.Context
+	cancel      context.CancelFunc
+	cancelAfter int
+	batches     [][]string
+}
+
+func newFakeResultsStream(cancelAfter int) *fakeResultsStream {
+	ctx, cancel := context.WithCancel(context.Background())
+	return &fakeResultsStream{ctx: ctx, cancel: cancel, cancelAfter: cancelAfter}
+}
+
+func (s *fakeResultsStream) Context() context.Context { return s.ctx }
+
+func (s *fakeResultsStream) Send(resp *evalv1.GetEvalResultsStreamResponse) error {
+	ids := make([]string, len(resp.Results))
+	for i, r := range resp.Results {
+		ids[i] = r.Id
+	}
+	s.batches = append(s.batches, ids)
+	if len(s.batches) == s.cancelAfter {
+		s.cancel()
+	}
+	return nil
+}
+
+func (s *fakeResultsStream) sizes() []int {
+	sizes := make([]int, len(s.batches))
+	for i, b := range s.batches {
+		sizes[i] = len(b)
+	}
+	return sizes
+}
+
+// newTestHandler returns a handler over a run holding n results.
+func newTestHandler(t *testing.T, n int) (*Handler, *recordingStore, string) {
+	t.Helper()
+	ctx := context.Background()
+	store := &recordingStore{MemoryStore: NewMemoryStore()}
+
+	run := &EvalRun{ID: "run-1", Name: "test", Status: EvalRunStatusCompleted, CreatedAt: time.Now()}
+	if err := store.CreateEvalRun(ctx, run); err != nil {
+		t.Fatalf("failed to create eval run: %v", err)
+	}
+	for i := 0; i < n; i++ {
+		result := &EvalResult{ID: fmt.Sprintf("result-%d", i), EvalRunID: run.ID, Passed: i%2 == 0}
+		if err := store.AddEvalResult(ctx, result); err != nil {
+			t.Fatalf("failed to add eval result: %v", err)
+		}
+	}
+
+	logger := slog.New(slog.NewTextHandler(os.Stdout, &slog.HandlerOptions{Level: slog.LevelError}))
+	return NewHandler(logger, NewEvalService(store)), store, run.ID
+}
+
+// ============================================================================
+// GetEvalResultsStream Tests
+// ============================================================================
+
+func TestGetEvalResultsStream_QueriesOneBatchAtATime(t *testing.T) {
+	h, store, runID := newTestHandler(t, 2*resultsStreamBatchSize+1)
+	stream := newFakeResultsStream(0)
+
+	if err := h.GetEvalResultsStream(&evalv1.GetEvalResultsRequest{EvalRunId: runID}, stream); err != nil {
+		t.Fatalf("GetEvalResultsStream failed: %v", err)
+	}
+
+	want := []int{resultsStreamBatchSize, resultsStreamBatchSize, 1}
+	if got := stream.sizes(); !slices.Equal(got, want) {
+		t.Errorf("expected batch sizes %v, got %v", want, got)
+	}
+	for i, q := range store.queries {
+		if q.Limit != resultsStreamBatchSize || q.Offset != i*resultsStreamBatchSize {
+			t.Errorf("query %d: expected limit %d offset %d, got limit %d offset %d",
+				i, resultsStreamBatchSize, i*resultsStreamBatchSize, q.Limit, q.Offset)
+		}
+	}
+	if len(store.queries) != 3 {
+		t.Errorf("expected 3 store queries, got %d", len(store.queries))
+	}
+	if first, last := stream.batches[0][0], stream.batches[2][0]; first != "result-0" || last != "result-512" {
+		t.Errorf("expected results in order, got %s first and %s last", first, last)
+	}
+}
+
+func TestGetEvalResultsStream_ExactMultipleOfBatchSize(t *testing.T) {
+	h, store, runID := newTestHandler(t, resultsStreamBatchSize)
+	stream := newFakeResultsStream(0)
+
+	if err := h.GetEvalResultsStream(&evalv1.GetEvalResultsRequest{EvalRunId: runID}, stream); err != nil {
+		t.Fatalf("GetEvalResultsStream failed: %v", err)
+	}
+
+	if got := stream.sizes(); !slices.Equal(got, []int{resultsStreamBatchSize}) {
+		t.Errorf("expected one full batch, got %v", got)
+	}
+	if len(store.queries) != 2 {
+		t.Errorf("expected 2 store queries, got %d", len(store.queries))
+	}
+}
+
+func TestGetEvalResultsStream_LimitAndOffsetSpanBatches(t *testing.T) {
+	h, store, runID := newTestHandler(t, 2*resultsStreamBatchSize)
+	stream := newFakeResultsStream(0)
+	req := &evalv1.GetEvalResultsRequest{EvalRunId: runID, Offset: 10, Limit: resultsStreamBatchSize + 5}
+
+	if err := h.GetEvalResultsStream(req, stream); err != nil {
+		t.Fatalf("GetEvalResultsStream failed: %v", err)
+	}
+
+	if got := stream.sizes(); !slices.Equal(got, []int{resultsStreamBatchSize, 5}) {
+		t.Errorf("expected batch sizes [%d 5], got %v", resultsStreamBatchSize, got)
+	}
+	if first := stream.batches[0][0]; first != "result-10" {
+		t.Errorf("expected stream to start at result-10, got %s", first)
+	}
+	if last := store.queries[len(store.queries)-1]; last.Limit != 5 || last.Offset != 10+resultsStreamBatchSize {
+		t.Errorf("expected last query limit 5 offset %d, got %+v", 10+resultsStreamBatchSize, last)
+	}
+}
+
+func TestGetEvalResultsStream_FailedOnly(t *testing.T) {
+	h, _, runID := newTestHandler(t, 10)
+	stream := newFakeResultsStream(0)
+	req := &evalv1.GetEvalResultsRequest{EvalRunId: runID, FailedOnly: true}
+
+	if err := h.GetEvalResultsStream(req, stream); err != nil {
+		t.Fatalf("GetEvalResultsStream failed: %v", err)
+	}
+
+	if got := stream.sizes(); !slices.Equal(got, []int{5}) {
+		t.Errorf("expected one batch of 5 failed results, got %v", got)
+	}
+}
+
+func TestGetEvalResultsStream_StopsWhenCancelled(t *testing.T) {
+	h, store, runID := newTestHandler(t, 3*resultsStreamBatchSize)
+	stream := newFakeResultsStream(1)
+
+	err := h.GetEvalResultsStream(&evalv1.GetEvalResultsRequest{EvalRunId: runID}, stream)
+	if status.Code(err) != codes.Canceled {
+		t.Fatalf("expected Canceled, got %v", err)
+	}
+
+	if len(stream.batches) != 1 || len(store.queries) != 1 {
+		t.Errorf("expected 1 batch from 1 query, got %d batches from %d queries",
+			len(stream.batches), len(store.queries))
+	}
+}
+
+func TestGetEvalResultsStream_UnknownRunSendsNothing(t *testing.T) {
+	h, _, _ := newTestHandler(t, 0)
+	stream := newFakeResultsStream(0)
+
+	if err := h.GetEvalResultsStream(&evalv1.GetEvalResultsRequest{EvalRunId: "missing"}, stream); err != nil {
+		t.Fatalf("GetEvalResultsStream failed: %v", err)
+	}
+	if len(stream.batches) != 0 {
+		t.Errorf("expected no batches, got %d", len(stream.batches))
+	}
+}
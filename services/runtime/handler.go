@@ -2,9 +2,13 @@ package runtime
 
 import (
 	"context"
+	"fmt"
+	"io"
 	"log/slog"
+	"sync"
 
 	"google.golang.org/grpc"
+	"google.golang.org/grpc/status"
 
 	runtimev1 "github.com/instantcocoa/delos/gen/go/runtime/v1"
 )
@@ -41,6 +45,135 @@ func (h *Handler) Complete(ctx context.Context, req *runtimev1.CompleteRequest)
 	return completionResultToProto(result), nil
 }
 
+// completeBatchConcurrency bounds how many completions of one CompleteBatch call run at once.
+const completeBatchConcurrency = 16
+
+// CompleteBatch performs several independent completions in one request.
+// Completions run concurrently and responses keep the request order. The first
+// failure cancels the completions still running, stops new ones from starting
+// and fails the whole batch.
+func (h *Handler) CompleteBatch(ctx context.Context, req *runtimev1.CompleteBatchRequest) (*runtimev1.CompleteBatchResponse, error) {
+	ctx, cancel := context.WithCancel(ctx)
+	defer cancel()
+
+	responses := make([]*runtimev1.CompleteResponse, len(req.Params))
+	sem := make(chan struct{}, completeBatchConcurrency)
+	var (
+		wg       sync.WaitGroup
+		failOnce sync.Once
+		failErr  error
+	)
+
+launch:
+	for i, p := range req.Params {
+		select {
+		case sem <- struct{}{}:
+		case <-ctx.Done():
+			break launch
+		}
+		// Both cases may be ready at once; never start work on a dead context.
+		if ctx.Err() != nil {
+			<-sem
+			break
+		}
+		wg.Add(1)
+		go func() {
+			defer func() {
+				<-sem
+				wg.Done()
+			}()
+
+			result, err := h.svc.Complete(ctx, protoToCompletionParams(p))
+			if err != nil {
+				failOnce.Do(func() {
+					failErr = fmt.Errorf("batch item %d: %w", i, err)
+					cancel()
+				})
+				return
+			}
+			responses[i] = completionResultToProto(result)
+		}()
+	}
+	wg.Wait()
+
+	if failErr != nil {
+		return nil, failErr
+	}
+	if err := ctx.Err(); err != nil {
+		// The caller gave up, so some completions may never have started.
+		return nil, status.FromContextError(err).Err()
+	}
+	return &runtimev1.CompleteBatchResponse{Responses: responses}, nil
+}
+
+// completeBidiWindow bounds how many CompleteBidi completions may run ahead of
+// the response currently being sent.
+const completeBidiWindow = 16
+
+// bidiOutcome is the result of one CompleteBidi completion.
+type bidiOutcome struct {
+	resp *runtimev1.CompleteResponse
+	err  error
+}
+
+// CompleteBidi performs a completion for every request received on the stream.
+// Completions run concurrently, up to completeBidiWindow ahead, and responses
+// are sent in request order. The first failure ends the stream.
+func (h *Handler) CompleteBidi(stream runtimev1.RuntimeService_CompleteBidiServer) error {
+	ctx, cancel := context.WithCancel(stream.Context())
+	defer cancel()
+
+	// Each received request queues a channel for its outcome; the loop below
+	// drains them in order, so the queue capacity is the window.
+	pending := make(chan chan bidiOutcome, completeBidiWindow)
+	recvErr := make(chan error, 1)
+
+	go func() {
+		defer close(pending)
+		for {
+			req, err := stream.Recv()
+			if err != nil {
+				if err != io.EOF {
+					recvErr <- err
+				}
+				return
+			}
+
+			done := make(chan bidiOutcome, 1)
+			select {
+			case pending <- done:
+			case <-ctx.Done():
+				return
+			}
+			go func() {
+				result, err := h.svc.Complete(ctx, protoToCompletionParams(req.Params))
+				if err != nil {
+					done <- bidiOutcome{err: err}
+					return
+				}
+				done <- bidiOutcome{resp: completionResultToProto(result)}
+			}()
+		}
+	}()
+
+	for done := range pending {
+		out := <-done
+		if out.err != nil {
+			return out.err
+		}
+		if err := stream.Send(out.resp); err != nil {
+			return err
+		}
+	}
+
+	select {
+	case err := <-recvErr:
+		return err
+	default:
+		return nil
+	}
+}
+
 // CompleteStream performs a streaming completion request.
 func (h *Handler) CompleteStream(req *runtimev1.CompleteStreamRequest, stream runtimev1.RuntimeService_CompleteStreamServer) error {
 	params := protoToCompletionParams(req.Params)
@@ -0,0 +1,305 @@
+package runtime
+
+import (
+	"context"
+	"errors"
+	"io"
+	"strconv"
+	"strings"
+	"sync/atomic"
+	"testing"
+	"time"
+
+	"google.golang.org/grpc"
+	"google.golang.org/grpc/codes"
+	"google.golang.org/grpc/status"
+
+	runtimev1 "github.com/instantcocoa/delos/gen/go/runtime/v1"
+)
+
+// =============================================================================
+// Test Helpers
+// =============================================================================
+
+// funcProvider is a mockProvider whose completions are computed per request.
+// It records how many completions started and the most that ran at once.
+type funcProvider struct {
+	mockProvider
+	complete    func(ctx context.Context, params CompletionParams) (*CompletionResult, error)
+	started     atomic.Int32
+	inFlight    atomic.Int32
+	maxInFlight atomic.Int32
+}
+
+func (p *funcProvider) Complete(ctx context.Context, params CompletionParams) (*CompletionResult, error) {
+	p.started.Add(1)
+	n := p.inFlight.Add(1)
+	defer p.inFlight.Add(-1)
+	for {
+		peak := p.maxInFlight.Load()
+		if n <= peak || p.maxInFlight.CompareAndSwap(peak, n) {
+			break
+		}
+	}
+	return p.complete(ctx, params)
+}
+
+func newFuncProvider(complete func(ctx context.Context, params CompletionParams) (*CompletionResult, error)) *funcProvider {
+	return &funcProvider{
+		mockProvider: mockProvider{name: "func", available: true},
+		complete:     complete,
+	}
+}
+
+// echoAfter completes with the request's model as content after the given delay.
+func echoAfter(delay func(model string) time.Duration) func(context.Context, CompletionParams) (*CompletionResult, error) {
+	return func(ctx context.Context, params CompletionParams) (*CompletionResult, error) {
+		select {
+		case <-time.After(delay(params.Model)):
+		case <-ctx.Done():
+			return nil, ctx.Err()
+		}
+		return &CompletionResult{ID: params.Model, Content: params.Model}, nil
+	}
+}
+
+// reverseDelay makes earlier requests (lower numeric models) finish last.
+func reverseDelay(n int) func(model string) time.Duration {
+	return func(model string) time.Duration {
+		i, _ := strconv.Atoi(model)
+		return time.Duration(n-i) * time.Millisecond
+	}
+}
+
+func newTestHandler(p Provider) *Handler {
+	return NewHandler(newTestService(p), newTestLogger())
+}
+
+func batchRequest(models ...string) *runtimev1.CompleteBatchRequest {
+	req := &runtimev1.CompleteBatchRequest{}
+	for _, m := range models {
+		req.Params = append(req.Params, &runtimev1.CompletionParams{Provider: "func", Model: m})
+	}
+	return req
+}
+
+func numberedModels(n int) []string {
+	models := make([]string, n)
+	for i := range models {
+		models[i] = strconv.Itoa(i)
+	}
+	return models
+}
+
+// =============================================================================
+// CompleteBatch Tests
+// =============================================================================
+
+func TestCompleteBatch_KeepsRequestOrder(t *testing.T) {
+	const n = 20
+	h := newTestHandler(newFuncProvider(echoAfter(reverseDelay(n))))
+
+	resp, err := h.CompleteBatch(context.Background(), batchRequest(numberedModels(n)...))
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if len(resp.Responses) != n {
+		t.Fatalf("expected %d responses, got %d", n, len(resp.Responses))
+	}
+	for i, r := range resp.Responses {
+		if r.Content != strconv.Itoa(i) {
+			t.Errorf("response %d: expected content %q, got %q", i, strconv.Itoa(i), r.Content)
+		}
+	}
+}
+
+func TestCompleteBatch_BoundsConcurrency(t *testing.T) {
+	p := newFuncProvider(echoAfter(func(string) time.Duration { return 5 * time.Millisecond }))
+	h := newTestHandler(p)
+
+	if _, err := h.CompleteBatch(context.Background(), batchRequest(numberedModels(3*completeBatchConcurrency)...)); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if got := p.maxInFlight.Load(); got > completeBatchConcurrency {
+		t.Errorf("expected at most %d concurrent completions, got %d", completeBatchConcurrency, got)
+	}
+	if got := p.maxInFlight.Load(); got < 2 {
+		t.Errorf("expected completions to run concurrently, max in flight was %d", got)
+	}
+}
+
+func TestCompleteBatch_FailureStopsLaunching(t *testing.T) {
+	providerErr := errors.New("provider exploded")
+	p := newFuncProvider(func(ctx context.Context, params CompletionParams) (*CompletionResult, error) {
+		if params.Model == "0" {
+			return nil, providerErr
+		}
+		// Everything else runs until the batch is cancelled.
+		<-ctx.Done()
+		return nil, ctx.Err()
+	})
+	h := newTestHandler(p)
+
+	_, err := h.CompleteBatch(context.Background(), batchRequest(numberedModels(10*completeBatchConcurrency)...))
+	if !errors.Is(err, providerErr) {
+		t.Fatalf("expected provider error, got %v", err)
+	}
+	if !strings.Contains(err.Error(), "batch item 0") {
+		t.Errorf("expected error to name the failed item, got %v", err)
+	}
+	if got := p.started.Load(); got > completeBatchConcurrency {
+		t.Errorf("expected at most %d completions started after the failure, got %d", completeBatchConcurrency, got)
+	}
+}
+
+func TestCompleteBatch_CancelledCallerGetsNoPartialBatch(t *testing.T) {
+	p := newFuncProvider(echoAfter(func(string) time.Duration { return 0 }))
+	h := newTestHandler(p)
+	ctx, cancel := context.WithCancel(context.Background())
+	cancel()
+
+	resp, err := h.CompleteBatch(ctx, batchRequest(numberedModels(5)...))
+	if status.Code(err) != codes.Canceled {
+		t.Fatalf("expected Canceled, got resp=%v err=%v", resp, err)
+	}
+	if got := p.started.Load(); got != 0 {
+		t.Errorf("expected no completions started, got %d", got)
+	}
+}
+
+func TestCompleteBatch_Empty(t *testing.T) {
+	h := newTestHandler(newFuncProvider(echoAfter(func(string) time.Duration { return 0 })))
+
+	resp, err := h.CompleteBatch(context.Background(), batchRequest())
+	if err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if len(resp.Responses) != 0 {
+		t.Errorf("expected no responses, got %d", len(resp.Responses))
+	}
+}
+
+// =============================================================================
+// CompleteBidi Tests
+// =============================================================================
+
+// fakeBidiStream replays requests to CompleteBidi, then returns recvErr
+// (io.EOF when unset), and records the responses sent.
+type fakeBidiStream struct {
+	grpc.ServerStream
+	requests []*runtimev1.CompleteRequest
+	recvErr  error
+	sent     []*runtimev1.CompleteResponse
+}
+
+func (s *fakeBidiStream) Context() context.Context { return context.Background() }
+
+func (s *fakeBidiStream) Recv() (*runtimev1.CompleteRequest, error) {
+	if len(s.requests) == 0 {
+		if s.recvErr != nil {
+			return nil, s.recvErr
+		}
+		return nil, io.EOF
+	}
+	req := s.requests[0]
+	s.requests = s.requests[1:]
+	return req, nil
+}
+
+func (s *fakeBidiStream) Send(resp *runtimev1.CompleteResponse) error {
+	s.sent = append(s.sent, resp)
+	return nil
+}
+
+func bidiStream(models ...string) *fakeBidiStream {
+	s := &fakeBidiStream{}
+	for _, m := range models {
+		s.requests = append(s.requests, &runtimev1.CompleteRequest{
+			Params: &runtimev1.CompletionParams{Provider: "func", Model: m},
+		})
+	}
+	return s
+}
+
+func sentContents(s *fakeBidiStream) []string {
+	contents := make([]string, len(s.sent))
+	for i, r := range s.sent {
+		contents[i] = r.Content
+	}
+	return contents
+}
+
+func TestCompleteBidi_KeepsRequestOrder(t *testing.T) {
+	const n = 20
+	h := newTestHandler(newFuncProvider(echoAfter(reverseDelay(n))))
+	stream := bidiStream(numberedModels(n)...)
+
+	if err := h.CompleteBidi(stream); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if got, want := strings.Join(sentContents(stream), ","), strings.Join(numberedModels(n), ","); got != want {
+		t.Errorf("expected responses %s, got %s", want, got)
+	}
+}
+
+func TestCompleteBidi_BoundsWindow(t *testing.T) {
+	p := newFuncProvider(echoAfter(func(string) time.Duration { return 5 * time.Millisecond }))
+	h := newTestHandler(p)
+
+	if err := h.CompleteBidi(bidiStream(numberedModels(4 * completeBidiWindow)...)); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	// Up to completeBidiWindow completions run ahead of the one being awaited.
+	if got := p.maxInFlight.Load(); got > completeBidiWindow+1 {
+		t.Errorf("expected at most %d concurrent completions, got %d", completeBidiWindow+1, got)
+	}
+	if got := p.maxInFlight.Load(); got < 2 {
+		t.Errorf("expected completions to run concurrently, max in flight was %d", got)
+	}
+}
+
+func TestCompleteBidi_FailureEndsStream(t *testing.T) {
+	providerErr := errors.New("provider exploded")
+	h := newTestHandler(newFuncProvider(func(ctx context.Context, params CompletionParams) (*CompletionResult, error) {
+		if params.Model == "2" {
+			return nil, providerErr
+		}
+		return &CompletionResult{Content: params.Model}, nil
+	}))
+	stream := bidiStream(numberedModels(10)...)
+
+	err := h.CompleteBidi(stream)
+	if !errors.Is(err, providerErr) {
+		t.Fatalf("expected provider error, got %v", err)
+	}
+	if got := strings.Join(sentContents(stream), ","); got != "0,1" {
+		t.Errorf("expected only the responses before the failure, got %s", got)
+	}
+}
+
+func TestCompleteBidi_RecvErrorAfterDrainingResponses(t *testing.T) {
+	recvErr := status.Error(codes.Canceled, "client went away")
+	h := newTestHandler(newFuncProvider(echoAfter(func(string) time.Duration { return 0 })))
+	stream := bidiStream("0", "1", "2")
+	stream.recvErr = recvErr
+
+	err := h.CompleteBidi(stream)
+	if !errors.Is(err, recvErr) {
+		t.Fatalf("expected receive error, got %v", err)
+	}
+	if got := strings.Join(sentContents(stream), ","); got != "0,1,2" {
+		t.Errorf("expected responses for every received request, got %s", got)
+	}
+}
+
+func TestCompleteBidi_EmptyStream(t *testing.T) {
+	h := newTestHandler(newFuncProvider(echoAfter(func(string) time.Duration { return 0 })))
+	stream := bidiStream()
+
+	if err := h.CompleteBidi(stream); err != nil {
+		t.Fatalf("unexpected error: %v", err)
+	}
+	if len(stream.sent) != 0 {
+		t.Errorf("expected no responses, got %d", len(stream.sent))
+	}
+}